@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+분기별 등록인구 원본 일괄 처리 (구/동 구분 + 세부 동 필터링)
+
+원본 폴더의 '서울시_등록인구_YYYY_N분기.csv' 파일들을 프로세스 풀에서 병렬로
+처리하여 2_filtering/서울시_등록인구_분기별/분기=YYYYQN/ 폴더에 저장한다.
+각 분기 결과는 2_filtering_서울시_등록인구.py 의 출력과 같은 형식이다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/2_filtering_서울시_등록인구_분기별.py
+    python code/2_filtering_서울시_등록인구_분기별.py --input-dir 분기원본폴더 --workers 4
+"""
+import argparse
+import os
+import time
+
+from core.paths import FILTERING_DIR, ORIGINAL_DIR
+from core.population import SOURCE_PATTERN, find_quarter_files, process_quarters
+
+DEFAULT_OUTPUT_DIR = os.path.join(FILTERING_DIR, '서울시_등록인구_분기별')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분기별 등록인구 원본 병렬 처리')
+    parser.add_argument('--input-dir', default=ORIGINAL_DIR, help=f'원본 폴더 ({SOURCE_PATTERN})')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='분기별 파티션 출력 폴더')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    input_files = find_quarter_files(args.input_dir)
+    if not input_files:
+        print(f"❌ 원본 파일을 찾을 수 없습니다: {os.path.join(args.input_dir, SOURCE_PATTERN)}")
+        raise SystemExit(1)
+
+    print(f"📂 분기별 원본 {len(input_files)}개 처리 시작...")
+    start = time.time()
+    summaries = process_quarters(input_files, args.output_dir, workers=args.workers)
+    elapsed = time.time() - start
+
+    print(f"\n=== 분기별 처리 결과 ===")
+    for summary in summaries:
+        print(f"{summary['분기']}: 원본 {summary['원본 행 수']:,}행 → 세부 동 {summary['동 행 수']:,}행 "
+              f"({os.path.basename(summary['입력 파일'])})")
+
+    print(f"\n✅ 저장 위치: {args.output_dir} ({elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
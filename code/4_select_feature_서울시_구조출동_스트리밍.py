@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 원본 → selected features 스트리밍 처리
+
+2_filtering_서울시_구조출동.py, 4_select_feature_서울시_구조출동.py 와 같은 결과를
+원본 전체를 메모리에 올리지 않고 한 번의 순회로 만든다. 여러 해의 원본 파일을
+한꺼번에 넘길 수 있다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/4_select_feature_서울시_구조출동_스트리밍.py
+    python code/4_select_feature_서울시_구조출동_스트리밍.py 원본1.csv 원본2.csv --chunksize 500000
+"""
+import argparse
+import glob
+import os
+import time
+
+import pandas as pd
+
+from core.dispatch import CHUNK_SIZE, COLUMN_MAPPING, stream_filter
+from core.paths import MERGE_DIR, SELECT_DIR
+
+DEFAULT_OUTPUT = os.path.join(SELECT_DIR, '서울시_구조출동_selected_features.csv')
+REPORT_FILE = os.path.join(SELECT_DIR, '서울시_구조출동_처리_보고서.txt')
+
+
+def write_report(input_files, output_file, stats, elapsed):
+    with open(REPORT_FILE, 'w', encoding='utf-8') as f:
+        f.write("서울시 구조출동 데이터 필터링 및 Feature Selection 보고서 (스트리밍)\n")
+        f.write("=" * 60 + "\n\n")
+        f.write(f"처리 일시: {pd.Timestamp.now()}\n")
+        f.write(f"처리 시간: {elapsed:.1f}초\n")
+        f.write("입력 파일:\n")
+        for input_file in input_files:
+            f.write(f"- {input_file}\n")
+        f.write(f"출력 파일: {output_file}\n\n")
+        f.write("처리 과정 (한 번의 순회로 적용):\n")
+        f.write("1. ACDNT_CS_NM == '화재' 필터링\n")
+        f.write("2. PRCS_RSLT_SE_NM != '오인신고' 필터링\n")
+        f.write("3. ACDNT_OCRN_PLC_NM != '도로' 필터링\n")
+        f.write("4. 필요한 컬럼만 선택\n\n")
+        f.write("선택된 Features:\n")
+        for raw_col, col in COLUMN_MAPPING.items():
+            f.write(f"- {col} ({raw_col})\n")
+        f.write(f"\n원본 데이터: {stats['원본']:,}개 레코드\n")
+        f.write(f"화재 데이터: {stats['화재']:,}개 레코드\n")
+        f.write(f"최종 데이터: {stats['저장']:,}개 레코드, {len(COLUMN_MAPPING)}개 컬럼\n\n")
+        f.write("필터링 결과:\n")
+        f.write(f"- 제거된 오인신고 건수: {stats['오인신고_제외']:,}\n")
+        f.write(f"- 제거된 도로 관련 건수: {stats['도로_제외']:,}\n\n")
+        f.write("사고 유형별 분포:\n")
+        f.write(pd.Series(stats['사고유형'], dtype='int64').sort_values(ascending=False).to_string())
+        f.write("\n\n결측값 정보:\n")
+        f.write(pd.Series(stats['결측값'], dtype='int64').to_string())
+        f.write("\n\n처리결과별 통계:\n")
+        f.write(pd.Series(stats['처리결과'], dtype='int64').sort_values(ascending=False).to_string())
+        f.write("\n\n구별 통계 (상위 10개):\n")
+        f.write(pd.Series(stats['시군구'], dtype='int64').sort_values(ascending=False).head(10).to_string())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구조출동 원본 스트리밍 필터링')
+    parser.add_argument('inputs', nargs='*',
+                        help='원본 CSV 파일 (기본: 1_merge_column_names/서울시_구조출동_*.csv)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='결과 CSV 파일')
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE, help='한 번에 읽을 행 수')
+    parser.add_argument('--encoding', default='utf-8', help='원본 파일 인코딩')
+    args = parser.parse_args()
+
+    input_files = args.inputs or sorted(glob.glob(os.path.join(MERGE_DIR, '서울시_구조출동_*.csv')))
+    if not input_files:
+        print(f"❌ 원본 파일을 찾을 수 없습니다: {MERGE_DIR}/서울시_구조출동_*.csv")
+        raise SystemExit(1)
+
+    print("🚒 구조출동 원본 스트리밍 처리 시작...")
+    for input_file in input_files:
+        print(f"📂 {input_file}")
+
+    start = time.time()
+    stats = stream_filter(input_files, args.output, chunksize=args.chunksize, encoding=args.encoding)
+    elapsed = time.time() - start
+
+    print(f"\n📊 처리 결과:")
+    print(f"원본 데이터: {stats['원본']:,}건")
+    print(f"화재 데이터: {stats['화재']:,}건")
+    print(f"제거된 오인신고 건수: {stats['오인신고_제외']:,}")
+    print(f"제거된 도로 관련 건수: {stats['도로_제외']:,}")
+    print(f"최종 데이터: {stats['저장']:,}건 ({elapsed:.1f}초)")
+
+    write_report(input_files, args.output, stats, elapsed)
+    print(f"\n✅ 파일 저장 완료: {args.output}")
+    print(f"📄 보고서 생성 완료: {REPORT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,10 @@ import os
 
 # 파일 경로 설정
 input_file = 'dataset/3_pivot/서울시_등록인구_2025_1분기_동별.csv'
-output_file = 'dataset/4_final/서울시_등록인구_2025_1분기_동별_최종.csv'
+output_file = 'dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv'
 
 # 출력 디렉토리 생성
-os.makedirs('dataset/4_final', exist_ok=True)
+os.makedirs('dataset/4_select_feature', exist_ok=True)
 
 try:
     # CSV 파일 읽기
@@ -54,7 +54,7 @@ try:
     print(gu_stats)
     
     # 보고서 생성
-    report_file = 'dataset/4_final/서울시_등록인구_최종_보고서.txt'
+    report_file = 'dataset/4_select_feature/서울시_등록인구_최종_보고서.txt'
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write("서울시 등록인구 2025년 1분기 동별 데이터 최종 처리 보고서\n")
         f.write("=" * 50 + "\n\n")
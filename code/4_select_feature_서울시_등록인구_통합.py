@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+서울시 등록인구 통합 처리 (원본 → 3_pivot, 4_select_feature)
+
+1_merge_columns_등록인구.py, 2_filtering_서울시_등록인구.py, 3_pivot_서울시_등록인구.py,
+4_select_feature_서울시_등록인구.py 네 단계를 원본을 한 번 읽어 컬럼 단위 연산으로
+수행한다. 중간 CSV는 만들지 않고, 피벗 결과와 최종 결과 및 두 단계의 보고서를
+같은 순회에서 모은 통계로 작성한다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/4_select_feature_서울시_등록인구_통합.py
+"""
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from core.paths import repo_path
+from core.population import (AGE_GROUPS, age_bands, load_population, pivot_age_groups,
+                             population_statistics)
+
+# 파일 경로 설정 (저장소 루트 기준)
+input_file = 'dataset/0_original/서울시_등록인구_2025_1분기.csv'
+pivot_file = 'dataset/3_pivot/서울시_등록인구_2025_1분기_동별.csv'
+pivot_report_file = 'dataset/3_pivot/서울시_등록인구_전처리_보고서.txt'
+output_file = 'dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv'
+report_file = 'dataset/4_select_feature/서울시_등록인구_최종_보고서.txt'
+
+
+def write_pivot_report(stats):
+    """
+    피벗 단계 보고서 (3_pivot_서울시_등록인구.py 보고서와 같은 형식)
+    """
+    total_pop = stats['total']
+    korean_pop = stats['korean']
+    foreign_pop = stats['foreign']
+    age_stats = stats['age_statistics']
+
+    with open(repo_path(pivot_report_file), 'w', encoding='utf-8') as file:
+        file.write("="*80 + "\n")
+        file.write("서울시 등록인구 데이터 전처리 보고서\n")
+        file.write("="*80 + "\n")
+        file.write(f"작성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        # 1. 전처리 작업 개요
+        file.write("1. 전처리 작업 개요\n")
+        file.write("-"*50 + "\n")
+        file.write("• 원본 데이터 형태: 각 구/동별로 연령대마다 별도의 행으로 구성\n")
+        file.write("• 변환 후 형태: 각 구/동별로 한 행, 연령대별로 컬럼 분리\n")
+        file.write("• 사용된 데이터: '계' 컬럼 (한국인 + 등록외국인 합계)\n")
+        file.write("• 제외된 데이터: '합계' 연령대 (중복 데이터 방지)\n\n")
+
+        # 2. 데이터 통계
+        file.write("2. 데이터 통계\n")
+        file.write("-"*50 + "\n")
+        file.write(f"• 원본 데이터 행 수: {stats['total_rows']:,}개\n")
+        file.write(f"• 처리된 구/동 수: {stats['districts']:,}개\n")
+        file.write(f"• 연령대 컬럼 수: {len(AGE_GROUPS)}개\n")
+        file.write(f"• 최종 출력 행 수: {stats['districts']:,}개 (헤더 제외)\n\n")
+
+        # 3. 인구 통계 (합계 제외한 실제 데이터)
+        file.write("3. 인구 통계 분석\n")
+        file.write("-"*50 + "\n")
+        file.write(f"• 총 인구: {total_pop:,}명\n")
+        file.write(f"• 한국인: {korean_pop:,}명 ({korean_pop/total_pop*100:.1f}%)\n")
+        file.write(f"• 등록외국인: {foreign_pop:,}명 ({foreign_pop/total_pop*100:.1f}%)\n\n")
+
+        # 4. 연령대별 통계
+        file.write("4. 연령대별 인구 분포\n")
+        file.write("-"*50 + "\n")
+        file.write(f"{'연령대':<10} {'총 인구':<12} {'한국인':<12} {'등록외국인':<12} {'비율(%)':<8}\n")
+        file.write("-"*60 + "\n")
+
+        for age in AGE_GROUPS:
+            if age in age_stats:
+                total = age_stats[age]['total']
+                korean = age_stats[age]['korean']
+                foreign = age_stats[age]['foreign']
+                ratio = (total / total_pop * 100) if total_pop > 0 else 0
+                file.write(f"{age:<10} {total:<12,} {korean:<12,} {foreign:<12,} {ratio:<8.1f}\n")
+
+        file.write("\n")
+
+        # 5. 처리 과정 상세
+        file.write("5. 처리 과정 상세\n")
+        file.write("-"*50 + "\n")
+        file.write("Step 1: 원본 CSV 파일 한 번 읽기\n")
+        file.write("  - 컬럼: 동별, 연령별, 시점, 계, 한국인, 등록외국인\n")
+        file.write("  - 인코딩: UTF-8\n\n")
+
+        file.write("Step 2: 구/동 구분 및 필터링 (컬럼 연산)\n")
+        file.write("  - 구 행 이후의 동 행에 구명 채우기 (forward fill)\n")
+        file.write("  - 서울시 합계, 구계 행 제외\n\n")
+
+        file.write("Step 3: 데이터 피벗 (Pivot) 수행\n")
+        file.write("  - 각 구/동별로 데이터 그룹화\n")
+        file.write("  - 연령대별 행을 컬럼으로 변환\n")
+        file.write("  - '합계' 연령대 제외 (중복 방지)\n")
+        file.write("  - 사용 컬럼: '계' (한국인 + 등록외국인 합계)\n")
+        file.write("  - 결측값 처리: '-' → 0으로 변환\n")
+        file.write("  - 데이터 타입: 정수(int64)\n\n")
+
+        file.write("Step 4: 결과 파일 생성\n")
+        file.write("  - 헤더: 구, 동, 21개 연령대 컬럼\n")
+        file.write("  - 정렬: 구/동명 기준 오름차순\n")
+        file.write("  - 인코딩: UTF-8\n\n")
+
+        # 6. 출력 파일 정보
+        file.write("6. 출력 파일 정보\n")
+        file.write("-"*50 + "\n")
+        file.write(f"• 파일명: {os.path.basename(pivot_file)}\n")
+        file.write(f"• 경로: {pivot_file}\n")
+        file.write(f"• 컬럼 구조:\n")
+        file.write("  - 구: 서울시 자치구명\n")
+        file.write("  - 동: 행정동명\n")
+        for age in AGE_GROUPS:
+            file.write(f"  - {age}: 해당 연령대 총 인구수\n")
+
+        file.write("\n")
+        file.write("="*80 + "\n")
+        file.write("보고서 생성 완료\n")
+        file.write("="*80 + "\n")
+
+
+def write_final_report(pivot, result_df, gu_stats):
+    """
+    최종 단계 보고서 (4_select_feature_서울시_등록인구.py 보고서와 같은 형식)
+    """
+    with open(repo_path(report_file), 'w', encoding='utf-8') as f:
+        f.write("서울시 등록인구 2025년 1분기 동별 데이터 최종 처리 보고서\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"처리 일시: {pd.Timestamp.now()}\n")
+        f.write(f"입력 파일: {input_file}\n")
+        f.write(f"출력 파일: {output_file}\n\n")
+        f.write("처리 내용:\n")
+        f.write("1. 0~14세 = 0~4세 + 5~9세 + 10~14세\n")
+        f.write("2. 65~ = 65~69세부터 100세 이상까지 합계\n")
+        f.write("3. 15~64세 구간은 제외\n\n")
+        f.write(f"원본 데이터: {pivot.shape[0]}개 행정동, {pivot.shape[1]}개 컬럼\n")
+        f.write(f"최종 데이터: {result_df.shape[0]}개 행정동, {result_df.shape[1]}개 컬럼\n\n")
+        f.write("구별 통계:\n")
+        f.write(gu_stats.to_string())
+
+
+def process_population():
+    print(f"입력 파일: {input_file}")
+
+    # 1. 원본 읽기 + 구/동 구분 + 합계/구계 제외
+    df = load_population(repo_path(input_file))
+    stats = population_statistics(df)
+    print(f"✅ 세부 동 데이터: {stats['total_rows']:,}행 ({stats['districts']}개 동)")
+
+    # 2. 연령대 피벗
+    pivot = pivot_age_groups(df)
+    os.makedirs(os.path.dirname(repo_path(pivot_file)), exist_ok=True)
+    pivot.to_csv(repo_path(pivot_file), index=False, encoding='utf-8')
+    write_pivot_report(stats)
+    print(f"✅ 피벗 결과 저장: {pivot_file} {pivot.shape}")
+
+    # 3. 취약연령 구간 합계
+    result_df = age_bands(pivot)
+    os.makedirs(os.path.dirname(repo_path(output_file)), exist_ok=True)
+    result_df.to_csv(repo_path(output_file), index=False, encoding='utf-8-sig')
+    print(f"✅ 최종 결과 저장: {output_file} {result_df.shape}")
+
+    print(f"\n📋 샘플 데이터 (상위 5개):")
+    print(result_df.head())
+
+    # 4. 구별 통계 및 보고서
+    gu_stats = result_df.groupby('구')[['0~14세', '65~']].sum().sort_values('0~14세', ascending=False)
+    print(f"\n🏙️ 구별 통계:")
+    print(gu_stats)
+    write_final_report(pivot, result_df, gu_stats)
+
+    print(f"\n📄 보고서 생성 완료: {pivot_report_file}, {report_file}")
+
+
+if __name__ == "__main__":
+    try:
+        process_population()
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
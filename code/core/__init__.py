@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+소방안전 빅데이터 분석 공용 모듈
+
+각 전처리/히트맵 스크립트가 공통으로 사용하는 경로, 파이프라인 실행 등의
+기능을 모아둔 패키지
+"""
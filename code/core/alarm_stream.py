@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+IoT 화재 자동신고 경보 스트리밍 집계
+
+경보 이벤트(JSON 한 줄에 하나, {"ts": 발생 시각, "lon": 경도, "lat": 위도})를 파일,
+파이프(표준입력), 로컬 TCP 소켓에서 받아 동에 배정하고(core.geocode), 최근 1시간/1일/7일
+창의 동별 경보 건수를 고정 크기 배열로 유지한다. 집계 결과는 구조출동밀도와 같은
+'면적당 건수' 지표로 동 × 지표 저장소(core.indicator_store)에 주기적으로 게시되며,
+저장소의 앞 네 컬럼은 core.scoring.INDICATORS 순서이므로 종합 위험도 점수 계산에
+그대로 넣을 수 있다 (구조출동밀도 자리에 선택한 창의 실시간 밀도가 들어간다).
+
+창은 이벤트 시각 기준이다. 각 창은 창 길이의 1/BUCKETS 폭 시간 칸을 원형 배열
+(칸 × 동, int32)로 두고 칸이 지날 때마다 가장 오래된 칸을 빼므로, 이벤트 수와
+관계없이 메모리는 동 수에 비례하고 창 경계는 칸 폭 단위로 근사된다. 이벤트는 줄
+묶음 단위로 읽어 좌표 배정과 집계를 배열 연산으로 한 번에 처리한다.
+"""
+import asyncio
+import json
+import math
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from core.paths import CACHE_DIR
+
+# 창 이름 → 길이 (초)
+WINDOWS = {'1시간': 3600, '1일': 86400, '7일': 7 * 86400}
+# 창마다 나누는 시간 칸 수 (창 경계 오차 = 창 길이 / BUCKETS)
+BUCKETS = 60
+# 종합 위험도의 구조출동밀도 자리에 넣을 기본 창
+LIVE_WINDOW = '1일'
+
+LIVE_STORE = os.path.join(CACHE_DIR, 'live_indicators.store')
+
+# 한 번에 읽을 바이트 수 (파이프/소켓은 도착한 만큼만 읽음)
+READ_SIZE = 1 << 20
+PUBLISH_INTERVAL = 1.0
+
+
+class SlidingWindow:
+    """
+    이벤트 시각 기준 동별 슬라이딩 창 건수
+
+    ring[칸 % BUCKETS]에 시간 칸별 동 건수를, counts에 창 안 칸들의 합계를 보관한다.
+    """
+
+    def __init__(self, seconds, size, buckets=BUCKETS):
+        self.seconds = seconds
+        self.width = seconds / buckets
+        self.ring = np.zeros((buckets, size), dtype=np.int32)
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.head = None  # 가장 최근 시간 칸 번호
+
+    def advance(self, timestamp):
+        """
+        창 끝을 timestamp가 속한 칸으로 옮기고 창 밖으로 나간 칸을 비움 (시각은 되돌아가지 않음)
+        """
+        bucket = math.floor(timestamp / self.width)
+        if self.head is not None and bucket <= self.head:
+            return
+        buckets = len(self.ring)
+        if self.head is None or bucket - self.head >= buckets:
+            self.ring[:] = 0
+            self.counts[:] = 0
+        else:
+            slots = np.arange(self.head + 1, bucket + 1) % buckets
+            self.counts -= self.ring[slots].sum(axis=0)
+            self.ring[slots] = 0
+        self.head = bucket
+
+    def add(self, timestamps, dongs):
+        """
+        이벤트 (시각, 동 위치) 배열을 더함 (창 끝 기준으로 이미 창 밖인 이벤트는 버림)
+        """
+        if not len(timestamps):
+            return
+        self.advance(float(timestamps.max()))
+        buckets, size = self.ring.shape
+        bucket = np.floor(timestamps / self.width).astype(np.int64)
+        keep = bucket > self.head - buckets
+        dongs = dongs[keep]
+        flat = (bucket[keep] % buckets) * size + dongs
+        self.ring += np.bincount(flat, minlength=buckets * size).reshape(buckets, size).astype(np.int32)
+        self.counts += np.bincount(dongs, minlength=size)
+
+
+def _timestamp(value):
+    # 숫자(유닉스 초) 또는 ISO 8601 문자열
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+class AlarmAggregator:
+    """
+    경보 이벤트 → 동별 슬라이딩 창 건수/밀도
+
+    동 순서는 core.geocode.dong_locator()의 동 경계 순서이며, 동 밖(보정 거리 초과) 좌표와
+    형식이 잘못된 줄은 집계하지 않고 건수만 stats에 남긴다.
+    """
+
+    def __init__(self, windows=WINDOWS, live_window=LIVE_WINDOW):
+        from core.geocode import dong_locator
+        from core.spatial import AREA_CRS
+
+        if live_window not in windows:
+            raise ValueError(f"알 수 없는 창: {live_window} (가능: {', '.join(windows)})")
+        _, dong = dong_locator()
+        self.dong = dong
+        self.area_km2 = dong.geometry.to_crs(AREA_CRS).area.to_numpy() / 1_000_000
+        self.windows = {name: SlidingWindow(seconds, len(dong)) for name, seconds in windows.items()}
+        self.live_window = live_window
+        self.clock = None  # 지금까지 받은 가장 늦은 이벤트 시각
+        self.version = 0   # 집계가 바뀔 때마다 증가 (게시 여부 판단용)
+        self.stats = {'수신': 0, '배정': 0, '동밖': 0, '오류': 0, '지연': 0}
+
+    def add_events(self, timestamps, lon, lat):
+        """
+        이벤트 배열 (시각, 경도, 위도)을 동에 배정하여 모든 창에 더함
+        """
+        from core.geocode import locate_dongs
+
+        timestamps = np.asarray(timestamps, dtype=float)
+        if not len(timestamps):
+            return
+        located, _ = locate_dongs(lon, lat)
+        inside = located >= 0
+        self.stats['수신'] += len(timestamps)
+        self.stats['배정'] += int(inside.sum())
+        self.stats['동밖'] += int(len(inside) - inside.sum())
+
+        # 도착 전에 이미 가장 긴 창을 벗어난 늦은 이벤트 (집계되지 않음)
+        if self.clock is not None:
+            longest = max(window.seconds for window in self.windows.values())
+            self.stats['지연'] += int((timestamps < self.clock - longest).sum())
+        latest = float(timestamps.max())
+        self.clock = latest if self.clock is None else max(self.clock, latest)
+        for window in self.windows.values():
+            window.advance(self.clock)
+            window.add(timestamps[inside], located[inside])
+        self.version += 1
+
+    def add_lines(self, lines):
+        """
+        JSON 줄 목록(bytes 또는 str)을 읽어 add_events()로 집계 (빈 줄은 무시)
+        """
+        timestamps, lon, lat = [], [], []
+        errors = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+                values = _timestamp(event['ts']), float(event['lon']), float(event['lat'])
+            except (ValueError, KeyError, TypeError):
+                errors += 1
+                continue
+            if not all(map(math.isfinite, values)):
+                errors += 1
+                continue
+            timestamps.append(values[0])
+            lon.append(values[1])
+            lat.append(values[2])
+        self.stats['오류'] += errors
+        self.add_events(np.array(timestamps), np.array(lon), np.array(lat))
+
+    def snapshot(self):
+        """
+        창 이름 → {'건수': 동별 건수, '밀도': 동별 면적(km²)당 건수} 반환
+        """
+        return {name: {'건수': window.counts.copy(), '밀도': window.counts / self.area_km2}
+                for name, window in self.windows.items()}
+
+    def publish(self, path=LIVE_STORE):
+        """
+        실시간 지표 저장소 게시
+
+        컬럼: core.scoring.INDICATORS (구조출동밀도 = live_window 창 밀도, 나머지 세 지표는
+        core.indicators.indicator_store()의 값), 그 뒤로 창마다 구조출동건수_<창>, 구조출동밀도_<창>.
+        """
+        from core.indicator_store import write_store
+        from core.indicators import indicator_store
+        from core.scoring import INDICATORS
+
+        store = indicator_store()
+        row = {code: i for i, code in enumerate(store['동코드'].tolist())}
+        rows = np.array([row.get(code, -1) for code in self.dong['동코드'].tolist()], dtype=np.int64)
+        static = np.where((rows >= 0)[:, None], store['matrix'][rows, :len(INDICATORS)], np.nan)
+
+        snapshot = self.snapshot()
+        values = {name: static[:, i] for i, name in enumerate(INDICATORS)}
+        values['구조출동밀도'] = snapshot[self.live_window]['밀도']
+        for name, result in snapshot.items():
+            values[f'구조출동건수_{name}'] = result['건수']
+            values[f'구조출동밀도_{name}'] = result['밀도']
+        labels = {name: self.dong[name].astype(str).to_numpy() for name in ['구명', '동명']}
+        write_store(path, self.dong['동코드'].to_numpy(dtype=np.int64), labels, values,
+                    f'live:{self.live_window}:{self.clock}:{self.stats["배정"]}')
+
+
+def live_indicator_arrays(path=LIVE_STORE):
+    """
+    게시된 실시간 지표 {'구명', '동명', '동코드', 'matrix'(동 × INDICATORS, float32)} 반환
+    (core.indicators.dong_indicator_arrays()와 같은 형태)
+    """
+    from core.indicator_store import open_store
+    from core.scoring import INDICATORS
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"게시된 실시간 지표가 없습니다: {path}")
+    store = open_store(path)
+    return {
+        '구명': store['구명'],
+        '동명': store['동명'],
+        '동코드': store['동코드'],
+        'matrix': store['matrix'][:, :len(INDICATORS)]
+    }
+
+
+def encode_events(timestamps, lon, lat):
+    """
+    이벤트 배열 → JSON 줄 바이트 (add_lines()가 읽는 형식, 줄마다 끝에 줄바꿈)
+    """
+    return ''.join(f'{{"ts": {t:.3f}, "lon": {x}, "lat": {y}}}\n'
+                   for t, x, y in zip(np.asarray(timestamps, dtype=float).tolist(),
+                                      np.asarray(lon, dtype=float).tolist(),
+                                      np.asarray(lat, dtype=float).tolist())).encode('utf-8')
+
+
+def split_lines(pending, chunk):
+    """
+    (완성된 줄 목록, 남은 조각) 반환 - pending은 이전 묶음에서 끝나지 않은 줄
+    """
+    lines = (pending + chunk).split(b'\n')
+    return lines[:-1], lines[-1]
+
+
+def consume_stream(stream, aggregator, output=LIVE_STORE, publish_interval=PUBLISH_INTERVAL):
+    """
+    바이너리 스트림(파일, 파이프)을 끝까지 읽어 집계하고 publish_interval초마다 게시
+
+    파이프는 도착한 만큼만 읽어(read1) 바로 집계하므로 이벤트가 띄엄띄엄 와도 지연되지 않는다.
+    """
+    read = getattr(stream, 'read1', stream.read)
+    pending = b''
+    published = time.monotonic()
+    while True:
+        chunk = read(READ_SIZE)
+        if not chunk:
+            break
+        lines, pending = split_lines(pending, chunk)
+        aggregator.add_lines(lines)
+        if time.monotonic() - published >= publish_interval:
+            aggregator.publish(output)
+            published = time.monotonic()
+    aggregator.add_lines([pending])
+    aggregator.publish(output)
+
+
+async def serve_socket(aggregator, host, port, output=LIVE_STORE, publish_interval=PUBLISH_INTERVAL,
+                       ready=None):
+    """
+    로컬 TCP 소켓으로 여러 센서 연결의 JSON 줄을 받아 집계 (취소될 때까지 실행)
+
+    집계가 바뀐 경우에만 publish_interval초마다 게시하며, ready가 주어지면 서버가 열린 뒤
+    asyncio.Server를 넘겨 호출한다.
+    """
+    async def handle(reader, writer):
+        pending = b''
+        try:
+            while chunk := await reader.read(READ_SIZE):
+                lines, pending = split_lines(pending, chunk)
+                aggregator.add_lines(lines)
+            aggregator.add_lines([pending])
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    if ready is not None:
+        ready(server)
+    published = aggregator.version
+    try:
+        async with server:
+            while True:
+                await asyncio.sleep(publish_interval)
+                if aggregator.version != published:
+                    published = aggregator.version
+                    aggregator.publish(output)
+    finally:
+        if aggregator.version != published:
+            aggregator.publish(output)
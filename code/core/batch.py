@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+지도 일괄 렌더링
+
+히트맵 스크립트 6개를 한 번에 실행한다. 경계(core.boundaries)와 지도에 쓰이는 단계별
+결과 표(core.storage.read_table)를 부모 프로세스에서 한 번만 읽어 두고, 지도 생성과
+HTML 저장은 작업 프로세스 풀로 나누어 실행한다. fork를 지원하는 환경에서는 작업
+프로세스가 부모 메모리의 경계/표를 그대로 물려받으므로 작업마다 다시 읽거나 pickle로
+전달하지 않으며, 전체 시간은 각 지도 시간의 합이 아니라 가장 느린 지도에 가깝다.
+"""
+import contextlib
+import io
+import multiprocessing
+import os
+import runpy
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core.indicators import AREA_FILE, HOUSING_FILE, POPULATION_FILE, RESCUE_FILE, VULNERABLE_FILE
+from core.paths import CODE_DIR, FIGURE_DIR, FILTERING_DIR, REPO_ROOT
+
+FIRE_FILE = os.path.join(FILTERING_DIR, '화재발생+현황_20250710140523_구별데이터.csv')
+
+# (이름, 스크립트, 함수, 작업 디렉토리, 출력 파일) - 오래 걸리는 지도부터 실행
+RENDERERS = [
+    ('종합', '종합_재난위험도_히트맵.py', 'create_comprehensive_disaster_risk_heatmap', REPO_ROOT,
+     'figure/종합_재난위험도_히트맵.html'),
+    ('구조출동', '구조출동_히트맵.py', 'test_coordinate_mapping', CODE_DIR,
+     'figure/구조출동_좌표_히트맵.html'),
+    ('취약연령', '취약연령_히트맵.py', 'create_dong_vulnerable_age_heatmap', REPO_ROOT,
+     'figure/취약연령_히트맵.html'),
+    ('화재인명피해', '화재인명피해_히트맵.py', 'create_fire_casualty_heatmap', CODE_DIR,
+     'figure/화재인명피해_히트맵.html'),
+    ('재난안전취약자', '재난안전취약자_히트맵.py', 'create_vulnerable_population_heatmap', REPO_ROOT,
+     'figure/재난안전취약자_히트맵.html'),
+    ('노후주택', '노후주택_히트맵.py', 'create_aging_housing_density_heatmap', REPO_ROOT,
+     'figure/노후주택_히트맵.html'),
+]
+
+SHARED_TABLES = [POPULATION_FILE, AREA_FILE, VULNERABLE_FILE, HOUSING_FILE, RESCUE_FILE, FIRE_FILE]
+
+
+def preload():
+    """
+    지도들이 공통으로 쓰는 경계와 표를 이 프로세스 메모리에 읽어 둠
+    """
+    from core.boundaries import load_boundaries, load_dong_boundary
+    from core.storage import read_table, share_tables
+
+    share_tables()
+    load_boundaries(zoom=11)
+    load_dong_boundary()
+    for path in SHARED_TABLES:
+        if os.path.exists(path):
+            read_table(path)
+
+
+def render(name):
+    """
+    지도 하나 생성 (작업 프로세스에서 실행). 이름, 성공 여부, 소요 시간, 출력 로그 반환
+
+    스크립트 함수는 예외를 잡아 출력만 하고 False를 반환하므로 반환값과 함께
+    출력 파일이 새로 쓰였는지도 확인한다.
+    """
+    _, script, function, cwd, output = next(r for r in RENDERERS if r[0] == name)
+    started = time.time()
+    log = io.StringIO()
+    os.chdir(cwd)
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            module = runpy.run_path(os.path.join(CODE_DIR, script))
+            success = module[function]() is not False
+        except Exception as e:
+            print(f"❌ 오류 발생: {e}")
+            success = False
+    output_file = os.path.join(REPO_ROOT, *output.split('/'))
+    if not os.path.exists(output_file) or os.path.getmtime(output_file) < started - 1:
+        success = False
+    return {'name': name, 'success': success, 'seconds': time.time() - started,
+            'output': output, 'log': log.getvalue()}
+
+
+def _pool(workers):
+    """
+    fork 가능하면 fork 작업 프로세스 풀 (부모의 경계/표 상속), 아니면 작업 프로세스마다 preload()
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    return ProcessPoolExecutor(max_workers=workers, initializer=preload)
+
+
+def render_all(names=None, workers=None, progress=print):
+    """
+    지도 여러 개를 작업 프로세스 풀로 생성하고 결과 목록 반환 (RENDERERS 순서)
+
+    workers=1이면 작업 프로세스 없이 현재 프로세스에서 차례로 실행한다.
+    """
+    names = names or [r[0] for r in RENDERERS]
+    unknown = [name for name in names if name not in {r[0] for r in RENDERERS}]
+    if unknown:
+        raise ValueError(f"알 수 없는 지도: {', '.join(unknown)} (가능: {', '.join(r[0] for r in RENDERERS)})")
+    names = [r[0] for r in RENDERERS if r[0] in names]
+    workers = min(workers or os.cpu_count() or 1, len(names))
+
+    os.makedirs(FIGURE_DIR, exist_ok=True)
+    start = time.time()
+    preload()
+    progress(f"📂 경계/표 공유 준비 완료 ({time.time() - start:.2f}초)")
+
+    results = {}
+    cwd = os.getcwd()
+    try:
+        if workers == 1:
+            for name in names:
+                results[name] = render(name)
+                progress(_summary(results[name]))
+        else:
+            with _pool(workers) as executor:
+                futures = [executor.submit(render, name) for name in names]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result['name']] = result
+                    progress(_summary(result))
+    finally:
+        os.chdir(cwd)
+    return [results[name] for name in names]
+
+
+def _summary(result):
+    mark = '✅' if result['success'] else '❌'
+    return f"  {mark} {result['name']}: {result['seconds']:.2f}초 → {result['output']}"
@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 단계 및 지도 스크립트 벤치마크
+
+저장소의 code, dataset, individual_analysis 폴더를 작업 폴더에 복사한 뒤 입력
+자료를 배율(variant)에 맞게 키우고, 파이프라인 단계와 지도/분석 스크립트를
+차례로 하위 프로세스로 실행하여 실행 시간, 최대 메모리(RSS), 출력 크기를 잰다.
+결과는 JSON으로 저장하여 버전 간 비교(compare_results)에 사용한다.
+
+배율:
+- dispatch: 구조출동 좌표 행을 N배로 복제 (좌표에 약 100m 잡음 추가)
+- dongs: 등록인구 원본의 동 블록을 N배로 복제 (동명에 '_2', '_3' ... 추가)
+  동 경계는 그대로이므로 경계 기준 지도 스크립트는 426개 동만 표시한다.
+- synthetic: 입력 전체를 core.synthetic 합성 자료(동 경계, 구조출동 원본 포함)로 교체
+"""
+import csv
+import glob
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from core.paths import REPO_ROOT
+from core.pipeline import CWD_CODE, CWD_ROOT, STAGES, order_stages
+from core.synthetic import REAL_DISPATCHES, REAL_DONGS, generate
+
+# 배율 이름 → (구조출동 행 배수, 동 배수)
+VARIANTS = {
+    'real': (1, 1),
+    'dispatch_x10': (10, 1),
+    'dispatch_x100': (100, 1),
+    'dongs_x10': (1, 10),
+}
+
+# 합성 자료 배율 이름 → (동 수, 구조출동 원본 건수)
+SYNTHETIC_VARIANTS = {
+    'synthetic_real': (REAL_DONGS, REAL_DISPATCHES),
+    'synthetic_3500': (3500, 1_000_000),
+    'synthetic_10m': (3500, 10_000_000),
+}
+
+# 좌표 복제 시 잡음 표준편차 (도, 약 100m)
+JITTER_DEGREES = 0.001
+
+DISPATCH_FILES = [
+    # (저장소 루트 기준 경로 패턴, 경도 컬럼, 위도 컬럼)
+    ('dataset/1_merge_column_names/서울시_구조출동_*.csv', 'DAMG_RGN_LOT', 'DAMG_RGN_LAT'),
+    ('dataset/4_select_feature/서울시_구조출동_selected_features.csv', '피해지역_경도', '피해지역_위도'),
+]
+POPULATION_FILE = 'dataset/0_original/서울시_등록인구_2025_1분기.csv'
+
+COPY_DIRS = ['code', 'dataset', 'individual_analysis']
+COPY_IGNORE = shutil.ignore_patterns('.cache', '__pycache__', '*.parquet')
+
+
+def _case(name, kind, script, cwd, outputs, args=(), requires=()):
+    return {'name': name, 'kind': kind, 'script': script, 'cwd': cwd, 'args': list(args),
+            'outputs': outputs, 'requires': list(requires) or None}
+
+
+def build_cases():
+    """
+    벤치마크 대상 목록 (실행 순서)
+
+    파이프라인 단계 → 등록인구 개별 단계 스크립트 → 경계 캐시 생성 →
+    지도 스크립트 → 분석 스크립트 → 조회 명령 순서이다.
+    """
+    cases = []
+    for stage in order_stages(STAGES):
+        # 복사 단계는 뒤 단계 입력을 만들기 위해 실행만 하고 측정 대상에서는 제외
+        kind = 'stage' if stage['script'] is not None else 'copy'
+        cases.append(_case(stage['name'], kind, stage['script'], stage['cwd'],
+                           stage['outputs'], requires=stage['inputs']))
+
+    # 통합 단계 이전의 등록인구 개별 스크립트 (통합 전후 비교용)
+    cases += [
+        _case('1_merge_columns_등록인구', 'stage', '1_merge_columns_등록인구.py', CWD_CODE,
+              ['dataset/1_merge_column_names/서울시_등록인구_2025_1분기.csv']),
+        _case('2_filtering_서울시_등록인구', 'stage', '2_filtering_서울시_등록인구.py', CWD_CODE,
+              ['dataset/2_filtering/서울시_등록인구_2025_1분기_동별.csv']),
+        _case('3_pivot_서울시_등록인구', 'stage', '3_pivot_서울시_등록인구.py', CWD_CODE,
+              ['dataset/3_pivot/서울시_등록인구_2025_1분기_동별.csv']),
+        _case('4_select_feature_서울시_등록인구', 'stage', '4_select_feature_서울시_등록인구.py', CWD_ROOT,
+              ['dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv']),
+        _case('4_select_feature_서울시_구조출동_스트리밍', 'stage',
+              '4_select_feature_서울시_구조출동_스트리밍.py', CWD_ROOT,
+              ['dataset/4_select_feature/서울시_구조출동_selected_features.csv'],
+              requires=['dataset/1_merge_column_names/서울시_구조출동_*.csv']),
+    ]
+
+    cases.append(_case('경계_캐시_생성', 'setup', None, CWD_ROOT, ['dataset/.cache/boundaries']))
+
+    cases += [
+        _case('종합_재난위험도_히트맵', 'renderer', '종합_재난위험도_히트맵.py', CWD_ROOT,
+              ['figure/종합_재난위험도_히트맵.html']),
+        _case('취약연령_히트맵', 'renderer', '취약연령_히트맵.py', CWD_ROOT, ['figure/취약연령_히트맵.html']),
+        _case('노후주택_히트맵', 'renderer', '노후주택_히트맵.py', CWD_ROOT, ['figure/노후주택_히트맵.html']),
+        _case('재난안전취약자_히트맵', 'renderer', '재난안전취약자_히트맵.py', CWD_ROOT,
+              ['figure/재난안전취약자_히트맵.html']),
+        _case('화재인명피해_히트맵', 'renderer', '화재인명피해_히트맵.py', CWD_CODE,
+              ['figure/화재인명피해_히트맵.html']),
+        _case('구조출동_히트맵', 'renderer', '구조출동_히트맵.py', CWD_CODE,
+              ['figure/구조출동_좌표_히트맵.html']),
+        _case('test_지도경계_표시', 'renderer', 'test_지도경계_표시.py', CWD_CODE,
+              ['figure/test_서울시_행정구역_경계.html']),
+        # 위 히트맵 6개를 경계/표를 공유하는 작업 프로세스 풀로 한 번에 생성
+        _case('히트맵_일괄_렌더링', 'renderer', 'run.py', CWD_ROOT,
+              [f'figure/{name}.html' for name in ['종합_재난위험도_히트맵', '취약연령_히트맵', '노후주택_히트맵',
+                                                  '재난안전취약자_히트맵', '화재인명피해_히트맵',
+                                                  '구조출동_좌표_히트맵']],
+              args=['render']),
+    ]
+
+    cases += [
+        _case('종합_재난위험도_민감도분석', 'analysis', '종합_재난위험도_민감도분석.py', CWD_ROOT,
+              ['individual_analysis/종합위험도_가중치_민감도.csv']),
+        _case('화재_위험요인_상관분석', 'analysis', '화재_위험요인_상관분석.py', CWD_ROOT,
+              ['individual_analysis/combined_correlation_matrix.csv',
+               'individual_analysis/area_normalized_correlation_matrix.csv']),
+        _case('구조출동_타일', 'analysis', '구조출동_타일.py', CWD_ROOT,
+              ['figure/tiles/구조출동_밀도']),
+        _case('종합위험도_벡터타일', 'analysis', '종합위험도_벡터타일.py', CWD_ROOT,
+              ['figure/tiles/종합위험도_벡터']),
+    ]
+
+    # 상위 위험 동 조회 (지표 캐시 생성 포함 / 캐시만 읽는 경우)
+    cases += [
+        _case('위험동_상위10', 'query', 'run.py', CWD_ROOT,
+              ['dataset/.cache/indicators', 'dataset/.cache/dong_indicators.store'], args=['top', '--refresh']),
+        _case('위험동_상위10_캐시', 'query', 'run.py', CWD_ROOT, [], args=['top']),
+    ]
+    return cases
+
+
+# 경계 캐시 생성 단계 (지도 스크립트가 처음 경계를 읽을 때 드는 비용을 따로 측정)
+_BOUNDARY_WARMUP = (
+    "from core.boundaries import load_boundaries, load_dong_boundary, load_gu_boundary\n"
+    "load_gu_boundary(); load_dong_boundary(); load_boundaries(zoom=11)\n"
+)
+
+# 대상 스크립트 실행용 시작 코드. Linux의 ru_maxrss는 fork 시점의 부모 메모리(pandas를
+# 불러온 벤치마크 프로세스)까지 포함하므로, 스크립트 프로세스 자신의 최대 RSS(VmHWM)와
+# 그 하위 프로세스(작업 프로세스 풀)의 최대 RSS 중 큰 값을 종료 시 파일로 남긴다.
+_BOOTSTRAP = """
+import atexit, os, resource, runpy, sys
+
+def _report_peak_rss():
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                peak = max(peak, int(line.split()[1]))
+    with open(os.environ['BENCHMARK_RSS_FILE'], 'w') as f:
+        f.write(str(peak))
+
+if os.path.exists('/proc/self/status'):
+    atexit.register(_report_peak_rss)
+script = sys.argv[1]
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(script))
+runpy.run_path(script, run_name='__main__')
+"""
+
+
+def _workspace_path(workspace, relative_path):
+    return os.path.join(workspace, *relative_path.split('/'))
+
+
+def prepare_workspace(workspace):
+    """
+    저장소 입력/코드를 작업 폴더로 복사 (캐시와 Parquet 파일 제외)
+    """
+    if os.path.exists(workspace):
+        shutil.rmtree(workspace)
+    os.makedirs(workspace)
+    for name in COPY_DIRS:
+        source = os.path.join(REPO_ROOT, name)
+        if os.path.exists(source):
+            shutil.copytree(source, os.path.join(workspace, name), ignore=COPY_IGNORE)
+    os.makedirs(os.path.join(workspace, 'figure'), exist_ok=True)
+
+
+def scale_dispatch(path, factor, lon_column, lat_column, seed=0):
+    """
+    구조출동 CSV 행을 factor배로 복제하여 덮어쓰기 (원본 1벌 + 좌표 잡음을 넣은 복제본)
+
+    복제본을 한 벌씩 이어 쓰므로 메모리 사용량은 원본 크기 정도로 유지된다. 행 수를 반환한다.
+    """
+    df = pd.read_csv(path, encoding='utf-8-sig', low_memory=False)
+    if factor <= 1:
+        return len(df)
+
+    rng = np.random.default_rng(seed)
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8-sig', newline='') as out:
+        df.to_csv(out, index=False)
+        lon = pd.to_numeric(df[lon_column], errors='coerce')
+        lat = pd.to_numeric(df[lat_column], errors='coerce')
+        for _ in range(factor - 1):
+            copy = df.copy()
+            copy[lon_column] = lon + rng.normal(0, JITTER_DEGREES, len(df))
+            copy[lat_column] = lat + rng.normal(0, JITTER_DEGREES, len(df))
+            copy.to_csv(out, index=False, header=False)
+    os.replace(temp_file, path)
+    return len(df) * factor
+
+
+def scale_dongs(path, factor):
+    """
+    등록인구 원본의 동 블록을 factor배로 복제하여 덮어쓰기 (각 동 바로 뒤에 '_2', '_3' ... 동 추가)
+
+    원본과 같은 형식(모든 값 따옴표, 마지막 빈 컬럼)으로 저장하고 동 수를 반환한다.
+    """
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.reader(f))
+    header, body = rows[0], rows[1:]
+
+    names = np.array([row[0] for row in body], dtype=object)
+    is_dong = (names != '합계') & ~np.array([name.endswith('구') for name in names])
+    dong_count = len({name for name in names[is_dong]})
+    if factor <= 1:
+        return dong_count
+
+    # 연속된 같은 이름 행을 한 블록으로 보고, 동 블록은 뒤에 복제본을 붙임
+    output = []
+    start = 0
+    for end in range(1, len(body) + 1):
+        if end < len(body) and names[end] == names[start]:
+            continue
+        block = body[start:end]
+        output.extend(block)
+        if is_dong[start]:
+            for copy in range(2, factor + 1):
+                output.extend([[f'{row[0]}_{copy}'] + row[1:] for row in block])
+        start = end
+
+    temp_file = path + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(output)
+    os.replace(temp_file, path)
+    return dong_count * factor
+
+
+def apply_variant(workspace, dispatch_factor, dong_factor, seed=0):
+    """
+    작업 폴더 입력을 배율에 맞게 키우고 입력 규모 요약 반환
+    """
+    sizes = {}
+    for pattern, lon_column, lat_column in DISPATCH_FILES:
+        for path in sorted(glob.glob(_workspace_path(workspace, pattern))):
+            rows = scale_dispatch(path, dispatch_factor, lon_column, lat_column, seed)
+            sizes[os.path.relpath(path, workspace).replace(os.sep, '/')] = rows
+    population = _workspace_path(workspace, POPULATION_FILE)
+    if os.path.exists(population):
+        sizes['population_dongs'] = scale_dongs(population, dong_factor)
+    return sizes
+
+
+def _output_bytes(workspace, outputs):
+    total = 0
+    for output in outputs:
+        path = _workspace_path(workspace, output)
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        elif os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+def _peak_rss_mb(rusage, rss_file):
+    # 시작 코드가 남긴 값(KB)이 있으면 사용, 없으면 wait4 값 (Linux는 KB, macOS는 바이트 단위)
+    if os.path.exists(rss_file):
+        with open(rss_file) as f:
+            return int(f.read()) / 1024
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return rusage.ru_maxrss * scale / (1024 * 1024)
+
+
+def run_case(case, workspace, log_dir):
+    """
+    작업 폴더에서 대상 하나를 실행하고 측정 결과 딕셔너리 반환
+
+    필요한 입력이 없으면 'skipped', 종료 코드가 0이 아니거나 출력 파일이 새로
+    쓰이지 않았으면 'failed'로 기록한다 (기존 스크립트는 예외를 출력만 하고 정상 종료함).
+    """
+    result = {'case': case['name'], 'kind': case['kind'], 'script': case['script']}
+    missing = [path for path in case['requires'] or []
+               if not glob.glob(_workspace_path(workspace, path))]
+    if missing:
+        result.update({'status': 'skipped', 'reason': f"입력 없음: {', '.join(missing)}"})
+        return result
+
+    if case['kind'] == 'copy':
+        destination = _workspace_path(workspace, case['outputs'][0])
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copyfile(_workspace_path(workspace, case['requires'][0]), destination)
+        result['status'] = 'copied'
+        return result
+
+    code_dir = os.path.join(workspace, 'code')
+    cwd = code_dir if case['cwd'] == CWD_CODE else workspace
+    if case['script'] is None:
+        script = os.path.join(log_dir, f"{case['name']}.py")
+        with open(script, 'w', encoding='utf-8') as f:
+            f.write(_BOUNDARY_WARMUP)
+    else:
+        script = os.path.join(code_dir, case['script'])
+    command = [sys.executable, '-c', _BOOTSTRAP, script] + case['args']
+    rss_file = os.path.join(log_dir, f"{case['name']}.rss")
+    if os.path.exists(rss_file):
+        os.remove(rss_file)
+    env = dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONPATH=code_dir, BENCHMARK_RSS_FILE=rss_file)
+
+    log_file = os.path.join(log_dir, f"{case['name']}.log")
+    started = time.time()
+    start = time.perf_counter()
+    with open(log_file, 'w', encoding='utf-8') as log:
+        process = subprocess.Popen(command, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT)
+        # wait4: 이 하위 프로세스만의 CPU 시간
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - start
+
+    stale = [output for output in case['outputs']
+             if not os.path.exists(_workspace_path(workspace, output))
+             or os.path.getmtime(_workspace_path(workspace, output)) < started - 1]
+    if process.returncode != 0:
+        status = 'failed'
+    elif stale:
+        status = 'failed'
+        result['reason'] = f"출력 파일이 생성되지 않았습니다: {', '.join(stale)}"
+    else:
+        status = 'ok'
+
+    result.update({
+        'status': status,
+        'returncode': process.returncode,
+        'wall_s': round(elapsed, 4),
+        'cpu_s': round(rusage.ru_utime + rusage.ru_stime, 4),
+        'peak_rss_mb': round(_peak_rss_mb(rusage, rss_file), 1),
+        'output_bytes': _output_bytes(workspace, case['outputs']),
+        'log': log_file
+    })
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    return {
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__
+    }
+
+
+def run_benchmarks(variants, workspace_root, only=None, keep=False, seed=0, progress=print):
+    """
+    배율별로 작업 폴더를 준비하고 모든 대상을 실행한 결과 딕셔너리 반환
+
+    only가 주어지면 이름에 그 문자열 중 하나가 들어간 대상만 실행한다.
+    (단, 앞 단계 출력이 필요한 대상은 앞 단계가 실행되지 않으면 원본 복사본을 사용한다.)
+    """
+    cases = build_cases()
+    if only:
+        cases = [case for case in cases
+                 if case['kind'] == 'copy' or any(pattern in case['name'] for pattern in only)]
+
+    report = {'created': datetime.now().isoformat(timespec='seconds'),
+              'environment': environment(), 'variants': {}, 'results': []}
+    for variant in variants:
+        workspace = os.path.join(workspace_root, variant)
+        progress(f"\n📂 [{variant}] 작업 폴더 준비 중... ({workspace})")
+        prepare_workspace(workspace)
+        setup_start = time.perf_counter()
+        if variant in SYNTHETIC_VARIANTS:
+            dongs, dispatches = SYNTHETIC_VARIANTS[variant]
+            sizes = generate(os.path.join(workspace, 'dataset'), dongs=dongs, dispatches=dispatches,
+                             seed=seed, progress=lambda message: None)
+            info = {'dongs': dongs, 'dispatches': dispatches}
+        else:
+            dispatch_factor, dong_factor = VARIANTS[variant]
+            sizes = apply_variant(workspace, dispatch_factor, dong_factor, seed)
+            info = {'dispatch_factor': dispatch_factor, 'dong_factor': dong_factor}
+        report['variants'][variant] = dict(info, inputs=sizes,
+                                           setup_s=round(time.perf_counter() - setup_start, 2))
+
+        log_dir = os.path.join(workspace, 'benchmark_logs')
+        os.makedirs(log_dir, exist_ok=True)
+        for case in cases:
+            result = run_case(case, workspace, log_dir)
+            result['variant'] = variant
+            if result['status'] == 'copied':
+                continue
+            report['results'].append(result)
+            progress(format_result(result))
+
+        if not keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+            for result in report['results']:
+                if result['variant'] == variant:
+                    result.pop('log', None)
+    return report
+
+
+def format_result(result):
+    if result['status'] == 'skipped':
+        return f"  ⏭️  {result['case']}: 건너뜀 ({result['reason']})"
+    mark = '✅' if result['status'] == 'ok' else '❌'
+    return (f"  {mark} {result['case']}: {result['wall_s']:.2f}초, "
+            f"최대 메모리 {result['peak_rss_mb']:,.0f}MB, 출력 {result['output_bytes'] / 1024:,.0f}KB")
+
+
+def save_results(report, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=0.2, min_seconds=0.1):
+    """
+    두 결과의 (배율, 대상)별 실행 시간/메모리 비교
+
+    실행 시간이 threshold 비율 이상 늘고 그 차이가 min_seconds 이상이거나, 최대 메모리가
+    threshold 비율 이상 늘었거나, 성공하던 대상이 실패하면 regression=True로 표시한다.
+    """
+    previous = {(r['variant'], r['case']): r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        before = previous.get((result['variant'], result['case']))
+        if before is None or result['status'] == 'skipped' or before['status'] == 'skipped':
+            continue
+        row = {'variant': result['variant'], 'case': result['case'],
+               'status': (before['status'], result['status'])}
+        regression = before['status'] == 'ok' and result['status'] != 'ok'
+        for key in ('wall_s', 'peak_rss_mb'):
+            old, new = before.get(key), result.get(key)
+            ratio = (new / old - 1) if old else 0.0
+            row[key] = (old, new, ratio)
+            if ratio > threshold and (key != 'wall_s' or new - old >= min_seconds):
+                regression = True
+        row['regression'] = regression
+        rows.append(row)
+    return rows
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+서울시 구/동 경계 데이터 저장소
+
+shapefile 읽기(cp949), WGS84(EPSG:4326) 좌표 변환, ADM_CD 기반 정수 구코드/동코드와
+구명/동명 컬럼 추가를 한 번만 수행하고 결과를 GeoParquet 캐시로 저장한다.
+캐시는 원본 shapefile 구성 파일들의 내용 해시로 구분되므로 경계 파일이 바뀌면
+자동으로 다시 만들어진다.
+
+한 프로세스 안에서 같은 경계를 다시 요청하면 원본 파일 상태가 같은 한 메모리에 있는
+결과의 복사본을 돌려준다. 일괄 렌더링(core.batch)은 작업 프로세스를 만들기 전에 경계를
+한 번 읽어 두어, fork된 작업 프로세스가 경계를 다시 읽거나 전달받지 않고 그대로 사용한다.
+
+지도 HTML에 넣을 경계는 정밀도 단계(tier)별로 단순화된 버전을 함께 캐시한다.
+단순화는 원본 좌표계(EPSG:5186, 미터)에서 인접 경계를 공유하는 coverage 단순화로
+수행하므로 동 사이에 틈이나 겹침이 생기지 않는다. 렌더러는 지도 확대 수준(zoom)
+또는 GeoJSON 크기 상한으로 단계를 고른다.
+"""
+import hashlib
+import json
+import math
+import os
+
+import geopandas as gpd
+import shapely
+
+from core.paths import BOUNDARY_DIR, CACHE_DIR
+
+GU_SHP = os.path.join(BOUNDARY_DIR, '서울시_구경계.shp')
+DONG_SHP = os.path.join(BOUNDARY_DIR, '서울시_동경계.shp')
+
+BOUNDARY_CACHE_DIR = os.path.join(CACHE_DIR, 'boundaries')
+
+TARGET_CRS = 'EPSG:4326'
+
+# 정밀도 단계별 단순화 허용 오차 (미터, 원본 EPSG:5186 기준)
+GEOMETRY_TIERS = {
+    'full': 0.0,
+    'fine': 2.0,
+    'medium': 8.0,
+    'coarse': 30.0
+}
+
+# 단순화 단계의 WGS84 좌표 격자 (약 0.1m, 모든 허용 오차보다 충분히 작음)
+SIMPLIFIED_GRID = 1e-6
+
+# 서울 중심 위도에서 zoom 0 기준 픽셀당 미터 (Web Mercator)
+_METERS_PER_PIXEL_Z0 = 156543.03392 * math.cos(math.radians(37.55))
+
+# ADM_CD 앞 5자리(구코드) → 구명
+GU_CODE_MAPPING = {
+    '11010': '종로구', '11020': '중구', '11030': '용산구', '11040': '성동구',
+    '11050': '광진구', '11060': '동대문구', '11070': '중랑구', '11080': '성북구',
+    '11090': '강북구', '11100': '도봉구', '11110': '노원구', '11120': '은평구',
+    '11130': '서대문구', '11140': '마포구', '11150': '양천구', '11160': '강서구',
+    '11170': '구로구', '11180': '금천구', '11190': '영등포구', '11200': '동작구',
+    '11210': '관악구', '11220': '서초구', '11230': '강남구', '11240': '송파구',
+    '11250': '강동구'
+}
+
+# 구명 → 정수 구코드
+GU_CODES = {name: int(code) for code, name in GU_CODE_MAPPING.items()}
+
+# 캐시 컬럼 구성 버전 (주석 컬럼이 바뀌면 올려서 기존 캐시를 다시 만듦)
+CACHE_SCHEMA = 2
+
+_SHAPEFILE_PARTS = ['.shp', '.shx', '.dbf', '.prj', '.cpg']
+
+# 이 프로세스에서 읽은 경계: (shapefile, 단계) → (원본 파일 상태, GeoDataFrame)
+_loaded = {}
+
+
+def shapefile_key(shp_path):
+    """
+    shapefile 구성 파일(.shp/.shx/.dbf/.prj/.cpg) 내용의 SHA-256
+    """
+    digest = hashlib.sha256()
+    base = os.path.splitext(shp_path)[0]
+    for ext in _SHAPEFILE_PARTS:
+        part = base + ext
+        if not os.path.exists(part):
+            continue
+        digest.update(ext.encode())
+        with open(part, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_stat(shp_path):
+    """
+    shapefile 구성 파일들의 (크기, 수정시각) 목록 (메모리 재사용 여부 판단용)
+    """
+    base = os.path.splitext(shp_path)[0]
+    stat = []
+    for ext in _SHAPEFILE_PARTS:
+        if os.path.exists(base + ext):
+            info = os.stat(base + ext)
+            stat.append((ext, info.st_size, info.st_mtime_ns))
+    return tuple(stat)
+
+
+def _annotate_gu(gdf):
+    gdf['구명'] = gdf['SGG_NM'].str.replace('서울특별시 ', '')
+    gdf['구코드'] = gdf['구명'].map(GU_CODES).astype('int64')
+    return gdf
+
+
+def _annotate_dong(gdf):
+    gdf['동코드'] = gdf['ADM_CD'].astype('int64')
+    gdf['구코드'] = gdf['동코드'] // 1000
+    gdf['구명'] = gdf['ADM_CD'].str[:5].map(GU_CODE_MAPPING)
+    gdf['동명'] = gdf['ADM_NM']
+    return gdf
+
+
+def _simplify(gdf, tolerance):
+    """
+    원본 좌표계에서 경계를 공유하는 coverage 단순화 (지원되지 않으면 위상 보존 단순화)
+    """
+    try:
+        geometry = gdf.geometry.simplify_coverage(tolerance)
+    except (AttributeError, NotImplementedError):
+        geometry = gdf.geometry.simplify(tolerance, preserve_topology=True)
+    return gdf.set_geometry(geometry)
+
+
+def _load_cached(shp_path, annotate, tier='full'):
+    """
+    이 프로세스에서 이미 읽은 경계가 있으면 그 복사본을 반환
+
+    없으면 _load_file()로 읽어 기억해 두고 복사본을 반환한다. 호출한 쪽에서 컬럼을
+    추가/수정해도 기억해 둔 경계에는 영향이 없다.
+    """
+    if tier not in GEOMETRY_TIERS:
+        raise ValueError(f"알 수 없는 경계 정밀도 단계: {tier} (가능: {', '.join(GEOMETRY_TIERS)})")
+    stat = _source_stat(shp_path)
+    loaded = _loaded.get((shp_path, tier))
+    if loaded is None or loaded[0] != stat:
+        loaded = (stat, _load_file(shp_path, annotate, tier))
+        _loaded[(shp_path, tier)] = loaded
+    return loaded[1].copy()
+
+
+def _load_file(shp_path, annotate, tier):
+    """
+    캐시가 원본과 같은 해시로 만들어졌으면 캐시를, 아니면 shapefile을 읽어
+    단순화/변환/주석 처리 후 캐시를 새로 저장하고 반환
+    """
+    tolerance = GEOMETRY_TIERS[tier]
+
+    name = os.path.splitext(os.path.basename(shp_path))[0]
+    if tier != 'full':
+        name = f'{name}_{tier}'
+    cache_file = os.path.join(BOUNDARY_CACHE_DIR, f'{name}.parquet')
+    meta_file = os.path.join(BOUNDARY_CACHE_DIR, f'{name}.json')
+
+    key = shapefile_key(shp_path)
+    if os.path.exists(cache_file) and os.path.exists(meta_file):
+        meta = _read_meta(meta_file)
+        if (meta.get('source_key') == key and meta.get('crs') == TARGET_CRS
+                and meta.get('tolerance') == tolerance and meta.get('schema') == CACHE_SCHEMA):
+            return gpd.read_parquet(cache_file)
+
+    gdf = gpd.read_file(shp_path, encoding='cp949')
+    source_crs = str(gdf.crs)
+    if tolerance > 0:
+        gdf = _simplify(gdf, tolerance)
+    gdf = annotate(gdf.to_crs(TARGET_CRS))
+    if tolerance > 0:
+        gdf = gdf.set_geometry(shapely.set_precision(gdf.geometry.values, SIMPLIFIED_GRID))
+
+    os.makedirs(BOUNDARY_CACHE_DIR, exist_ok=True)
+    gdf.to_parquet(cache_file, index=False, compression='zstd')
+    with open(meta_file, 'w', encoding='utf-8') as f:
+        json.dump({'source': os.path.basename(shp_path), 'source_key': key,
+                   'source_crs': source_crs, 'crs': TARGET_CRS,
+                   'tier': tier, 'tolerance': tolerance, 'schema': CACHE_SCHEMA,
+                   'vertices': int(len(shapely.get_coordinates(gdf.geometry.values))),
+                   'geojson_bytes': len(gdf.to_json().encode('utf-8'))},
+                  f, ensure_ascii=False, indent=2)
+    return gdf
+
+
+def _read_meta(meta_file):
+    with open(meta_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def tier_for_zoom(zoom):
+    """
+    지도 확대 수준에서 단순화 오차가 반 픽셀 이하인 가장 거친 단계
+    """
+    half_pixel = _METERS_PER_PIXEL_Z0 / (2 ** zoom) / 2
+    candidates = [tier for tier, tolerance in GEOMETRY_TIERS.items() if tolerance <= half_pixel]
+    return max(candidates, key=GEOMETRY_TIERS.get)
+
+
+def _tier_for_budget(shp_path, annotate, max_bytes):
+    """
+    GeoJSON 크기가 max_bytes 이하인 가장 정밀한 단계 (모두 초과하면 가장 거친 단계)
+
+    단계별 크기는 각 캐시의 메타 정보(geojson_bytes)에 저장된 값을 사용한다.
+    """
+    name = os.path.splitext(os.path.basename(shp_path))[0]
+    for tier in sorted(GEOMETRY_TIERS, key=GEOMETRY_TIERS.get):
+        _load_cached(shp_path, annotate, tier)
+        suffix = '' if tier == 'full' else f'_{tier}'
+        meta = _read_meta(os.path.join(BOUNDARY_CACHE_DIR, f'{name}{suffix}.json'))
+        if meta['geojson_bytes'] <= max_bytes:
+            return tier
+    return max(GEOMETRY_TIERS, key=GEOMETRY_TIERS.get)
+
+
+def _resolve_tier(shp_path, annotate, tier, zoom, max_bytes):
+    if tier is not None:
+        return tier
+    if max_bytes is not None:
+        budget_tier = _tier_for_budget(shp_path, annotate, max_bytes)
+        if zoom is None:
+            return budget_tier
+        # 확대 수준과 크기 상한을 모두 주면 더 거친 쪽을 사용
+        return max(budget_tier, tier_for_zoom(zoom), key=GEOMETRY_TIERS.get)
+    if zoom is not None:
+        return tier_for_zoom(zoom)
+    return 'full'
+
+
+def load_gu_boundary(tier=None, zoom=None, max_bytes=None):
+    """
+    구 경계 GeoDataFrame (EPSG:4326, '구코드', '구명' 컬럼 포함)
+
+    tier를 직접 지정하거나, zoom(지도 확대 수준) 또는 max_bytes(GeoJSON 크기 상한)로
+    단순화 단계를 고른다. 아무것도 주지 않으면 원본('full') 경계를 반환한다.
+    """
+    tier = _resolve_tier(GU_SHP, _annotate_gu, tier, zoom, max_bytes)
+    return _load_cached(GU_SHP, _annotate_gu, tier)
+
+
+def load_dong_boundary(tier=None, zoom=None, max_bytes=None):
+    """
+    동 경계 GeoDataFrame (EPSG:4326, '동코드', '구코드', '구명', '동명' 컬럼 포함)
+
+    단순화 단계 선택 방식은 load_gu_boundary()와 같다.
+    """
+    tier = _resolve_tier(DONG_SHP, _annotate_dong, tier, zoom, max_bytes)
+    return _load_cached(DONG_SHP, _annotate_dong, tier)
+
+
+def load_boundaries(tier=None, zoom=None, max_bytes=None):
+    """
+    (구 경계, 동 경계) GeoDataFrame 반환
+
+    max_bytes는 레이어별 GeoJSON 크기 상한으로 적용된다.
+    """
+    return (load_gu_boundary(tier, zoom, max_bytes),
+            load_dong_boundary(tier, zoom, max_bytes))
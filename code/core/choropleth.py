@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+단일 레이어 단계구분도(choropleth) 렌더링
+
+행마다 folium.GeoJson 레이어를 만들던 방식 대신, 채우기 색상/팝업/툴팁을
+컬럼 단위로 계산해 GeoDataFrame에 넣고 FeatureCollection 하나로 추가한다.
+스타일은 feature 속성의 색상값을 읽으므로 folium은 색상별로 묶인 스타일
+매핑 하나만 HTML에 기록한다.
+"""
+import string
+
+import folium
+import numpy as np
+import pandas as pd
+
+# 정규화 값(0~1) 색상 구간 경계: ~0.2, ~0.4, ~0.6, ~0.8, ~1.0
+CLASS_BREAKS = [0.2, 0.4, 0.6, 0.8]
+
+NODATA_COLOR = '#CCCCCC'
+
+
+def classify_colors(values, palette, nodata_color=NODATA_COLOR, breaks=CLASS_BREAKS, zero_is_nodata=False):
+    """
+    정규화 값 배열을 구간별 색상 배열로 변환 (value <= 경계값이면 해당 구간)
+
+    palette 길이는 len(breaks) + 1 이어야 한다.
+    """
+    values = np.asarray(values, dtype=float)
+    palette = np.asarray(palette, dtype=object)
+    index = np.searchsorted(np.asarray(breaks, dtype=float), values, side='left')
+    colors = palette[np.minimum(index, len(palette) - 1)]
+
+    nodata = np.isnan(values)
+    if zero_is_nodata:
+        nodata |= values == 0
+    colors[nodata] = nodata_color
+    return colors
+
+
+def fill_template(df, template, na_text='N/A'):
+    """
+    '{컬럼명:형식}' 자리표시자가 있는 문자열 템플릿을 컬럼 단위로 채워 Series 반환
+
+    숫자 컬럼의 결측값은 0, 문자열 컬럼의 결측값은 na_text로 표시한다.
+    """
+    result = pd.Series('', index=df.index, dtype=object)
+    for literal, field, spec, _ in string.Formatter().parse(template):
+        result = result + literal
+        if field is None:
+            continue
+
+        column = df[field]
+        if pd.api.types.is_numeric_dtype(column):
+            column = column.fillna(0)
+        else:
+            column = column.astype(object).where(column.notna(), na_text)
+        result = result + column.map(lambda value: format(value, spec))
+    return result
+
+
+def add_choropleth(m, gdf, fill_column, style, popup_column=None, tooltip_column=None,
+                   max_width=300, name=None):
+    """
+    색상/팝업/툴팁 컬럼이 준비된 GeoDataFrame을 GeoJson 레이어 하나로 지도에 추가
+
+    style에는 fillColor를 제외한 공통 스타일(테두리 색, 두께, 투명도 등)을 지정한다.
+    """
+    columns = [col for col in [fill_column, popup_column, tooltip_column] if col]
+    layer_data = gdf[columns + ['geometry']].reset_index(drop=True)
+
+    popup = None
+    if popup_column:
+        popup = folium.GeoJsonPopup(fields=[popup_column], labels=False, localize=False,
+                                    max_width=max_width)
+    tooltip = None
+    if tooltip_column:
+        tooltip = folium.GeoJsonTooltip(fields=[tooltip_column], labels=False, localize=False)
+
+    layer = folium.GeoJson(
+        layer_data,
+        name=name,
+        style_function=lambda feature: dict(style, fillColor=feature['properties'][fill_column]),
+        popup=popup,
+        tooltip=tooltip
+    )
+    layer.add_to(m)
+    return layer
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+위험요인 × 대상변수 상관분석
+
+요인 행렬(관측 × 요인)과 대상 행렬(관측 × 대상)의 모든 쌍에 대해 피어슨/스피어만
+상관계수를 행렬곱 한 번으로 계산한다. 구 단위(25개) 분석은 표본이 작아 점근 p값을
+그대로 믿기 어려우므로, 순열검정 p값과 부트스트랩 신뢰구간을 함께 계산한다.
+재표본은 묶음(chunk) 단위로 나누어 프로세스 풀에서 병렬로 처리하며, 각 묶음의
+난수는 하나의 시드에서 파생된 SeedSequence를 사용하므로 작업자 수와 관계없이
+결과가 같다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+
+CHUNK_SIZE = 2000
+
+
+def _standardize(matrix, axis=-2):
+    """
+    관측 축 기준 평균 0, 제곱합 1로 변환 (분산이 0인 열은 NaN)
+    """
+    centered = matrix - matrix.mean(axis=axis, keepdims=True)
+    norm = np.sqrt((centered ** 2).sum(axis=axis, keepdims=True))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return centered / np.where(norm == 0, np.nan, norm)
+
+
+def _rank(matrix, axis=-2):
+    """
+    관측 축 기준 순위 (동점은 평균 순위, scipy.stats.spearmanr과 같은 규칙)
+    """
+    return stats.rankdata(matrix, axis=axis)
+
+
+def corr_matrix(x, y):
+    """
+    피어슨 상관계수 행렬 (요인 × 대상)
+
+    x, y가 3차원(재표본 × 관측 × 열)이면 재표본별 상관계수 행렬(재표본 × 요인 × 대상)을 반환한다.
+    """
+    return np.matmul(np.swapaxes(_standardize(x), -1, -2), _standardize(y))
+
+
+def asymptotic_pvalues(r, n):
+    """
+    t 분포 기반 양측 p값 (scipy.stats.pearsonr/spearmanr와 같은 근사)
+    """
+    r = np.clip(r, -1.0, 1.0)
+    with np.errstate(divide='ignore'):
+        t = r * np.sqrt((n - 2) / np.maximum(1.0 - r ** 2, 0.0))
+    return 2 * stats.t.sf(np.abs(t), n - 2)
+
+
+def correlations(x, y):
+    """
+    피어슨/스피어만 상관계수와 점근 p값 (각 값은 요인 × 대상 배열)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape[0] != y.shape[0]:
+        raise ValueError(f"요인 {x.shape}과 대상 {y.shape}의 관측 수가 다릅니다.")
+
+    n = x.shape[0]
+    pearson = corr_matrix(x, y)
+    spearman = corr_matrix(_rank(x), _rank(y))
+    return {
+        'pearson_r': pearson,
+        'pearson_p': asymptotic_pvalues(pearson, n),
+        'spearman_r': spearman,
+        'spearman_p': asymptotic_pvalues(spearman, n)
+    }
+
+
+def _permutation_chunk(x, y, n_resamples, seed_seq):
+    """
+    대상 행을 무작위로 섞었을 때 |r|이 관측값 이상인 횟수 (피어슨, 스피어만)
+    """
+    rng = np.random.default_rng(seed_seq)
+    n = x.shape[0]
+    index = rng.permuted(np.broadcast_to(np.arange(n), (n_resamples, n)), axis=1)
+
+    counts = []
+    for a, b in ((x, y), (_rank(x), _rank(y))):
+        # 순열은 평균/제곱합을 바꾸지 않으므로 표준화는 한 번만 수행
+        a_std = _standardize(a)
+        b_std = _standardize(b)
+        observed = np.abs(a_std.T @ b_std)
+        permuted = np.abs(np.einsum('np,bnq->bpq', a_std, b_std[index]))
+        counts.append((permuted >= observed - 1e-12).sum(axis=0))
+    return counts
+
+
+def _bootstrap_chunk(x, y, n_resamples, seed_seq):
+    """
+    관측 행 복원추출 재표본의 상관계수 (피어슨, 스피어만 각각 재표본 × 요인 × 대상)
+    """
+    rng = np.random.default_rng(seed_seq)
+    n = x.shape[0]
+    index = rng.integers(0, n, size=(n_resamples, n))
+    x_boot = x[index]
+    y_boot = y[index]
+    return [corr_matrix(x_boot, y_boot), corr_matrix(_rank(x_boot), _rank(y_boot))]
+
+
+def _run_chunks(func, x, y, n_resamples, seed_seq, chunk_size, executor):
+    sizes = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+    seeds = seed_seq.spawn(len(sizes))
+    if executor is None:
+        return [func(x, y, size, seed) for size, seed in zip(sizes, seeds)]
+    count = len(sizes)
+    return list(executor.map(func, [x] * count, [y] * count, sizes, seeds))
+
+
+def resample_tests(x, y, n_permutations=20000, n_bootstrap=20000, confidence=0.95,
+                   seed=0, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    순열검정 p값과 부트스트랩 백분위 신뢰구간 (각 값은 요인 × 대상 배열)
+
+    p값은 (초과 횟수 + 1) / (순열 수 + 1) 로 계산하여 0이 되지 않게 한다.
+    부트스트랩 재표본에서 분산이 0이 된 경우(NaN)는 신뢰구간 계산에서 제외한다.
+    workers=1이면 프로세스 풀 없이 현재 프로세스에서 처리한다.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    permutation_seed, bootstrap_seed = np.random.SeedSequence(seed).spawn(2)
+
+    executor = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    try:
+        permutation_results = _run_chunks(_permutation_chunk, x, y, n_permutations,
+                                          permutation_seed, chunk_size, executor)
+        bootstrap_results = _run_chunks(_bootstrap_chunk, x, y, n_bootstrap,
+                                        bootstrap_seed, chunk_size, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    alpha = (1 - confidence) / 2 * 100
+    result = {}
+    for i, method in enumerate(['pearson', 'spearman']):
+        exceed = sum(counts[i] for counts in permutation_results)
+        result[f'{method}_perm_p'] = (exceed + 1) / (n_permutations + 1)
+
+        samples = np.concatenate([chunk[i] for chunk in bootstrap_results])
+        low, high = np.nanpercentile(samples, [alpha, 100 - alpha], axis=0)
+        result[f'{method}_ci_low'] = low
+        result[f'{method}_ci_high'] = high
+    return result
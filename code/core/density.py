@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 좌표 커널 밀도 격자
+
+좌표를 서울 전체를 덮는 고정 격자(Web Mercator, EPSG:3857)에 모은 뒤 가우시안
+커널을 FFT 합성곱으로 적용하여 밀도(건/km²)를 계산한다. 점 개수와 관계없이
+비용은 격자 크기에만 비례하므로 다년도 자료도 같은 시간에 처리된다.
+격자 칸은 지도 타일과 같은 좌표계에 정렬되어 있어 folium ImageOverlay로 그대로
+겹쳐 그릴 수 있다.
+
+계산 결과는 원본 파일 해시와 격자 설정을 기록한 .npz 캐시로 저장되므로
+지도 스크립트는 원본 좌표 대신 작은 밀도 격자만 읽는다.
+"""
+import functools
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+from pyproj import Transformer
+from scipy import fft
+
+from core.boundaries import load_gu_boundary
+from core.dispatch import valid_coordinates
+from core.paths import CACHE_DIR
+from core.storage import read_table
+
+DENSITY_CACHE_DIR = os.path.join(CACHE_DIR, 'density')
+DEFAULT_CACHE_FILE = os.path.join(DENSITY_CACHE_DIR, '서울시_구조출동_밀도.npz')
+
+GRID_CRS = 'EPSG:3857'
+
+# 격자 칸 크기와 커널 대역폭 (지상 거리, 미터)
+CELL_SIZE = 100.0
+BANDWIDTHS = (250.0, 500.0, 1000.0)
+
+# 커널 절단 반경 (표준편차 배수)
+KERNEL_RADIUS = 4.0
+
+# 밀도 색상 (folium HeatMap 범례와 같은 순서)
+DENSITY_COLORS = ['#0000ff', '#00ffff', '#00ff00', '#ffff00', '#ffa500', '#ff0000']
+
+_TO_MERCATOR = Transformer.from_crs('EPSG:4326', GRID_CRS, always_xy=True)
+_TO_LONLAT = Transformer.from_crs(GRID_CRS, 'EPSG:4326', always_xy=True)
+
+
+def file_key(path):
+    """
+    파일 내용의 SHA-256
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def grid_spec(bounds, cell_size=CELL_SIZE, margin=0.0):
+    """
+    경위도 범위(서, 남, 동, 북)를 덮는 격자 정의
+
+    Web Mercator 거리는 위도에 따라 늘어나므로(1/cos(위도)) 범위 중심 위도의
+    배율로 지상 거리(cell_size, margin)를 격자 거리로 바꾼다. 서울 범위에서
+    배율 차이는 0.5% 이내이다.
+    """
+    west, south, east, north = bounds
+    scale = 1 / math.cos(math.radians((south + north) / 2))
+    cell = cell_size * scale
+    pad = margin * scale
+
+    (min_x, max_x), (min_y, max_y) = _TO_MERCATOR.transform([west, east], [south, north])
+    x0 = math.floor((min_x - pad) / cell) * cell
+    y0 = math.floor((min_y - pad) / cell) * cell
+    return {
+        'x0': x0,
+        'y0': y0,
+        'cell': cell,
+        'nx': int(math.ceil((max_x + pad - x0) / cell)),
+        'ny': int(math.ceil((max_y + pad - y0) / cell)),
+        'scale': scale,
+        'cell_size': cell_size
+    }
+
+
+def to_mercator(lon, lat):
+    """
+    경위도 배열을 Web Mercator 좌표(미터) 배열로 변환
+    """
+    return _TO_MERCATOR.transform(np.asarray(lon, dtype=float), np.asarray(lat, dtype=float))
+
+
+def bin_points(lon, lat, spec):
+    """
+    좌표를 격자 칸에 모은 개수 배열 (행 0이 남쪽)과 격자 밖 좌표 수
+    """
+    x, y = to_mercator(lon, lat)
+    col = np.floor((x - spec['x0']) / spec['cell']).astype(np.int64)
+    row = np.floor((y - spec['y0']) / spec['cell']).astype(np.int64)
+    inside = (col >= 0) & (col < spec['nx']) & (row >= 0) & (row < spec['ny'])
+
+    flat = row[inside] * spec['nx'] + col[inside]
+    counts = np.bincount(flat, minlength=spec['ny'] * spec['nx']).reshape(spec['ny'], spec['nx'])
+    return counts.astype(float), int((~inside).sum())
+
+
+def gaussian_kernel(sigma_cells, radius=KERNEL_RADIUS):
+    """
+    합이 1인 2차원 가우시안 커널 (표준편차: 격자 칸 단위)
+    """
+    half = max(int(math.ceil(radius * sigma_cells)), 1)
+    t = np.arange(-half, half + 1)
+    kernel = np.exp(-0.5 * (t / sigma_cells) ** 2)
+    kernel /= kernel.sum()
+    return np.outer(kernel, kernel)
+
+
+@functools.lru_cache(maxsize=32)
+def _kernel_fft(sigma_cells, radius, shape):
+    """
+    커널 반폭과 0을 채운 크기(shape)에서의 커널 FFT (같은 크기 격자를 반복 처리할 때 재사용)
+    """
+    kernel = gaussian_kernel(sigma_cells, radius)
+    return kernel.shape[0] // 2, fft.rfft2(kernel, s=shape)
+
+
+def smooth(counts, sigmas_cells, radius=KERNEL_RADIUS):
+    """
+    개수 격자에 여러 대역폭의 가우시안 커널을 FFT 합성곱으로 적용 (대역폭 × 행 × 열)
+
+    격자의 FFT는 가장 큰 커널 기준으로 0을 채운 크기에서 한 번만 계산하고
+    대역폭별로 커널 FFT만 곱하므로, 대역폭이 늘어도 비용은 역변환 횟수만큼만 는다.
+    커널 FFT는 격자 크기별로 캐시되어 같은 크기의 타일을 반복 처리할 때 재사용된다.
+    """
+    largest = max(2 * max(int(math.ceil(radius * sigma)), 1) + 1 for sigma in sigmas_cells)
+    shape = tuple(fft.next_fast_len(n + largest - 1, real=True) for n in counts.shape)
+    counts_fft = fft.rfft2(counts, s=shape)
+
+    ny, nx = counts.shape
+    result = np.empty((len(sigmas_cells), ny, nx))
+    for i, sigma in enumerate(sigmas_cells):
+        half, kernel_fft = _kernel_fft(float(sigma), radius, shape)
+        full = fft.irfft2(counts_fft * kernel_fft, s=shape)
+        result[i] = full[half:half + ny, half:half + nx]
+    # FFT 반올림 오차로 생긴 아주 작은 음수 제거
+    return np.maximum(result, 0.0)
+
+
+def compute_density(lon, lat, bounds, bandwidths=BANDWIDTHS, cell_size=CELL_SIZE):
+    """
+    좌표의 커널 밀도 격자 계산
+
+    반환 딕셔너리:
+    - density: 대역폭 × 행 × 열 float32 배열 (건/km², 행 0이 남쪽)
+    - bandwidths, cell_size: 대역폭과 격자 칸 크기 (지상 거리, 미터)
+    - latlon_bounds: 격자 외곽 [[남, 서], [북, 동]] (ImageOverlay bounds 형식)
+    - extent: 격자 외곽 Web Mercator 좌표 [min_x, min_y, max_x, max_y]
+    - points, outside: 격자 안/밖 좌표 수
+    """
+    bandwidths = np.asarray(sorted(bandwidths), dtype=float)
+    spec = grid_spec(bounds, cell_size, margin=KERNEL_RADIUS * bandwidths.max())
+    counts, outside = bin_points(lon, lat, spec)
+
+    density = smooth(counts, bandwidths / cell_size)
+    density /= (cell_size / 1000) ** 2
+
+    extent = [spec['x0'], spec['y0'],
+              spec['x0'] + spec['nx'] * spec['cell'], spec['y0'] + spec['ny'] * spec['cell']]
+    (west, east), (south, north) = _TO_LONLAT.transform(extent[0::2], extent[1::2])
+    return {
+        'density': density.astype(np.float32),
+        'bandwidths': bandwidths,
+        'cell_size': float(cell_size),
+        'latlon_bounds': [[south, west], [north, east]],
+        'extent': extent,
+        'points': int(counts.sum()),
+        'outside': outside
+    }
+
+
+def save_density(grid, path, meta=None):
+    """
+    밀도 격자를 .npz로 저장 (meta는 JSON 문자열로 함께 기록)
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    info = {key: grid[key] for key in ('cell_size', 'latlon_bounds', 'extent', 'points', 'outside')}
+    info.update(meta or {})
+    temp_file = path + '.tmp'
+    with open(temp_file, 'wb') as f:
+        np.savez_compressed(f, density=grid['density'], bandwidths=grid['bandwidths'],
+                            meta=np.array(json.dumps(info, ensure_ascii=False)))
+    os.replace(temp_file, path)
+
+
+def read_density(path):
+    """
+    save_density()로 저장한 격자 읽기 (저장 시 meta 항목은 'meta' 키에 포함)
+    """
+    with np.load(path) as data:
+        info = json.loads(str(data['meta']))
+        grid = {'density': data['density'], 'bandwidths': data['bandwidths']}
+    grid.update({key: info[key] for key in ('cell_size', 'latlon_bounds', 'extent', 'points', 'outside')})
+    grid['meta'] = info
+    return grid
+
+
+def load_density(source_file, bounds=None, bandwidths=BANDWIDTHS, cell_size=CELL_SIZE,
+                 cache_file=DEFAULT_CACHE_FILE, force=False):
+    """
+    구조출동 좌표 파일의 밀도 격자 (캐시가 같은 원본/설정으로 만들어졌으면 캐시 사용)
+
+    bounds를 생략하면 서울시 구경계 전체 범위를 사용한다.
+    """
+    if bounds is None:
+        bounds = [float(v) for v in load_gu_boundary().total_bounds]
+    settings = {
+        'source': os.path.basename(source_file),
+        'source_key': file_key(source_file),
+        'bounds': [round(float(v), 9) for v in bounds],
+        'bandwidths': sorted(float(b) for b in bandwidths),
+        'cell_size': float(cell_size),
+        'crs': GRID_CRS
+    }
+
+    if not force and os.path.exists(cache_file):
+        grid = read_density(cache_file)
+        if all(grid['meta'].get(key) == value for key, value in settings.items()):
+            return grid
+
+    coord_df = read_table(source_file, columns=['피해지역_경도', '피해지역_위도'])
+    coord_df = coord_df[valid_coordinates(coord_df)]
+    grid = compute_density(coord_df['피해지역_경도'].to_numpy(), coord_df['피해지역_위도'].to_numpy(),
+                           bounds, bandwidths, cell_size)
+    save_density(grid, cache_file, settings)
+    grid['meta'] = {**settings, **{key: grid[key] for key in ('points', 'outside')}}
+    return grid
+
+
+@functools.lru_cache(maxsize=8)
+def _color_table(colors, min_opacity, max_opacity, threshold):
+    """
+    0~255 수준별 RGBA 색상표 (256 × 4 uint8)
+    """
+    level = np.arange(256) / 255
+    stops = np.linspace(0.0, 1.0, len(colors))
+    rgb = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors], dtype=float)
+    table = np.empty((256, 4), dtype=np.uint8)
+    for channel in range(3):
+        table[:, channel] = np.interp(level, stops, rgb[:, channel]).round()
+    alpha = np.where(level < threshold, 0.0, min_opacity + (max_opacity - min_opacity) * level)
+    table[:, 3] = (alpha * 255).round()
+    # 투명한 칸의 색상은 보이지 않으므로 0으로 두어 PNG 압축률을 높임
+    table[table[:, 3] == 0] = 0
+    return table
+
+
+def colorize(level, colors=DENSITY_COLORS, min_opacity=0.2, max_opacity=0.8, threshold=0.02):
+    """
+    0~1 수준 배열을 RGBA uint8 이미지로 변환 (threshold 미만은 투명)
+
+    수준을 256단계로 나눈 색상표에서 한 번에 찾아오므로 큰 배열도 빠르게 변환된다.
+    """
+    table = _color_table(tuple(colors), min_opacity, max_opacity, threshold)
+    index = (np.clip(np.asarray(level, dtype=float), 0.0, 1.0) * 255).round().astype(np.uint8)
+    return table[index]
+
+
+def density_image(density, upper_quantile=0.995, **kwargs):
+    """
+    밀도 격자를 ImageOverlay용 RGBA uint8 이미지로 변환 (행 0이 북쪽)
+
+    상위 upper_quantile 분위수를 색상 최댓값으로 잘라 일부 극단값이 색 범위를
+    독차지하지 않게 한다. 나머지 인자는 colorize()에 전달된다.
+    """
+    density = np.asarray(density, dtype=float)
+    positive = density[density > 0]
+    top = np.quantile(positive, upper_quantile) if len(positive) else 1.0
+    return colorize(density / top, **kwargs)[::-1]
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 원본 자료 스트리밍 필터
+
+2_filtering(화재 사고만), 4_select_feature(오인신고/도로 제외, 5개 컬럼 선택)
+단계를 원본 파일에 대해 한 번에 수행한다. 원본은 필요한 컬럼만 묶음(chunk)
+단위로 읽고 조건을 한 번에 적용한 뒤 결과 파일에 이어 쓰므로, 메모리보다 큰
+다년도 원본도 처리할 수 있다.
+"""
+import os
+
+import pandas as pd
+
+# 필터 조건 컬럼
+ACCIDENT_COLUMN = 'ACDNT_CS_NM'       # 사고원인명
+RESULT_COLUMN = 'PRCS_RSLT_SE_NM'     # 처리결과 구분명
+PLACE_COLUMN = 'ACDNT_OCRN_PLC_NM'    # 사고발생 장소명
+
+# 선택 컬럼 → 결과 컬럼명 (4_select_feature_서울시_구조출동.py와 동일)
+COLUMN_MAPPING = {
+    'GRNDS_CTPV_NM': '발생지역_시도명',
+    'GRNDS_SGG_NM': '발생지역_시군구명',
+    'DAMG_RGN_LOT': '피해지역_경도',
+    'DAMG_RGN_LAT': '피해지역_위도',
+    'PRCS_RSLT_SE_NM': '처리결과_구분명'
+}
+
+COORD_COLUMNS = ['DAMG_RGN_LOT', 'DAMG_RGN_LAT']
+
+NEEDED_COLUMNS = {ACCIDENT_COLUMN, RESULT_COLUMN, PLACE_COLUMN, *COLUMN_MAPPING}
+
+CHUNK_SIZE = 200_000
+
+# 서울 주변 유효 좌표 범위 (경도, 위도)
+LON_RANGE = (126, 128)
+LAT_RANGE = (37, 38)
+
+
+def valid_coordinates(df, lon_column='피해지역_경도', lat_column='피해지역_위도'):
+    """
+    결측/0이 아니고 서울 주변 범위 안에 있는 좌표 행의 마스크
+    """
+    lon = df[lon_column]
+    lat = df[lat_column]
+    return (
+        lon.notna() & lat.notna() & (lon != 0) & (lat != 0) &
+        (lon > LON_RANGE[0]) & (lon < LON_RANGE[1]) &
+        (lat > LAT_RANGE[0]) & (lat < LAT_RANGE[1])
+    )
+
+
+def _add_counts(total, counts):
+    for key, count in counts.items():
+        total[key] = total.get(key, 0) + int(count)
+
+
+def _filter_chunk(chunk, stats):
+    """
+    화재 사고 중 오인신고/도로 사고를 제외하고 선택 컬럼만 남긴 데이터프레임 반환
+    """
+    stats['원본'] += len(chunk)
+    _add_counts(stats['사고유형'], chunk[ACCIDENT_COLUMN].fillna('미상').value_counts())
+
+    mask = chunk[ACCIDENT_COLUMN] == '화재'
+    stats['화재'] += int(mask.sum())
+
+    false_alarm = mask & (chunk[RESULT_COLUMN] == '오인신고')
+    stats['오인신고_제외'] += int(false_alarm.sum())
+    mask &= ~false_alarm
+    road = mask & (chunk[PLACE_COLUMN] == '도로')
+    stats['도로_제외'] += int(road.sum())
+    mask &= ~road
+
+    # 파일마다 컬럼 구성이 달라도 결과 컬럼 배치는 항상 COLUMN_MAPPING 순서 (없는 컬럼은 빈 값)
+    return chunk.loc[mask].reindex(columns=list(COLUMN_MAPPING)).rename(columns=COLUMN_MAPPING)
+
+
+def stream_filter(input_files, output_file, chunksize=CHUNK_SIZE, encoding='utf-8'):
+    """
+    원본 구조출동 CSV 파일들을 묶음 단위로 읽어 필터링 결과를 output_file에 저장
+
+    결과는 임시 파일에 이어 쓴 뒤 모두 끝나면 교체하므로, 중간에 실패해도
+    기존 결과 파일은 그대로 남는다. 처리 건수 통계 딕셔너리를 반환한다.
+    """
+    stats = {'원본': 0, '화재': 0, '오인신고_제외': 0, '도로_제외': 0, '저장': 0,
+             '사고유형': {}, '처리결과': {}, '시군구': {}, '결측값': {}}
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    temp_file = output_file + '.tmp'
+    header = True
+    try:
+        # utf-8-sig: BOM은 파일 맨 앞에 한 번만 기록
+        with open(temp_file, 'w', encoding='utf-8-sig', newline='') as out:
+            for input_file in input_files:
+                reader = pd.read_csv(
+                    input_file,
+                    encoding=encoding,
+                    usecols=lambda col: col in NEEDED_COLUMNS,
+                    dtype={col: str for col in NEEDED_COLUMNS if col not in COORD_COLUMNS},
+                    chunksize=chunksize
+                )
+                for chunk in reader:
+                    for column in [ACCIDENT_COLUMN, RESULT_COLUMN, PLACE_COLUMN]:
+                        if column not in chunk.columns:
+                            raise ValueError(f"{input_file}: {column} 컬럼이 없습니다.")
+
+                    result = _filter_chunk(chunk, stats)
+                    stats['저장'] += len(result)
+                    for key, column in [('처리결과', '처리결과_구분명'), ('시군구', '발생지역_시군구명')]:
+                        if column in result.columns:
+                            _add_counts(stats[key], result[column].value_counts())
+                    _add_counts(stats['결측값'], result.isnull().sum())
+
+                    result.to_csv(out, index=False, header=header)
+                    header = False
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    return stats
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+좌표 → 행정동 일괄 지오코딩
+
+센서 설치 위치, 과거 사고 좌표 등 임의의 경도/위도 배열에 행정동(ADM_CD, 구명, 동명)을
+붙인다. 서울시_동경계.shp 위에 격자 색인과 준비된 STRtree(core.spatial.PointLocator)를
+만들어 대부분의 좌표는 배열 색인만으로, 경계가 지나가는 칸의 좌표만 폴리곤 판정으로
+배정하며, 어느 동에도 들지 않는 좌표(경계 틈, 한강 위 등)는 미터 좌표계에서 가장
+가까운 동으로 보정한다. 격자는 경계 shapefile 내용 지문과 함께 캐시된다.
+
+    from core.geocode import geocode
+    regions = geocode(sensor_df['경도'].to_numpy(), sensor_df['위도'].to_numpy())
+"""
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+import shapely
+from pyproj import Transformer
+
+from core.boundaries import DONG_SHP, TARGET_CRS, load_dong_boundary, shapefile_key
+from core.paths import CACHE_DIR
+from core.spatial import AREA_CRS, PointLocator
+
+# 격자 칸 크기 (도, 서울 위도에서 약 44m × 56m)
+GRID_CELL = 0.0005
+GRID_CACHE = os.path.join(CACHE_DIR, 'geocode_grid.npz')
+
+# 가장 가까운 동으로 보정할 최대 거리 (미터, 한강 폭 정도)
+NEAREST_MAX_DISTANCE = 1000.0
+
+
+def _load_grid(locator):
+    """
+    동 경계 격자 (캐시 지문이 다르면 다시 만들어 저장)
+    """
+    key = f'{shapefile_key(DONG_SHP)}:{GRID_CELL}'
+    if os.path.exists(GRID_CACHE):
+        with np.load(GRID_CACHE) as cached:
+            if str(cached['key']) == key:
+                return {'origin': tuple(cached['origin'].tolist()), 'cell': float(cached['cell']),
+                        'cells': cached['cells']}
+
+    grid = locator.build_grid(GRID_CELL)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_file = GRID_CACHE + '.tmp'
+    with open(temp_file, 'wb') as f:
+        np.savez(f, key=np.array(key), origin=np.array(grid['origin']), cell=np.array(grid['cell']),
+                 cells=grid['cells'])
+    os.replace(temp_file, GRID_CACHE)
+    return grid
+
+
+@functools.lru_cache(maxsize=1)
+def dong_locator():
+    """
+    (격자 색인을 갖춘 동 경계 PointLocator, 동 경계 GeoDataFrame) - 프로세스마다 한 번 생성
+    """
+    dong = load_dong_boundary()
+    locator = PointLocator(dong.geometry.values)
+    locator.grid = _load_grid(locator)
+    return locator, dong
+
+
+@functools.lru_cache(maxsize=1)
+def _nearest_index():
+    """
+    가장 가까운 동 검색용 (경계선 선분 STRtree, 선분별 동 위치, 경도/위도 → 미터 변환기)
+
+    동 밖의 좌표에서 동까지의 거리는 경계선까지의 거리와 같으므로, 꼭짓점이 많은
+    폴리곤 대신 경계선을 두 점 선분으로 나누어 색인하면 사각형 검사가 촘촘해져
+    가장 가까운 동 검색이 훨씬 빠르다.
+    """
+    _, dong = dong_locator()
+    rings, ring_owner = shapely.get_rings(dong.geometry.to_crs(AREA_CRS).values, return_index=True)
+    coords, ring_idx = shapely.get_coordinates(rings, return_index=True)
+    same_ring = ring_idx[1:] == ring_idx[:-1]
+    segments = shapely.linestrings(np.stack([coords[:-1][same_ring], coords[1:][same_ring]], axis=1))
+    return (shapely.STRtree(segments), ring_owner[ring_idx[:-1][same_ring]],
+            Transformer.from_crs(TARGET_CRS, AREA_CRS, always_xy=True))
+
+
+def _nearest(lon, lat, max_distance):
+    """
+    (좌표 위치, 가장 가까운 동 위치, 거리) - max_distance 안에 동이 없는 좌표는 빠짐
+
+    거리가 같은 동이 여럿이면(공유 경계선) 위치가 가장 앞선 동을 고른다.
+    """
+    tree, owner, transformer = _nearest_index()
+    x, y = transformer.transform(lon, lat)
+    (point_idx, segment_idx), distance = tree.query_nearest(
+        shapely.points(x, y), max_distance=max_distance, return_distance=True, all_matches=True)
+    if len(point_idx) == 0:
+        return point_idx, owner[segment_idx], distance
+    polygon_idx = owner[segment_idx]
+    order = np.lexsort((polygon_idx, point_idx))
+    point_idx, polygon_idx, distance = point_idx[order], polygon_idx[order], distance[order]
+    first = np.r_[True, point_idx[1:] != point_idx[:-1]]
+    return point_idx[first], polygon_idx[first], distance[first]
+
+
+def locate_dongs(lon, lat, nearest=True, max_distance=NEAREST_MAX_DISTANCE):
+    """
+    (좌표별 동 위치 배열(dong_locator() 경계 순서, 찾지 못하면 -1), 보정거리_m 배열) 반환
+
+    보정거리는 동 안이면 0, 가장 가까운 동으로 보정했으면 그 거리, 찾지 못하면 NaN이다.
+    nearest=False이면 보정하지 않으며, max_distance=None이면 거리 제한 없이 보정한다.
+    결측 좌표는 찾지 못한 것으로 본다. 스칼라 좌표는 길이 1 배열로 다룬다.
+    """
+    lon = np.atleast_1d(np.asarray(lon, dtype=float))
+    lat = np.atleast_1d(np.asarray(lat, dtype=float))
+    locator, _ = dong_locator()
+    located = locator.locate(lon, lat)
+    distance = np.where(located >= 0, 0.0, np.nan)
+
+    missing = np.flatnonzero((located < 0) & np.isfinite(lon) & np.isfinite(lat))
+    if nearest and len(missing):
+        point_idx, polygon_idx, found = _nearest(lon[missing], lat[missing], max_distance)
+        located[missing[point_idx]] = polygon_idx
+        distance[missing[point_idx]] = found
+    return located, distance
+
+
+def geocode(lon, lat, nearest=True, max_distance=NEAREST_MAX_DISTANCE):
+    """
+    경도/위도 배열(또는 스칼라 좌표 하나) → 좌표별 행정동 데이터프레임
+
+    컬럼: ADM_CD, 구명, 동명(category), 동코드, 구코드(int64, 찾지 못하면 -1),
+    보정거리_m(locate_dongs() 참고).
+    """
+    located, distance = locate_dongs(lon, lat, nearest, max_distance)
+    _, dong = dong_locator()
+
+    def column(values):
+        # 동 위치 → 범주 코드 (찾지 못한 좌표는 -1 → 결측)
+        categories, codes = np.unique(values, return_inverse=True)
+        return pd.Categorical.from_codes(np.where(located >= 0, codes[located], -1), categories)
+
+    dong_codes = dong['동코드'].to_numpy(dtype=np.int64)
+    gu_codes = dong['구코드'].to_numpy(dtype=np.int64)
+    return pd.DataFrame({
+        'ADM_CD': column(dong['ADM_CD'].astype(str).to_numpy()),
+        '구명': column(dong['구명'].astype(str).to_numpy()),
+        '동명': column(dong['동명'].astype(str).to_numpy()),
+        '동코드': np.where(located >= 0, dong_codes[located], -1),
+        '구코드': np.where(located >= 0, gu_codes[located], -1),
+        '보정거리_m': distance
+    })
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+동 × 지표 행렬 저장소
+
+완성된 동별 지표를 파일 하나에 고정 배치로 저장하고, 읽을 때는 파일 전체를 메모리
+매핑하여 배열을 복사 없이 바로 사용한다. 렌더러, 점수 계산, 조회 서비스 등 여러
+프로세스가 같은 파일을 열어도 운영체제 페이지 캐시를 공유하며, 지표가 분기마다 수십
+개로 늘어나도 여는 비용은 헤더 크기에만 비례한다.
+
+파일 구성 (모든 블록은 ALIGN 바이트 경계에서 시작):
+    MAGIC(8바이트) + 헤더 길이(uint32) + 헤더(JSON, UTF-8)
+    동코드 블록   int64 (동 수)                  - 동 경계 순서
+    이름 블록     고정 길이 유니코드 (동 수)      - 구명, 동명
+    지표 블록     float32 (지표 수 × 동 수)       - 지표별로 연속 저장
+
+헤더에는 컬럼 이름, 블록별 (오프셋, dtype, shape)과 입력 지문(key)이 들어간다.
+다시 쓸 때는 임시 파일을 만든 뒤 교체하므로 이미 파일을 열어 둔 프로세스는 이전
+내용을 그대로 계속 읽는다.
+"""
+import json
+import os
+
+import numpy as np
+
+MAGIC = b'DONGMAT1'
+SCHEMA = 1
+ALIGN = 64
+
+
+def _aligned(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+
+def write_store(path, index, labels, values, key):
+    """
+    동 × 지표 저장소 파일 작성
+
+    index: 동코드 배열, labels: {이름 컬럼: 문자열 배열}, values: {지표 컬럼: 숫자 배열}
+    (모두 동 경계 순서). 지표는 float32로 저장되며 결측값은 NaN으로 남는다.
+    """
+    index = np.ascontiguousarray(index, dtype='<i8')
+    rows = len(index)
+    blocks = [('index', index)]
+    blocks += [(f'label:{name}', np.ascontiguousarray(np.asarray(column, dtype=str)))
+               for name, column in labels.items()]
+    # 지표 컬럼별 연속 배치 (지표 × 동) - 읽을 때 전치 뷰로 (동 × 지표) 행렬 제공
+    matrix = np.empty((len(values), rows), dtype='<f4')
+    for i, column in enumerate(values.values()):
+        matrix[i] = np.asarray(column, dtype=float)
+    blocks.append(('matrix', matrix))
+    for name, array in blocks:
+        if len(array) != rows and name != 'matrix':
+            raise ValueError(f"{name} 길이 {len(array)}가 동 수 {rows}와 다릅니다.")
+
+    header = {'schema': SCHEMA, 'key': key, 'rows': rows,
+              'labels': list(labels), 'columns': list(values), 'blocks': {}}
+    # 헤더 길이가 오프셋에 따라 달라지므로 오프셋 자리를 넉넉히 잡아 두 번 계산
+    for _ in range(2):
+        offset = _aligned(len(MAGIC) + 4 + len(json.dumps(header, ensure_ascii=False).encode('utf-8')) + ALIGN)
+        for name, array in blocks:
+            header['blocks'][name] = [offset, array.dtype.str, list(array.shape)]
+            offset = _aligned(offset + array.nbytes)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    if len(MAGIC) + 4 + len(header_bytes) > header['blocks']['index'][0]:
+        raise ValueError("지표 저장소 헤더가 첫 블록 위치를 넘습니다.")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_file = path + '.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.uint32(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        for name, array in blocks:
+            f.seek(header['blocks'][name][0])
+            f.write(array.tobytes())
+    os.replace(temp_file, path)
+
+
+def read_header(path):
+    """
+    저장소 헤더만 읽음 (없거나 형식이 다르면 None)
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return None
+        length = int(np.frombuffer(f.read(4), dtype=np.uint32)[0])
+        header = json.loads(f.read(length).decode('utf-8'))
+    return header if header.get('schema') == SCHEMA else None
+
+
+def open_store(path):
+    """
+    저장소를 읽기 전용 메모리 매핑으로 열어 {'key', 'columns', '동코드', 이름 컬럼..., 'matrix'} 반환
+
+    배열은 모두 파일에 대한 뷰이며, 'matrix'는 (동 × 지표) float32 행렬이다.
+    """
+    header = read_header(path)
+    if header is None:
+        raise ValueError(f"지표 저장소 형식이 아닙니다: {path}")
+
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+
+    def block(name):
+        offset, dtype, shape = header['blocks'][name]
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        return buffer[offset:offset + size].view(dtype).reshape(shape)
+
+    store = {'key': header['key'], 'columns': header['columns'], '동코드': block('index')}
+    for name in header['labels']:
+        store[name] = block(f'label:{name}')
+    store['matrix'] = block('matrix').T
+    return store
+
+
+def column(store, name):
+    """
+    지표 컬럼 하나 (연속된 float32 뷰)
+    """
+    return store['matrix'][:, store['columns'].index(name)]
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+동별 종합 재난 위험도 지표
+
+4_select_feature 결과와 구조출동 좌표로 동별 지표(core.scoring.INDICATORS)를 만든다.
+지표마다 입력 파일 지문(이름, 크기, 수정시각)과 함께 원본 동 경계 순서의 NumPy 배열로
+캐시하고(dataset/.cache/indicators/), 입력이 바뀐 지표만 다시 계산한다. 예를 들어
+구조출동 자료만 갱신되면 구조출동 지표만 다시 집계하고 나머지 지표는 캐시를 읽어
+정규화와 가중합만 다시 한다. 완성된 지표는 다시 동 × 지표 float32 저장소
+(core.indicator_store)로 모아 두므로, 상위 위험 동 조회 같은 가벼운 작업은
+pandas/geopandas를 불러오지 않고 저장소를 메모리 매핑하여 바로 응답한다.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from core.paths import BOUNDARY_DIR, CACHE_DIR, SELECT_DIR
+from core.scoring import INDICATORS
+
+POPULATION_FILE = os.path.join(SELECT_DIR, '서울시_등록인구_2025_1분기_동별_최종.csv')
+AREA_FILE = os.path.join(SELECT_DIR, '서울시_행정구역(동별)_면적.csv')
+VULNERABLE_FILE = os.path.join(SELECT_DIR, '재난안전취약자정보_selected_features.csv')
+HOUSING_FILE = os.path.join(SELECT_DIR, '노후기간별_주택현황_selected_features.csv')
+RESCUE_FILE = os.path.join(SELECT_DIR, '서울시_구조출동_selected_features.csv')
+
+INDICATOR_DIR = os.path.join(CACHE_DIR, 'indicators')
+INDICATOR_STORE = os.path.join(CACHE_DIR, 'dong_indicators.store')
+
+# 모든 지표가 기준으로 삼는 파일 (동 경계 shapefile, 이름→코드 변환 및 지표 계산 코드)
+_BOUNDARY = os.path.join(BOUNDARY_DIR, '서울시_동경계')
+_CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+COMMON_FILES = ([_BOUNDARY + ext for ext in ['.shp', '.shx', '.dbf', '.prj', '.cpg']] +
+                [os.path.join(_CODE_DIR, name) for name in ['indicators.py', 'regions.py', 'boundaries.py']])
+
+# 동 경계 기본 컬럼 (지표 배열의 행 순서)
+BASE_COLUMNS = ['동코드', '구코드', '구명', '동명']
+
+
+def _dong_areas():
+    """
+    동별 면적 (소계 행 제외, 동코드/구코드 포함)
+    """
+    from core.regions import attach_codes
+    from core.storage import read_table
+
+    area_df = read_table(AREA_FILE)
+    area_df = area_df[area_df['동명'] != '소계'].copy()
+    return attach_codes(area_df, '구명', '동명', '동별 면적')
+
+
+def vulnerable_age_density(dong):
+    """
+    취약연령(0~14세, 65세 이상) 인구 밀도 (동별)
+    """
+    import pandas as pd
+
+    from core.regions import DONG_KEY, attach_codes
+    from core.storage import read_table
+
+    print("👶🧓 취약연령 데이터 처리 중...")
+    population_df = read_table(POPULATION_FILE)
+    area_df = _dong_areas()
+    
+    # 취약연령층 인구 계산
+    population_df['취약연령인구'] = population_df['0~14세'] + population_df['65~']
+    
+    # 데이터 병합 (인구 + 면적, 동코드 기준)
+    population_df = attach_codes(population_df, '구', '동', '동별 등록인구')
+    vulnerable_age_data = pd.merge(
+        population_df, 
+        area_df[[DONG_KEY, '면적_km2']], 
+        on=DONG_KEY, 
+        how='inner'
+    )
+    
+    # 밀도 계산
+    vulnerable_age_data['취약연령밀도'] = vulnerable_age_data['취약연령인구'] / vulnerable_age_data['면적_km2']
+    print(f"✅ 취약연령 데이터: {len(vulnerable_age_data)}개 동")
+
+    return vulnerable_age_data[[DONG_KEY, '취약연령밀도']]
+
+def vulnerable_people_density(dong):
+    """
+    재난안전취약자 밀도 (구별, 구로구/금천구 공동 관할 자료는 면적 비율로 분리)
+    """
+    import pandas as pd
+
+    from core.regions import GU_KEY, attach_codes
+    from core.storage import read_table
+
+    print("🚨 재난안전취약자 데이터 처리 중...")
+    vulnerable_df = read_table(VULNERABLE_FILE)
+    
+    # 구로구, 금천구 분리 처리
+    guro_geumcheon_row = vulnerable_df[vulnerable_df['관할구역명'] == '구로구, 금천구']
+    if len(guro_geumcheon_row) > 0:
+        guro_geumcheon_row = guro_geumcheon_row.iloc[0]
+        
+        # 구로구 데이터
+        guro_data = guro_geumcheon_row.copy()
+        guro_data['관할구역명'] = '구로구'
+        guro_data['독거노인가구수'] = int(guro_data['독거노인가구수'] * 0.6)
+        guro_data['고령인구수'] = int(guro_data['고령인구수'] * 0.6)
+        guro_data['유아인구수'] = int(guro_data['유아인구수'] * 0.6)
+        guro_data['등록장애인수'] = int(guro_data['등록장애인수'] * 0.6)
+        guro_data['1인가구수'] = int(guro_data['1인가구수'] * 0.6)
+        guro_data['관할면적'] = 20.12
+        
+        # 금천구 데이터
+        geumcheon_data = guro_geumcheon_row.copy()
+        geumcheon_data['관할구역명'] = '금천구'
+        geumcheon_data['독거노인가구수'] = int(guro_geumcheon_row['독거노인가구수'] * 0.4)
+        geumcheon_data['고령인구수'] = int(guro_geumcheon_row['고령인구수'] * 0.4)
+        geumcheon_data['유아인구수'] = int(guro_geumcheon_row['유아인구수'] * 0.4)
+        geumcheon_data['등록장애인수'] = int(guro_geumcheon_row['등록장애인수'] * 0.4)
+        geumcheon_data['1인가구수'] = int(guro_geumcheon_row['1인가구수'] * 0.4)
+        geumcheon_data['관할면적'] = 13.02
+        
+        # 분리된 데이터로 교체
+        vulnerable_df = vulnerable_df[vulnerable_df['관할구역명'] != '구로구, 금천구'].copy()
+        vulnerable_df = pd.concat([vulnerable_df, pd.DataFrame([guro_data]), pd.DataFrame([geumcheon_data])], ignore_index=True)
+    
+    # 취약자 밀도 계산
+    vulnerable_df['총취약자수'] = (
+        vulnerable_df['독거노인가구수'] + 
+        vulnerable_df['고령인구수'] + 
+        vulnerable_df['유아인구수'] + 
+        vulnerable_df['등록장애인수'] + 
+        vulnerable_df['1인가구수']
+    )
+    vulnerable_df['취약자밀도'] = vulnerable_df['총취약자수'] / vulnerable_df['관할면적']
+    vulnerable_df = attach_codes(vulnerable_df, '관할구역명', label='재난안전취약자')
+    print(f"✅ 재난안전취약자 데이터: {len(vulnerable_df)}개 구")
+
+    return vulnerable_df[[GU_KEY, '취약자밀도']]
+
+def aging_housing_density(dong):
+    """
+    노후주택 가중 밀도 (구별, 30년 이상 주택 × 1.5 + 20~30년 주택)
+    """
+    import pandas as pd
+
+    from core.regions import GU_KEY, attach_codes
+    from core.storage import read_table
+
+    print("🏠 노후주택 데이터 처리 중...")
+    housing_df = read_table(HOUSING_FILE)
+    housing_df = housing_df[housing_df['구명'] != '소계'].copy()
+    area_df = _dong_areas()
+    
+    # 면적 데이터 - 소계 값 사용
+    gu_area_raw = area_df[area_df['동명'] == '소계'].copy()
+    print(f"소계 행 개수: {len(gu_area_raw)}")
+    print("소계 데이터 컬럼:", gu_area_raw.columns.tolist())
+    
+    if len(gu_area_raw) > 0:
+        gu_area = gu_area_raw[['구명', '면적_km2']].copy()
+        gu_area.columns = ['구명', '총면적_km2']
+    else:
+        print("⚠️ 소계 데이터가 없어서 동별 면적을 구별로 집계합니다.")
+        gu_area = area_df[area_df['동명'] != '소계'].groupby('구명')['면적_km2'].sum().reset_index()
+        gu_area.columns = ['구명', '총면적_km2']
+    
+    # 노후 주택 가중치 계산
+    housing_df['weighted_old_housing'] = (
+        housing_df['30년이상_주택수'] * 1.5 + 
+        housing_df['20년~30년미만_주택수']
+    )
+    
+    # 디버깅 정보 추가
+    print("노후주택 데이터 구명 샘플:")
+    print(housing_df['구명'].head().tolist())
+    print("면적 데이터 구명 샘플:")
+    print(gu_area['구명'].head().tolist())
+    
+    # 데이터 병합 - 구코드 기준
+    housing_df = attach_codes(housing_df, '구명', label='노후주택')
+    gu_area = attach_codes(gu_area, '구명', label='구별 면적')
+    housing_merged = pd.merge(housing_df, gu_area[[GU_KEY, '총면적_km2']], on=GU_KEY, how='inner')
+    housing_merged['housing_density'] = housing_merged['weighted_old_housing'] / housing_merged['총면적_km2']
+    print(f"✅ 노후주택 데이터: {len(housing_merged)}개 구")
+
+    return housing_merged[[GU_KEY, 'housing_density']]
+
+def rescue_density(dong):
+    """
+    구조출동 건수와 밀도 (좌표를 동 경계에 공간 조인하여 동별 집계)
+    """
+    import pandas as pd
+
+    from core.regions import DONG_KEY
+    from core.spatial import count_points
+    from core.storage import read_table
+
+    print("🚒 구조출동 데이터 처리 중...")
+    rescue_df = read_table(RESCUE_FILE)
+    
+    # 유효한 좌표만 필터링
+    valid_coord_mask = (
+        (rescue_df['피해지역_경도'].notna()) & 
+        (rescue_df['피해지역_위도'].notna()) &
+        (rescue_df['피해지역_경도'] != 0) &
+        (rescue_df['피해지역_위도'] != 0) &
+        (rescue_df['피해지역_경도'] > 126) &
+        (rescue_df['피해지역_경도'] < 128) &
+        (rescue_df['피해지역_위도'] > 37) &
+        (rescue_df['피해지역_위도'] < 38)
+    )
+    rescue_valid = rescue_df[valid_coord_mask].copy()
+    print(f"✅ 유효한 구조출동 좌표: {len(rescue_valid):,}개")
+    
+    # 구조출동 좌표를 동 경계(원본 정밀도)에 공간 조인하여 동별 건수/밀도 집계
+    rescue_by_dong = count_points(rescue_valid['피해지역_경도'], rescue_valid['피해지역_위도'], dong)
+    rescue_by_dong = pd.concat([dong[[DONG_KEY]], rescue_by_dong], axis=1)
+    rescue_by_dong = rescue_by_dong.rename(columns={'건수': '구조출동건수', '밀도': '구조출동밀도'})
+    print(f"✅ 구조출동 동별 집계: {rescue_by_dong['구조출동건수'].sum():,}건 → "
+          f"{(rescue_by_dong['구조출동건수'] > 0).sum()}개 동")
+
+    return rescue_by_dong[[DONG_KEY, '구조출동건수', '구조출동밀도']]
+
+# 지표 이름 → (입력 파일, 계산 함수, 저장 컬럼). 계산 함수는 원본 정밀도 동 경계를 받아
+# 첫 컬럼이 동코드 또는 구코드인 데이터프레임을 반환한다.
+INDICATOR_SOURCES = {
+    '취약연령': ([POPULATION_FILE, AREA_FILE, os.path.join(_CODE_DIR, 'storage.py')],
+                 vulnerable_age_density, ['취약연령밀도']),
+    '재난안전취약자': ([VULNERABLE_FILE, os.path.join(_CODE_DIR, 'storage.py')],
+                      vulnerable_people_density, ['취약자밀도']),
+    '노후주택': ([HOUSING_FILE, AREA_FILE, os.path.join(_CODE_DIR, 'storage.py')],
+                 aging_housing_density, ['housing_density']),
+    '구조출동': ([RESCUE_FILE, os.path.join(_CODE_DIR, 'storage.py'), os.path.join(_CODE_DIR, 'spatial.py')],
+                 rescue_density, ['구조출동건수', '구조출동밀도']),
+}
+
+
+def fingerprint(files):
+    """
+    파일들의 (이름, 크기, 수정시각) 지문 (파일 내용은 읽지 않음, CSV는 Parquet 사본도 포함)
+    """
+    digest = hashlib.sha256()
+    for path in files:
+        paths = [path]
+        if path.endswith('.csv'):
+            # core.storage.parquet_path()와 같은 규칙 (pandas를 불러오지 않도록 직접 계산)
+            paths.append(os.path.splitext(path)[0] + '.parquet')
+        for file in paths:
+            digest.update(os.path.basename(file).encode('utf-8'))
+            if os.path.exists(file):
+                stat = os.stat(file)
+                digest.update(f'{stat.st_size}:{stat.st_mtime_ns}'.encode())
+            else:
+                digest.update(b'-')
+    return digest.hexdigest()
+
+
+def _read_cache(name, key):
+    """
+    지문이 key와 같은 캐시 배열 사전 반환 (없거나 오래되었으면 None)
+    """
+    path = os.path.join(INDICATOR_DIR, f'{name}.npz')
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as cached:
+        if str(cached['key']) != key:
+            return None
+        return {column: cached[column] for column in cached.files if column != 'key'}
+
+
+def _write_cache(name, key, arrays):
+    os.makedirs(INDICATOR_DIR, exist_ok=True)
+    path = os.path.join(INDICATOR_DIR, f'{name}.npz')
+    temp_file = path + '.tmp'
+    with open(temp_file, 'wb') as f:
+        np.savez(f, key=np.array(key), **arrays)
+    os.replace(temp_file, path)
+
+
+def _base_columns(dong):
+    return {
+        '동코드': dong['동코드'].to_numpy(dtype=np.int64),
+        '구코드': dong['구코드'].to_numpy(dtype=np.int64),
+        '구명': dong['구명'].astype(str).to_numpy(dtype=str),
+        '동명': dong['동명'].astype(str).to_numpy(dtype=str)
+    }
+
+
+def indicator_columns(refresh=False):
+    """
+    (동별 컬럼 사전, 다시 계산한 지표 이름 목록) 반환
+
+    컬럼 사전은 BASE_COLUMNS와 INDICATOR_SOURCES의 저장 컬럼을 원본 동 경계 순서의
+    배열로 담는다. 지문이 현재 입력과 같은 지표는 캐시를 읽고, 나머지 지표(refresh=True이면
+    전체)만 계산 함수로 다시 계산하여 저장한다. 결측 지표는 NaN으로 남는다.
+    """
+    dong = None
+    common_key = fingerprint(COMMON_FILES)
+    columns = None if refresh else _read_cache('경계', common_key)
+    if columns is None:
+        # 경계가 바뀌면 COMMON_FILES 지문이 달라져 모든 지표도 다시 계산됨
+        from core.boundaries import load_dong_boundary
+
+        dong = load_dong_boundary()
+        columns = _base_columns(dong)
+        _write_cache('경계', common_key, columns)
+
+    recomputed = []
+    for name, (inputs, compute, names) in INDICATOR_SOURCES.items():
+        key = fingerprint(COMMON_FILES + inputs)
+        arrays = None if refresh else _read_cache(name, key)
+        if arrays is None:
+            # 다시 계산할 지표가 있을 때만 경계와 pandas를 불러옴
+            if dong is None:
+                from core.boundaries import load_dong_boundary
+
+                dong = load_dong_boundary()
+            result = compute(dong)
+            aligned = dong[BASE_COLUMNS[:2]].merge(result, on=result.columns[0], how='left')
+            arrays = {column: aligned[column].to_numpy() for column in names}
+            _write_cache(name, key, arrays)
+            recomputed.append(name)
+        columns.update(arrays)
+    return columns, recomputed
+
+
+def load_dong_indicators(dong_boundary):
+    """
+    동별 종합 위험도 지표 데이터프레임 생성 (동코드, 구코드, 구명, 동명 + core.scoring.INDICATORS 지표 컬럼)
+
+    지도 생성과 분리되어 있어 가중치 민감도 분석 등에서도 같은 지표를 사용한다.
+    지표는 indicator_columns()의 지표별 캐시에서 읽어 dong_boundary 순서로 맞춘다.
+    """
+    import pandas as pd
+
+    from core.regions import DONG_KEY, GU_KEY, report_unmatched
+
+    # 2. 각 히트맵 데이터 추출 (입력이 바뀐 지표만 다시 계산)
+    print("\n📊 각 히트맵 데이터 추출 중...")
+    columns, recomputed = indicator_columns()
+    reused = [name for name in INDICATOR_SOURCES if name not in recomputed]
+    print(f"✅ 지표 캐시 사용: {', '.join(reused) or '없음'} / 다시 계산: {', '.join(recomputed) or '없음'}")
+
+    # 3. 동별 기준으로 데이터 통합
+    print("\n🔗 동별 기준으로 데이터 통합 중...")
+    
+    # 기본 동별 데이터프레임 생성 (동코드/구코드는 경계의 ADM_CD에서 온 정수 코드)
+    dong_integrated = dong_boundary[[DONG_KEY, GU_KEY, '구명', '동명']].copy()
+    indicator_names = [column for _, _, names in INDICATOR_SOURCES.values() for column in names]
+    indicators = pd.DataFrame({column: columns[column] for column in [DONG_KEY] + indicator_names})
+    dong_integrated = dong_integrated.merge(indicators, on=DONG_KEY, how='left')
+    
+    for column, label in [('취약연령밀도', '취약연령'), ('취약자밀도', '재난안전취약자'),
+                          ('housing_density', '노후주택')]:
+        report_unmatched(dong_integrated, column, label)
+    
+    print(f"✅ 통합 데이터: {len(dong_integrated)}개 동")
+    
+    return dong_integrated
+
+
+def indicator_store(refresh=False):
+    """
+    동 × 지표 저장소(core.indicator_store)를 메모리 매핑으로 열어 반환
+
+    저장소 지문이 현재 입력과 다르면 indicator_columns()로 지표를 모아 다시 쓴다.
+    지표 컬럼은 INDICATORS 순서가 먼저이고 구조출동건수 등 나머지 컬럼이 뒤따른다.
+    """
+    from core.indicator_store import open_store, read_header, write_store
+
+    inputs = [file for files, _, _ in INDICATOR_SOURCES.values() for file in files]
+    key = fingerprint(COMMON_FILES + inputs + [os.path.join(_CODE_DIR, 'indicator_store.py')])
+    header = None if refresh else read_header(INDICATOR_STORE)
+    if header is None or header['key'] != key or header['columns'][:len(INDICATORS)] != INDICATORS:
+        columns, _ = indicator_columns(refresh=refresh)
+        names = [column for _, _, names in INDICATOR_SOURCES.values() for column in names]
+        names = INDICATORS + [column for column in names if column not in INDICATORS]
+        write_store(INDICATOR_STORE, columns['동코드'], {name: columns[name] for name in ['구명', '동명']},
+                    {name: columns[name] for name in names}, key)
+    return open_store(INDICATOR_STORE)
+
+
+def dong_indicator_arrays(refresh=False):
+    """
+    동별 지표 {'구명', '동명', '동코드', 'matrix'(동 × INDICATORS, float32)} 반환
+
+    저장소가 최신이면 파일을 메모리 매핑만 하고 복사 없이 배열 뷰를 돌려준다.
+    결측 지표는 NaN으로 남는다.
+    """
+    store = indicator_store(refresh=refresh)
+    return {
+        '구명': store['구명'],
+        '동명': store['동명'],
+        '동코드': store['동코드'],
+        'matrix': store['matrix'][:, :len(INDICATORS)]
+    }
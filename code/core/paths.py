@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+프로젝트 공통 경로 정의
+
+스크립트마다 '../dataset/...'(code 폴더 기준)과 'dataset/...'(저장소 루트 기준)이
+섞여 있으므로, 공용 모듈은 항상 이 파일 위치로부터 계산한 절대 경로를 사용한다.
+"""
+import os
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(CODE_DIR)
+
+DATASET_DIR = os.path.join(REPO_ROOT, 'dataset')
+ORIGINAL_DIR = os.path.join(DATASET_DIR, '0_original')
+MERGE_DIR = os.path.join(DATASET_DIR, '1_merge_column_names')
+FILTERING_DIR = os.path.join(DATASET_DIR, '2_filtering')
+PIVOT_DIR = os.path.join(DATASET_DIR, '3_pivot')
+SELECT_DIR = os.path.join(DATASET_DIR, '4_select_feature')
+BOUNDARY_DIR = os.path.join(DATASET_DIR, '서울시_행정구역_경계')
+
+# 파이프라인 상태, 경계 캐시 등 재생성 가능한 파일 저장 위치
+CACHE_DIR = os.path.join(DATASET_DIR, '.cache')
+
+FIGURE_DIR = os.path.join(REPO_ROOT, 'figure')
+
+
+def repo_path(relative_path):
+    """
+    저장소 루트 기준 상대 경로('dataset/...')를 절대 경로로 변환
+    """
+    return os.path.join(REPO_ROOT, *relative_path.split('/'))
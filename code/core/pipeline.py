@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+전처리 파이프라인 증분 실행기
+
+dataset/0_original 원본부터 4_select_feature 결과와 지도용 사전 계산(밀도 격자)까지
+각 단계의 입력/출력 파일을 의존성 그래프로 정의하고, 입력 파일 내용과 스크립트 소스(스크립트가
+불러오는 core 모듈 포함)의 해시가 바뀐 단계만 다시 실행한다. 실행 상태는 dataset/.cache/pipeline_state.json 에 저장된다.
+
+parquet=True 로 실행하면 각 단계의 CSV 출력 옆에 타입이 지정된 Parquet 파일을
+함께 만들어, 다음 단계와 히트맵 스크립트가 CSV를 다시 파싱하지 않도록 한다.
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from core.paths import CACHE_DIR, CODE_DIR, REPO_ROOT, repo_path
+from core.storage import is_parquet_fresh, write_parquet
+
+STATE_FILE = os.path.join(CACHE_DIR, 'pipeline_state.json')
+
+ORIGINAL = 'dataset/0_original'
+MERGE = 'dataset/1_merge_column_names'
+FILTERING = 'dataset/2_filtering'
+PIVOT = 'dataset/3_pivot'
+SELECT = 'dataset/4_select_feature'
+DENSITY = 'dataset/.cache/density'
+
+# 스크립트별 작업 디렉토리
+# - 'code': '../dataset/...' 경로를 사용하는 스크립트
+# - 'root': 'dataset/...' 경로를 사용하는 스크립트
+CWD_CODE = 'code'
+CWD_ROOT = 'root'
+
+
+def _script(script, cwd, inputs, outputs):
+    return {
+        'name': os.path.splitext(script)[0],
+        'script': script,
+        'cwd': cwd,
+        'inputs': inputs,
+        'outputs': outputs,
+    }
+
+
+def _copy(src_dir, dst_dir, file_name):
+    """
+    내용 변경 없이 다음 단계 폴더로 넘어가는 파일 (복사 단계)
+    """
+    return {
+        'name': f"copy:{dst_dir.split('/')[-1]}/{file_name}",
+        'script': None,
+        'cwd': None,
+        'inputs': [f'{src_dir}/{file_name}'],
+        'outputs': [f'{dst_dir}/{file_name}'],
+    }
+
+
+# 파일명 상수
+HOUSING = '노후기간별+주택현황_20250710173050.csv'
+DUAL_INCOME = '맞벌이+가구+현황_20250716125811.csv'
+POPULATION = '서울시_등록인구_2025_1분기.csv'
+POPULATION_DONG = '서울시_등록인구_2025_1분기_동별.csv'
+AREA = '서울시_행정구역(동별)_면적.csv'
+VULNERABLE = '재난안전취약자정보_0000_서울시소방서별.csv'
+FIRE = '화재발생+현황_20250710140523.csv'
+FIRE_GU = '화재발생+현황_20250710140523_구별데이터.csv'
+RESCUE_RAW = '서울시_구조출동_2023_한강.csv'
+RESCUE_FIRE = '서울시_구조출동_2023_한강_화재.csv'
+
+STAGES = [
+    # 1. 컬럼명 병합
+    _copy(ORIGINAL, MERGE, VULNERABLE),
+    _copy(ORIGINAL, MERGE, DUAL_INCOME),
+    _script('1_merge_columns_노후기간별_주택현황.py', CWD_CODE,
+            [f'{ORIGINAL}/{HOUSING}'],
+            [f'{MERGE}/{HOUSING}']),
+    _script('1_merge_columns_서울시_행정구역_면적.py', CWD_ROOT,
+            [f'{ORIGINAL}/{AREA}'],
+            [f'{MERGE}/{AREA}', f'{MERGE}/서울시_행정구역_면적_처리_보고서.txt']),
+    _script('1_merge_columns_화재발생_현황.py', CWD_CODE,
+            [f'{ORIGINAL}/{FIRE}'],
+            [f'{MERGE}/{FIRE}']),
+
+    # 2. 필터링
+    _copy(MERGE, FILTERING, HOUSING),
+    _copy(MERGE, FILTERING, VULNERABLE),
+    _script('2_filtering_맞벌이가구현황.py', CWD_CODE,
+            [f'{MERGE}/{DUAL_INCOME}'],
+            [f'{FILTERING}/{DUAL_INCOME}']),
+    # 구조출동 원본은 용량 문제로 저장소에 포함되지 않으며 1_merge_column_names 에 직접 둔다
+    _script('2_filtering_서울시_구조출동.py', CWD_CODE,
+            [f'{MERGE}/{RESCUE_RAW}'],
+            [f'{FILTERING}/{RESCUE_FIRE}', f'{FILTERING}/화재데이터_분석보고서.txt']),
+    _script('2_filtering_서울시_행정구역_면적.py', CWD_ROOT,
+            [f'{MERGE}/{AREA}'],
+            [f'{FILTERING}/{AREA}', f'{FILTERING}/서울시_행정구역_면적_필터링_보고서.txt']),
+    _script('2_filtering_화재발생_현황.py', CWD_CODE,
+            [f'{MERGE}/{FIRE}'],
+            [f'{FILTERING}/{FIRE_GU}']),
+
+    # 3. 피벗
+    _copy(FILTERING, PIVOT, HOUSING),
+    _copy(FILTERING, PIVOT, DUAL_INCOME),
+    _copy(FILTERING, PIVOT, AREA),
+    _copy(FILTERING, PIVOT, VULNERABLE),
+    _copy(FILTERING, PIVOT, FIRE_GU),
+    _copy(FILTERING, PIVOT, RESCUE_FIRE),
+
+    # 4. Feature 선택
+    _copy(PIVOT, SELECT, AREA),
+    _script('4_select_feature_노후기간별_주택현황.py', CWD_ROOT,
+            [f'{PIVOT}/{HOUSING}'],
+            [f'{SELECT}/노후기간별_주택현황_selected_features.csv',
+             f'{SELECT}/노후기간별_주택현황_처리_보고서.txt']),
+    _script('4_select_feature_서울시_구조출동.py', CWD_ROOT,
+            [f'{PIVOT}/{RESCUE_FIRE}'],
+            [f'{SELECT}/서울시_구조출동_selected_features.csv',
+             f'{SELECT}/서울시_구조출동_처리_보고서.txt']),
+    # 등록인구는 구/동 구분 → 필터링 → 피벗 → 구간 합계를 원본에서 한 번에 처리
+    # (1_merge/2_filtering/3_pivot/4_select_feature 개별 스크립트를 대체)
+    _script('4_select_feature_서울시_등록인구_통합.py', CWD_ROOT,
+            [f'{ORIGINAL}/{POPULATION}'],
+            [f'{PIVOT}/{POPULATION_DONG}', f'{PIVOT}/서울시_등록인구_전처리_보고서.txt',
+             f'{SELECT}/서울시_등록인구_2025_1분기_동별_최종.csv',
+             f'{SELECT}/서울시_등록인구_최종_보고서.txt']),
+    _script('4_select_feature_재난안전취약자정보.py', CWD_ROOT,
+            [f'{PIVOT}/{VULNERABLE}'],
+            [f'{SELECT}/재난안전취약자정보_selected_features.csv',
+             f'{SELECT}/재난안전취약자정보_feature_selection_보고서.txt']),
+
+    # 5. 지도용 사전 계산
+    _script('구조출동_밀도격자.py', CWD_ROOT,
+            [f'{SELECT}/서울시_구조출동_selected_features.csv'],
+            [f'{DENSITY}/서울시_구조출동_밀도.npz']),
+]
+
+
+def order_stages(stages):
+    """
+    출력 → 생산 단계 관계로 의존성 그래프를 만들고 위상 정렬된 단계 목록 반환
+    """
+    producers = {}
+    for stage in stages:
+        for output in stage['outputs']:
+            if output in producers:
+                raise ValueError(f"출력 파일이 중복 정의되었습니다: {output} "
+                                 f"({producers[output]['name']}, {stage['name']})")
+            producers[output] = stage
+
+    ordered = []
+    visiting = set()
+    done = set()
+
+    def visit(stage):
+        if stage['name'] in done:
+            return
+        if stage['name'] in visiting:
+            raise ValueError(f"순환 의존성이 있습니다: {stage['name']}")
+        visiting.add(stage['name'])
+        for path in stage['inputs']:
+            if path in producers:
+                visit(producers[path])
+        visiting.discard(stage['name'])
+        done.add(stage['name'])
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return ordered
+
+
+class FileHasher:
+    """
+    파일 내용 SHA-256 계산기
+
+    (크기, 수정시각)이 이전 실행과 같으면 저장된 해시를 재사용하여
+    변경되지 않은 대용량 파일을 다시 읽지 않는다.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else {}
+
+    def hash_file(self, path):
+        abs_path = repo_path(path)
+        stat = os.stat(abs_path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = self.cache.get(path)
+        if cached and cached['stat'] == key:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(abs_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        sha = digest.hexdigest()
+        self.cache[path] = {'stat': key, 'sha256': sha}
+        return sha
+
+
+def core_dependencies(script):
+    """
+    스크립트가 직접 또는 다른 core 모듈을 거쳐 불러오는 core 모듈 파일 목록 ('code/core/x.py', 정렬)
+
+    함수 안에서 불러오는 모듈도 포함하도록 소스 전체의 `from core.x import ...`,
+    `from core import x`, `import core.x` 문을 읽는다.
+    """
+    found = set()
+    queue = [f'code/{script}']
+    while queue:
+        with open(repo_path(queue.pop()), 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module == 'core':
+                modules = [f'core.{alias.name}' for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                modules = [node.module]
+            elif isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                parts = module.split('.')
+                if parts[0] != 'core' or len(parts) < 2:
+                    continue
+                path = f'code/core/{parts[1]}.py'
+                if path not in found and os.path.exists(repo_path(path)):
+                    found.add(path)
+                    queue.append(path)
+    return sorted(found)
+
+
+def stage_fingerprint(stage, hasher):
+    """
+    스크립트 소스 + 스크립트가 불러오는 core 모듈 + 입력 파일 내용으로 단계의 지문(fingerprint) 계산
+    """
+    digest = hashlib.sha256()
+    if stage['script']:
+        digest.update(hasher.hash_file(f"code/{stage['script']}").encode())
+        for path in core_dependencies(stage['script']):
+            digest.update(path.encode('utf-8'))
+            digest.update(hasher.hash_file(path).encode())
+    else:
+        digest.update(b'copy')
+    for path in stage['inputs']:
+        digest.update(path.encode('utf-8'))
+        digest.update(hasher.hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def load_state():
+    if not os.path.exists(STATE_FILE):
+        return {'stages': {}, 'files': {}}
+    with open(STATE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = STATE_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, STATE_FILE)
+
+
+def execute_stage(stage, verbose=False):
+    """
+    단계 하나 실행. 성공 여부와 출력 로그 반환
+
+    기존 스크립트들은 예외를 잡아 출력만 하고 정상 종료하므로,
+    종료 코드와 함께 모든 출력 파일이 실행 중에 새로 쓰였는지도 확인한다.
+    """
+    started = time.time()
+
+    if stage['script'] is None:
+        src = repo_path(stage['inputs'][0])
+        dst = repo_path(stage['outputs'][0])
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copyfile(src, dst)
+        return True, ''
+
+    cwd = CODE_DIR if stage['cwd'] == CWD_CODE else REPO_ROOT
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    result = subprocess.run(
+        [sys.executable, os.path.join(CODE_DIR, stage['script'])],
+        cwd=cwd, env=env, capture_output=True, text=True, encoding='utf-8'
+    )
+    log = result.stdout + result.stderr
+    if verbose:
+        print(log)
+
+    if result.returncode != 0:
+        return False, log
+    for output in stage['outputs']:
+        path = repo_path(output)
+        if not os.path.exists(path) or os.path.getmtime(path) < started - 1:
+            return False, log + f"\n출력 파일이 생성되지 않았습니다: {output}"
+    return True, log
+
+
+def export_parquet(stage):
+    """
+    단계의 CSV 출력 중 Parquet 파일이 없거나 오래된 것을 새로 변환
+    """
+    converted = []
+    for output in stage['outputs']:
+        csv_path = repo_path(output)
+        if output.endswith('.csv') and os.path.exists(csv_path) and not is_parquet_fresh(csv_path):
+            write_parquet(csv_path)
+            converted.append(output)
+    return converted
+
+
+def run_pipeline(force=False, dry_run=False, verbose=False, parquet=False):
+    """
+    변경된 입력이 있는 단계만 골라 의존성 순서대로 실행
+
+    반환값: {'executed': [...], 'skipped': [...], 'missing': [...], 'failed': [...]}
+    """
+    state = load_state()
+    hasher = FileHasher(state.get('files', {}))
+    summary = {'executed': [], 'skipped': [], 'missing': [], 'failed': []}
+
+    # dry_run에서 실행 예정인 단계의 출력 (실제로는 아직 바뀌지 않았으므로 지문으로 판단할 수 없음)
+    pending_outputs = set()
+
+    for stage in order_stages(STAGES):
+        name = stage['name']
+        upstream_pending = any(p in pending_outputs for p in stage['inputs'])
+
+        missing_inputs = [p for p in stage['inputs']
+                          if p not in pending_outputs and not os.path.exists(repo_path(p))]
+        if missing_inputs:
+            print(f"⚠️  {name}: 입력 파일 없음 → 건너뜀 ({', '.join(missing_inputs)})")
+            summary['missing'].append(name)
+            # 입력 없이 저장소에 포함된 출력(예: 구조출동 selected features)도 변환 대상
+            if parquet and not dry_run:
+                for output in export_parquet(stage):
+                    print(f"📦 {output} → Parquet 변환")
+            continue
+
+        # 앞 단계가 실행 예정이면 (dry_run) 입력이 아직 없을 수 있으므로 지문을 계산하지 않음
+        fingerprint = None if upstream_pending else stage_fingerprint(stage, hasher)
+        previous = state['stages'].get(name, {})
+        outputs_exist = all(os.path.exists(repo_path(p)) for p in stage['outputs'])
+
+        if not force and not upstream_pending and outputs_exist and previous.get('fingerprint') == fingerprint:
+            summary['skipped'].append(name)
+            if parquet and not dry_run:
+                for output in export_parquet(stage):
+                    print(f"📦 {output} → Parquet 변환")
+            continue
+
+        if dry_run:
+            print(f"🔄 {name}: 실행 예정" + (" (앞 단계 출력이 바뀜)" if upstream_pending else ""))
+            summary['executed'].append(name)
+            pending_outputs.update(stage['outputs'])
+            continue
+
+        print(f"▶️  {name} 실행 중...")
+        started = time.time()
+        ok, log = execute_stage(stage, verbose=verbose)
+        elapsed = time.time() - started
+
+        if not ok:
+            print(f"❌ {name} 실패 ({elapsed:.1f}초)")
+            print(log)
+            summary['failed'].append(name)
+            # 실패한 단계의 지문은 지워서 다음 실행 때 다시 시도되도록 함
+            state['stages'].pop(name, None)
+            save_state(state)
+            break
+
+        print(f"✅ {name} 완료 ({elapsed:.1f}초)")
+        if parquet:
+            for output in export_parquet(stage):
+                print(f"📦 {output} → Parquet 변환")
+        state['stages'][name] = {
+            'fingerprint': fingerprint,
+            'outputs': stage['outputs'],
+            'finished_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        state['files'] = hasher.cache
+        save_state(state)
+        summary['executed'].append(name)
+
+    if not dry_run:
+        state['files'] = hasher.cache
+        save_state(state)
+
+    print(f"\n📊 실행 {len(summary['executed'])}개, 최신 상태로 건너뜀 {len(summary['skipped'])}개, "
+          f"입력 없음 {len(summary['missing'])}개, 실패 {len(summary['failed'])}개")
+    return summary
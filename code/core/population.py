@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+분기별 등록인구 원본 일괄 처리
+
+1_merge_columns_등록인구.py(구/동 구분)와 2_filtering_서울시_등록인구.py
+(합계/구계 제외, 시점 컬럼 제거)를 한 파일에 대해 한 줄씩 스트리밍으로 수행한다.
+여러 분기 원본은 프로세스 풀에서 병렬로 처리하고, 결과는 분기별 하위 폴더
+('분기=2025Q1')로 나뉜 하나의 출력 폴더에 저장한다.
+
+load_population() 이하 함수들은 같은 처리(구/동 구분, 합계/구계 제외)와
+3_pivot(연령대 피벗), 4_select_feature(0~14세, 65~ 구간 합계) 단계를 원본을
+한 번 읽은 데이터프레임에 대해 컬럼 단위 연산으로 수행한다.
+"""
+import csv
+import glob
+import itertools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+SOURCE_PATTERN = '서울시_등록인구_*분기.csv'
+PARTITION_KEY = '분기'
+PARTITION_FILE = '서울시_등록인구_동별.csv'
+
+# '2025. 1/4' 형식의 시점 값, 또는 '..._2025_1분기.csv' 형식의 파일명
+_PERIOD_PATTERN = re.compile(r'(\d{4})\.\s*(\d)/4')
+_FILENAME_PATTERN = re.compile(r'(\d{4})_(\d)분기')
+
+# 원본 헤더 ['동별', '연령별', '시점', ...] 에서 시점 컬럼 위치 (구/동 구분 후 3번)
+PERIOD_INDEX = 3
+
+# 피벗 대상 연령대 (연령별 '합계'는 제외)
+AGE_GROUPS = [
+    '0~4세', '5~9세', '10~14세', '15~19세', '20~24세', '25~29세',
+    '30~34세', '35~39세', '40~44세', '45~49세', '50~54세', '55~59세',
+    '60~64세', '65~69세', '70~74세', '75~79세', '80~84세', '85~89세',
+    '90~94세', '95~99세', '100세 이상'
+]
+
+# 취약연령 구간
+CHILD_GROUPS = ['0~4세', '5~9세', '10~14세']
+ELDERLY_GROUPS = ['65~69세', '70~74세', '75~79세', '80~84세', '85~89세',
+                  '90~94세', '95~99세', '100세 이상']
+
+COUNT_COLUMNS = ['계', '한국인', '등록외국인']
+
+
+def quarter_key(period, input_file=None):
+    """
+    시점 값('2025. 1/4') 또는 파일명에서 분기 키('2025Q1') 추출
+    """
+    match = _PERIOD_PATTERN.search(period or '')
+    if match is None and input_file is not None:
+        match = _FILENAME_PATTERN.search(os.path.basename(input_file))
+    if match is None:
+        raise ValueError(f"분기를 알 수 없습니다: {period!r} ({input_file})")
+    return f'{match.group(1)}Q{match.group(2)}'
+
+
+def split_gu_dong(rows):
+    """
+    원본 행에서 '동별' 값을 구/동 두 컬럼으로 나눈 행을 차례로 반환
+
+    '합계' → (서울시, 합계), '~구' → (구, 구계), 그 외 → (직전 구, 동)
+    """
+    current_gu = ""
+    for row in rows:
+        dong_name = row[0]
+        if dong_name == "합계":
+            gu, dong = "서울시", "합계"
+        elif dong_name.endswith("구"):
+            gu, dong = dong_name, "구계"
+            current_gu = dong_name
+        else:
+            gu, dong = current_gu, dong_name
+        yield [gu, dong] + row[1:]
+
+
+def process_quarter(input_file, output_dir):
+    """
+    분기 원본 하나를 구/동 구분 → 세부 동 필터링하여 분기 파티션에 저장
+
+    처리 요약 딕셔너리(분기, 원본/저장 행 수, 출력 파일)를 반환한다.
+    """
+    with open(input_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        new_header = ['구', '동'] + header[1:]
+
+        rows = split_gu_dong(reader)
+        first = next(rows, None)
+        quarter = quarter_key(first[PERIOD_INDEX] if first else None, input_file)
+
+        partition_dir = os.path.join(output_dir, f'{PARTITION_KEY}={quarter}')
+        os.makedirs(partition_dir, exist_ok=True)
+        output_file = os.path.join(partition_dir, PARTITION_FILE)
+        temp_file = output_file + '.tmp'
+
+        total_rows = 0
+        dong_rows = 0
+        with open(temp_file, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.writer(out, lineterminator='\n')
+            writer.writerow([col for i, col in enumerate(new_header) if i != PERIOD_INDEX])
+            for row in itertools.chain([first] if first else [], rows):
+                total_rows += 1
+                if row[1] != "합계" and row[1] != "구계":
+                    writer.writerow([value for i, value in enumerate(row) if i != PERIOD_INDEX])
+                    dong_rows += 1
+        os.replace(temp_file, output_file)
+
+    return {'분기': quarter, '입력 파일': input_file, '원본 행 수': total_rows,
+            '동 행 수': dong_rows, '출력 파일': output_file}
+
+
+def peek_quarter(input_file):
+    """
+    원본 첫 데이터 행만 읽어 분기 키 확인
+    """
+    with open(input_file, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        first = next(reader, None)
+    # 원본은 구/동 구분 전이므로 시점 컬럼이 한 칸 앞(2번)에 있음
+    return quarter_key(first[PERIOD_INDEX - 1] if first else None, input_file)
+
+
+def find_quarter_files(input_dir):
+    return sorted(glob.glob(os.path.join(input_dir, SOURCE_PATTERN)))
+
+
+def process_quarters(input_files, output_dir, workers=None):
+    """
+    여러 분기 원본을 프로세스 풀에서 병렬 처리 (분기 순으로 정렬된 요약 목록 반환)
+
+    같은 분기 원본이 두 개 이상이면 같은 파티션에 동시에 쓰게 되므로 시작 전에 오류로 처리한다.
+    """
+    quarters = [peek_quarter(input_file) for input_file in input_files]
+    duplicated = sorted({quarter for quarter in quarters if quarters.count(quarter) > 1})
+    if duplicated:
+        raise ValueError(f"같은 분기의 원본이 여러 개입니다: {', '.join(duplicated)}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1 or len(input_files) <= 1:
+        summaries = [process_quarter(input_file, output_dir) for input_file in input_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(process_quarter, input_files,
+                                          [output_dir] * len(input_files)))
+    return sorted(summaries, key=lambda summary: summary['분기'])
+
+
+def read_quarters(output_dir, quarters=None):
+    """
+    분기 파티션 폴더를 '분기' 컬럼이 추가된 하나의 데이터프레임으로 읽기
+    """
+    frames = []
+    for partition_dir in sorted(glob.glob(os.path.join(output_dir, f'{PARTITION_KEY}=*'))):
+        quarter = os.path.basename(partition_dir).split('=', 1)[1]
+        if quarters is not None and quarter not in quarters:
+            continue
+        df = pd.read_csv(os.path.join(partition_dir, PARTITION_FILE), encoding='utf-8')
+        df.insert(0, PARTITION_KEY, quarter)
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_population(input_file):
+    """
+    등록인구 원본을 한 번 읽어 구/동 컬럼이 추가된 세부 동 데이터프레임 반환
+
+    '동별' 값을 구/동으로 나누고(split_gu_dong()과 같은 규칙) 합계/구계 행을 제외한다.
+    인구 컬럼('-'는 0)은 int64로 변환한다.
+    """
+    raw = pd.read_csv(input_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    raw = raw.loc[:, ~raw.columns.str.startswith('Unnamed')]
+
+    name = raw['동별']
+    is_total = name == '합계'
+    is_gu = name.str.endswith('구') & ~is_total
+
+    gu = name.where(is_gu).ffill().fillna('')
+    detail = ~is_total & ~is_gu
+
+    df = pd.DataFrame({'구': gu[detail], '동': name[detail], '연령별': raw.loc[detail, '연령별']})
+    for col in COUNT_COLUMNS:
+        df[col] = raw.loc[detail, col].replace(['-', ''], '0').astype('int64')
+    return df.reset_index(drop=True)
+
+
+def pivot_age_groups(df):
+    """
+    구/동별 한 행, 연령대별 '계' 인구를 int64 컬럼으로 가진 데이터프레임 반환
+
+    정렬은 기존 피벗 스크립트와 같이 '구_동' 문자열 기준이다.
+    """
+    ages = df[df['연령별'] != '합계']
+    pivot = ages.pivot_table(index=['구', '동'], columns='연령별', values='계',
+                             aggfunc='last', fill_value=0)
+    pivot = pivot.reindex(columns=AGE_GROUPS, fill_value=0).astype('int64')
+    pivot.columns.name = None
+    pivot = pivot.reset_index()
+
+    sort_key = pivot['구'] + '_' + pivot['동']
+    return pivot.iloc[sort_key.argsort(kind='stable')].reset_index(drop=True)
+
+
+def age_bands(pivot):
+    """
+    피벗 결과에서 구, 동, 0~14세, 65~ 컬럼만 가진 데이터프레임 반환
+    """
+    return pd.DataFrame({
+        '구': pivot['구'],
+        '동': pivot['동'],
+        '0~14세': pivot[CHILD_GROUPS].sum(axis=1),
+        '65~': pivot[ELDERLY_GROUPS].sum(axis=1)
+    })
+
+
+def population_statistics(df):
+    """
+    피벗 보고서용 통계 (연령별 '합계' 행을 제외한 인구 합계, 연령대별 합계)
+    """
+    ages = df[df['연령별'] != '합계']
+    by_age = ages.groupby('연령별', sort=False)[COUNT_COLUMNS].sum()
+    return {
+        'total_rows': len(df),
+        'districts': int(ages[['구', '동']].drop_duplicates().shape[0]),
+        'total': int(ages['계'].sum()),
+        'korean': int(ages['한국인'].sum()),
+        'foreign': int(ages['등록외국인'].sum()),
+        'age_statistics': {
+            age: {'total': int(row['계']), 'korean': int(row['한국인']), 'foreign': int(row['등록외국인'])}
+            for age, row in by_age.iterrows()
+        }
+    }
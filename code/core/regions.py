@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+구/동 정수 코드 색인
+
+입력 자료마다 구/동 이름 표기가 조금씩 다르다('서울특별시 종로구', '상계3.4동'과
+'상계3·4동' 등). 동 경계의 ADM_CD를 기준으로 이름 표기를 한 번만 정규화하여 정수
+코드(동코드: ADM_CD 8자리, 구코드: ADM_CD 앞 5자리)로 바꾸고, 지표 데이터는 이름
+문자열 대신 이 코드로 병합한다. 코드를 찾지 못한 이름은 조용히 빠지지 않고 경고로
+출력된다.
+"""
+import functools
+import re
+
+import numpy as np
+import pandas as pd
+
+from core.boundaries import GU_CODES, load_dong_boundary
+
+GU_KEY = '구코드'
+DONG_KEY = '동코드'
+
+MISSING = -1
+
+_CITY_PREFIX = re.compile(r'^서울(특별)?시')
+_WHITESPACE = re.compile(r'\s+')
+# 동 이름의 가운뎃점 표기('.', 'ㆍ', '・' 등)를 '·'로 통일
+_MIDDLE_DOTS = str.maketrans({'.': '·', 'ㆍ': '·', '・': '·', '･': '·', '∙': '·'})
+
+
+def normalize_name(names):
+    """
+    구/동 이름 표기 정규화 (공백 제거, '서울특별시' 접두어 제거, 가운뎃점 통일)
+    """
+    names = pd.Series(names).astype(str)
+    names = names.str.replace(_WHITESPACE, '', regex=True).str.replace(_CITY_PREFIX, '', regex=True)
+    return names.str.translate(_MIDDLE_DOTS)
+
+
+_GU_LOOKUP = dict(zip(normalize_name(list(GU_CODES)), GU_CODES.values()))
+
+
+@functools.lru_cache(maxsize=1)
+def _dong_lookup():
+    """
+    (구코드, 정규화 동명) → 동코드 사전 (원본 정밀도 동 경계 기준)
+    """
+    dong = load_dong_boundary()
+    names = normalize_name(dong['동명'].to_numpy())
+    return dict(zip(zip(dong[GU_KEY].tolist(), names), dong[DONG_KEY].tolist()))
+
+
+def gu_codes(names):
+    """
+    구 이름 → 구코드 정수 배열 (찾지 못하면 MISSING)
+    """
+    normalized = normalize_name(np.asarray(names, dtype=object))
+    return normalized.map(_GU_LOOKUP).fillna(MISSING).to_numpy(dtype=np.int64)
+
+
+def dong_codes(gu_names, dong_names):
+    """
+    (구 이름, 동 이름) → 동코드 정수 배열 (찾지 못하면 MISSING)
+    """
+    lookup = _dong_lookup()
+    gu = gu_codes(gu_names)
+    dong = normalize_name(np.asarray(dong_names, dtype=object))
+    return np.fromiter((lookup.get(key, MISSING) for key in zip(gu.tolist(), dong)),
+                       dtype=np.int64, count=len(gu))
+
+
+def attach_codes(df, gu_column, dong_column=None, label='데이터'):
+    """
+    구코드(dong_column을 주면 동코드도) 컬럼을 붙인 복사본 반환
+
+    코드를 찾지 못한 행은 이름과 함께 경고를 출력하고 제외한다.
+    """
+    df = df.copy()
+    df[GU_KEY] = gu_codes(df[gu_column])
+    columns = [gu_column]
+    key = GU_KEY
+    if dong_column is not None:
+        df[DONG_KEY] = dong_codes(df[gu_column], df[dong_column])
+        columns.append(dong_column)
+        key = DONG_KEY
+
+    missing = df[key] == MISSING
+    if missing.any():
+        names = df.loc[missing, columns].astype(str).agg(' '.join, axis=1)
+        print(f"⚠️ {label}: 코드를 찾지 못한 {missing.sum()}개 행 제외 "
+              f"({', '.join(names.head(10))}{' ...' if missing.sum() > 10 else ''})")
+        df = df[~missing].copy()
+    return df
+
+
+def report_unmatched(boundary, column, label='데이터'):
+    """
+    경계 중 column 값이 비어 있는(병합할 지표가 없는) 구역 수를 출력하고 반환
+    """
+    missing = boundary[column].isna()
+    if missing.any():
+        name_columns = [c for c in ['구명', '동명'] if c in boundary.columns]
+        names = boundary.loc[missing, name_columns].astype(str).agg(' '.join, axis=1)
+        print(f"⚠️ {label}: 지표가 없는 경계 {missing.sum()}개 "
+              f"({', '.join(names.head(10))}{' ...' if missing.sum() > 10 else ''})")
+    return int(missing.sum())
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+동 위험도 좌표 조회 서비스
+
+IoT 화재 자동신고 경보 좌표(위도, 경도)가 들어오면 어느 동인지 찾아 그 동의
+종합위험도와 지표별 기여도를 바로 돌려주는 로컬 asyncio HTTP/JSON 서버.
+동 경계 공간 인덱스(core.geocode의 격자 색인 PointLocator)와 점수 표(core.indicator_store)는
+서버를 시작할 때 한 번만 읽고, 동별 응답 JSON 조각도 미리 만들어 두므로 조회할
+때는 공간 인덱스 검색과 문자열 연결만 한다.
+
+    GET  /health                      → {"status": "ok", "dongs": 동 수}
+    GET  /risk?lat=37.56&lon=126.97   → 좌표 하나의 결과
+    POST /risk  {"points": [[위도, 경도], ...]} 또는 [{"lat": .., "lon": ..}, ...]
+                                      → {"results": [...], "elapsed_ms": 처리 시간}
+
+동 밖의 좌표는 "동코드": null 로 응답한다.
+"""
+import asyncio
+import json
+import math
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# POST 한 번에 받을 최대 좌표 수와 본문 크기
+MAX_BATCH = 100_000
+MAX_BODY = 16 * 1024 * 1024
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large'}
+
+
+class RequestError(ValueError):
+    """
+    잘못된 요청 (HTTP 상태 코드 포함)
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _finite(value):
+    """
+    JSON 숫자 (결측은 None, float32 값은 float32 정밀도의 가장 짧은 표기)
+    """
+    value = float(str(value)) if isinstance(value, np.float32) else float(value)
+    return value if math.isfinite(value) else None
+
+
+class RiskIndex:
+    """
+    동 경계 공간 인덱스와 동별 응답 JSON 조각
+
+    점수는 지표 저장소의 지표로 core.scoring.score()를 한 번 계산한 값이며,
+    종합 위험도 지도와 같이 결측 지표는 0으로 본다.
+    """
+
+    def __init__(self, weights=None):
+        from core.geocode import dong_locator
+        from core.indicators import indicator_store
+        from core.scoring import DEFAULT_WEIGHTS, INDICATOR_LABELS, INDICATORS, score
+
+        store = indicator_store()
+        self.locator, dong = dong_locator()
+        # 경계 순서에 맞춘 저장소 행 위치 (저장소는 같은 경계로 만들어지므로 보통 그대로)
+        row = {code: i for i, code in enumerate(store['동코드'].tolist())}
+        rows = np.array([row.get(code, -1) for code in dong['동코드'].tolist()], dtype=np.int64)
+
+        matrix = store['matrix'][:, :len(INDICATORS)]
+        risk, weighted = score(np.nan_to_num(matrix), DEFAULT_WEIGHTS if weights is None else weights)
+
+        self.fragments = []
+        names = zip(dong['동코드'].tolist(), dong['구명'].astype(str), dong['동명'].astype(str), rows.tolist())
+        for code, gu, name, r in names:
+            record = {'동코드': int(code), '구명': gu, '동명': name,
+                      '종합위험도': _finite(risk[r]) if r >= 0 else None,
+                      '기여도': {label: _finite(weighted[r, j]) if r >= 0 else None
+                              for j, label in enumerate(INDICATOR_LABELS)},
+                      '지표': {column: _finite(matrix[r, j]) if r >= 0 else None
+                             for j, column in enumerate(INDICATORS)}}
+            # '{"lat": .., "lon": ..' 뒤에 이어 붙일 나머지 부분
+            self.fragments.append(', ' + json.dumps(record, ensure_ascii=False)[1:])
+        self.outside = ', "동코드": null}'
+
+    def __len__(self):
+        return len(self.fragments)
+
+    def lookup(self, lat, lon):
+        """
+        좌표 배열의 결과 JSON 문자열 목록
+        """
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        located = self.locator.locate(lon, lat).tolist()
+        return [f'{{"lat": {y!r}, "lon": {x!r}' + (self.fragments[i] if i >= 0 else self.outside)
+                for y, x, i in zip(lat.tolist(), lon.tolist(), located)]
+
+    def respond(self, method, target, body):
+        """
+        (상태 코드, JSON 문자열) 반환
+        """
+        url = urlsplit(target)
+        if url.path == '/health':
+            return 200, json.dumps({'status': 'ok', 'dongs': len(self)})
+        if url.path != '/risk':
+            raise RequestError(404, f'알 수 없는 경로: {url.path}')
+
+        if method == 'GET':
+            query = parse_qs(url.query)
+            try:
+                lat, lon = float(query['lat'][0]), float(query['lon'][0])
+            except (KeyError, ValueError):
+                raise RequestError(400, 'lat, lon 숫자 인자가 필요합니다.')
+            if not (math.isfinite(lat) and math.isfinite(lon)):
+                raise RequestError(400, '좌표에 숫자가 아닌 값이 있습니다.')
+            return 200, self.lookup([lat], [lon])[0]
+        if method != 'POST':
+            raise RequestError(405, f'지원하지 않는 메서드: {method}')
+
+        lat, lon = _parse_points(body)
+        start = time.perf_counter()
+        results = self.lookup(lat, lon)
+        elapsed = (time.perf_counter() - start) * 1000
+        return 200, f'{{"results": [{", ".join(results)}], "elapsed_ms": {elapsed:.3f}}}'
+
+
+def _parse_points(body):
+    """
+    POST 본문 → (위도 배열, 경도 배열)
+    """
+    try:
+        payload = json.loads(body or b'null')
+    except ValueError:
+        raise RequestError(400, 'JSON 본문을 읽을 수 없습니다.')
+    points = payload.get('points') if isinstance(payload, dict) else payload
+    if not isinstance(points, list):
+        raise RequestError(400, '"points" 목록이 필요합니다.')
+    if len(points) > MAX_BATCH:
+        raise RequestError(413, f'좌표는 한 번에 {MAX_BATCH:,}개까지 조회할 수 있습니다.')
+    try:
+        if points and isinstance(points[0], dict):
+            coords = np.array([(point['lat'], point['lon']) for point in points], dtype=float)
+        else:
+            coords = np.array(points, dtype=float).reshape(-1, 2)
+    except (KeyError, TypeError, ValueError):
+        raise RequestError(400, '좌표는 [위도, 경도] 또는 {"lat", "lon"} 형식이어야 합니다.')
+    if not np.isfinite(coords).all():
+        raise RequestError(400, '좌표에 숫자가 아닌 값이 있습니다.')
+    return coords[:, 0], coords[:, 1]
+
+
+def _response(status, body, keep_alive=True):
+    body = body.encode('utf-8')
+    head = (f'HTTP/1.1 {status} {_REASONS[status]}\r\n'
+            f'Content-Type: application/json; charset=utf-8\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n')
+    return head.encode('latin-1') + body
+
+
+async def _handle(index, reader, writer):
+    """
+    연결 하나의 요청들을 차례로 처리 (HTTP/1.1 keep-alive)
+    """
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            keep_alive = headers.get('connection', '').lower() != 'close'
+
+            try:
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    raise RequestError(400, '잘못된 요청 줄입니다.')
+                length = int(headers.get('content-length') or 0)
+                if length > MAX_BODY:
+                    raise RequestError(413, '요청 본문이 너무 큽니다.')
+                body = await reader.readexactly(length)
+                status, payload = index.respond(parts[0], parts[1], body)
+            except RequestError as e:
+                status, payload = e.status, json.dumps({'error': str(e)}, ensure_ascii=False)
+                keep_alive = keep_alive and e.status != 413
+            except ValueError as e:
+                status, payload, keep_alive = 400, json.dumps({'error': str(e)}, ensure_ascii=False), False
+
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(index, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    조회 서버 시작 (asyncio.Server 반환, port=0이면 빈 포트 사용)
+    """
+    return await asyncio.start_server(lambda reader, writer: _handle(index, reader, writer), host, port)
+
+
+async def request(reader, writer, method, path, payload=None, close=False):
+    """
+    열린 연결로 요청 하나를 보내고 (상태 코드, JSON) 반환 (시험/예제용 클라이언트)
+
+    close=True이면 응답 후 서버가 연결을 닫도록 요청한다.
+    """
+    body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+    connection = 'close' if close else 'keep-alive'
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: {connection}\r\n'
+                 f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+종합 재난 위험도 점수 계산
+
+동 × 지표 행렬과 가중치 벡터를 받아 Min-Max 정규화 후 가중합한 점수와
+지표별 기여도를 NumPy 배열로 반환한다. 지도 생성과 분리되어 있어 대시보드,
+배치 작업에서 경계 데이터나 HTML 없이 바로 사용할 수 있다.
+"""
+import numpy as np
+
+# 종합 위험도 지표 (열 순서)와 기본 가중치
+INDICATORS = ['취약연령밀도', '취약자밀도', 'housing_density', '구조출동밀도']
+# 지표 표시 이름 (지도/벡터 타일의 '<이름>_정규화', '<이름>_가중' 컬럼 이름에도 사용)
+INDICATOR_LABELS = ['취약연령', '취약자', '노후주택', '구조출동']
+DEFAULT_WEIGHTS = np.array([0.286, 0.324, 0.466, -0.07])
+
+
+def minmax(matrix):
+    """
+    열(지표)별 Min-Max 정규화 (값 범위가 0인 열은 0)
+
+    결측값(NaN)은 최솟값/최댓값 계산에서 제외되고 결과에도 NaN으로 남는다.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    low = np.nanmin(matrix, axis=0)
+    span = np.nanmax(matrix, axis=0) - low
+    span = np.where(span == 0, 1.0, span)
+    return (matrix - low) / span
+
+
+def contributions(matrix, weights=DEFAULT_WEIGHTS, normalize=True):
+    """
+    지표별 기여도 행렬 (정규화 값 × 가중치, 동 × 지표)
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[1] != weights.shape[-1]:
+        raise ValueError(f"지표 행렬 {matrix.shape}과 가중치 {weights.shape}의 지표 수가 다릅니다.")
+
+    normalized = minmax(matrix) if normalize else matrix
+    return normalized * weights
+
+
+def score(matrix, weights=DEFAULT_WEIGHTS, normalize=True):
+    """
+    (종합 점수, 지표별 기여도) 반환
+
+    종합 점수는 기여도의 행 합계이며, normalize=False이면 이미 정규화된 행렬로 본다.
+    """
+    parts = contributions(matrix, weights, normalize)
+    return parts.sum(axis=1), parts
+
+
+def sample_weights(n, base=DEFAULT_WEIGHTS, spread=0.5, seed=0):
+    """
+    기본 가중치 주변의 무작위 가중치 벡터 n개 (n × 지표)
+
+    각 가중치를 [1 - spread, 1 + spread] 배 범위에서 독립적으로 균등 추출하므로
+    가중치의 부호(구조출동의 음수 가중치 등)는 유지된다.
+    """
+    base = np.asarray(base, dtype=float)
+    rng = np.random.default_rng(seed)
+    return base * rng.uniform(1 - spread, 1 + spread, size=(n, len(base)))
+
+
+def rank_matrix(scores):
+    """
+    행(가중치 벡터)별 점수 내림차순 순위 (1이 가장 위험), scores: 가중치 벡터 × 동
+    """
+    order = np.argsort(-scores, axis=1)
+    ranks = np.empty_like(order)
+    positions = np.broadcast_to(np.arange(1, scores.shape[1] + 1), order.shape)
+    np.put_along_axis(ranks, order, positions, axis=1)
+    return ranks
+
+
+def sweep(matrix, weight_matrix, top_k=15, normalize=True, chunk_size=1024):
+    """
+    여러 가중치 벡터에 대한 동별 순위 안정성 통계
+
+    정규화된 지표 행렬(동 × 지표)과 가중치 행렬(가중치 벡터 × 지표)의 행렬곱으로
+    모든 가중치의 점수를 한 번에 계산한다. 가중치 벡터는 chunk_size 개씩 묶어
+    처리하므로 메모리 사용량은 동 수 × chunk_size 에 비례한다.
+
+    반환 딕셔너리 (각 값은 동 수 길이의 배열):
+    - topk_rate: 상위 top_k 안에 든 비율
+    - rank_mean, rank_std, rank_min, rank_max: 순위 평균/표준편차/최고/최저
+    """
+    normalized = minmax(matrix) if normalize else np.asarray(matrix, dtype=float)
+    normalized = np.nan_to_num(normalized)
+    weight_matrix = np.atleast_2d(np.asarray(weight_matrix, dtype=float))
+    if weight_matrix.shape[1] != normalized.shape[1]:
+        raise ValueError(f"지표 행렬 {normalized.shape}과 가중치 행렬 {weight_matrix.shape}의 지표 수가 다릅니다.")
+
+    n_rows = normalized.shape[0]
+    topk_count = np.zeros(n_rows)
+    rank_sum = np.zeros(n_rows)
+    rank_sq_sum = np.zeros(n_rows)
+    rank_min = np.full(n_rows, n_rows)
+    rank_max = np.zeros(n_rows, dtype=int)
+
+    # 점수 행렬은 (가중치 벡터 × 동) 배치로 만들어 동 방향 정렬이 연속 메모리에서 이루어지게 함
+    for start in range(0, len(weight_matrix), chunk_size):
+        ranks = rank_matrix(weight_matrix[start:start + chunk_size] @ normalized.T)
+        topk_count += (ranks <= top_k).sum(axis=0)
+        rank_sum += ranks.sum(axis=0)
+        rank_sq_sum += (ranks.astype(float) ** 2).sum(axis=0)
+        rank_min = np.minimum(rank_min, ranks.min(axis=0))
+        rank_max = np.maximum(rank_max, ranks.max(axis=0))
+
+    n = len(weight_matrix)
+    rank_mean = rank_sum / n
+    return {
+        'topk_rate': topk_count / n,
+        'rank_mean': rank_mean,
+        'rank_std': np.sqrt(np.maximum(rank_sq_sum / n - rank_mean ** 2, 0)),
+        'rank_min': rank_min,
+        'rank_max': rank_max
+    }
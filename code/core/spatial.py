@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+좌표 → 행정구역 공간 조인
+
+출동 좌표(경도/위도) 배열을 STRtree 공간 인덱스로 한꺼번에 폴리곤에 배정하고
+폴리곤별 건수와 면적당 밀도를 계산한다. 좌표는 묶음(chunk) 단위로 처리하므로
+수백만 건의 다년도 자료도 메모리 사용량이 일정하다.
+"""
+import numpy as np
+import pandas as pd
+import shapely
+
+from core.boundaries import TARGET_CRS
+
+# 면적 계산용 좌표계 (원본 경계 shapefile의 미터 단위 좌표계)
+AREA_CRS = 'EPSG:5186'
+
+CHUNK_SIZE = 1_000_000
+
+
+# 격자 칸 상태: 0 이상은 칸 전체가 안쪽에 있는 폴리곤 위치
+GRID_OUTSIDE = -1  # 어느 폴리곤과도 겹치지 않음
+GRID_MIXED = -2    # 경계가 지나가므로 정밀 판정 필요
+
+
+class PointLocator:
+    """
+    폴리곤 배열의 공간 인덱스 (한 번 만들어 여러 번 좌표 조회)
+
+    STRtree와 준비된(prepared) 폴리곤을 보관하므로 조회 서비스처럼 같은 경계에
+    좌표를 반복해서 배정할 때 인덱스를 다시 만들지 않는다. build_grid()로 만든 격자를
+    grid에 넣으면 칸 전체가 한 폴리곤 안에 있는 좌표는 배열 색인만으로 배정하고,
+    경계가 지나가는 칸의 좌표만 폴리곤 포함 여부를 정밀 판정한다.
+    """
+
+    def __init__(self, polygons, grid=None):
+        self.polygons = np.array(polygons, dtype=object)
+        shapely.prepare(self.polygons)
+        self.tree = shapely.STRtree(self.polygons)
+        self.grid = grid
+
+    def build_grid(self, cell):
+        """
+        폴리곤 전체 범위를 한 변 cell(좌표 단위)의 칸으로 나눈 격자
+        {'origin': (서, 남), 'cell': cell, 'cells': (행 × 열) 칸 상태} 반환
+
+        한 폴리곤과만 겹치고 그 폴리곤 내부에 완전히 들어가는(경계에 닿지도 않는)
+        칸만 그 폴리곤 위치가 되므로, 격자 배정 결과는 정밀 판정과 같다.
+        """
+        west, south, east, north = shapely.total_bounds(self.polygons)
+        # 동/북 경계선 위 좌표도 격자 안에 들도록 floor + 1칸 (조회와 같은 식)
+        cols = int(np.floor((east - west) / cell)) + 1
+        rows = int(np.floor((north - south) / cell)) + 1
+        x, y = np.meshgrid(west + np.arange(cols) * cell, south + np.arange(rows) * cell)
+        boxes = shapely.box(x.ravel(), y.ravel(), x.ravel() + cell, y.ravel() + cell)
+
+        cell_idx, polygon_idx = self.tree.query(boxes)
+        hit = shapely.intersects(self.polygons[polygon_idx], boxes[cell_idx])
+        cell_idx, polygon_idx = cell_idx[hit], polygon_idx[hit]
+        counts = np.bincount(cell_idx, minlength=len(boxes))
+
+        cells = np.where(counts == 0, GRID_OUTSIDE, GRID_MIXED).astype(np.int32)
+        single = counts[cell_idx] == 1
+        cell_idx, polygon_idx = cell_idx[single], polygon_idx[single]
+        inner = shapely.contains_properly(self.polygons[polygon_idx], boxes[cell_idx])
+        cells[cell_idx[inner]] = polygon_idx[inner]
+        return {'origin': (float(west), float(south)), 'cell': float(cell), 'cells': cells.reshape(rows, cols)}
+
+    def locate(self, lon, lat, chunk_size=CHUNK_SIZE):
+        """
+        각 좌표가 속한 폴리곤의 위치(0부터 시작) 배열 반환 (어느 폴리곤에도 없으면 -1)
+
+        경계선 위의 좌표처럼 여러 폴리곤에 걸치면 위치가 가장 앞선 폴리곤에 배정한다.
+        결측 좌표는 -1이 된다.
+        """
+        lon = np.asarray(lon, dtype=float)
+        lat = np.asarray(lat, dtype=float)
+        if self.grid is None:
+            return self._locate_exact(lon, lat, chunk_size)
+
+        result = self._locate_grid(lon, lat)
+        mixed = np.flatnonzero(result == GRID_MIXED)
+        if len(mixed):
+            result[mixed] = self._locate_exact(lon[mixed], lat[mixed], chunk_size)
+        return result
+
+    def _locate_grid(self, lon, lat):
+        """
+        격자 칸 상태 배열 (격자 밖이나 결측 좌표는 GRID_OUTSIDE)
+        """
+        cells = self.grid['cells']
+        west, south = self.grid['origin']
+        col = np.floor((lon - west) / self.grid['cell'])
+        row = np.floor((lat - south) / self.grid['cell'])
+        inside = (col >= 0) & (col < cells.shape[1]) & (row >= 0) & (row < cells.shape[0])
+
+        result = np.full(len(lon), GRID_OUTSIDE, dtype=np.int64)
+        result[inside] = cells[row[inside].astype(np.int64), col[inside].astype(np.int64)]
+        return result
+
+    def _locate_exact(self, lon, lat, chunk_size):
+        result = np.full(len(lon), -1, dtype=np.int64)
+        for start in range(0, len(lon), chunk_size):
+            stop = min(start + chunk_size, len(lon))
+            x, y = lon[start:stop], lat[start:stop]
+
+            # 1) 공간 인덱스로 경계 사각형(bbox)이 겹치는 후보 쌍만 추림
+            # 2) 후보 쌍에 대해서만 준비된(prepared) 폴리곤으로 포함 여부 판정
+            point_idx, polygon_idx = self.tree.query(shapely.points(x, y))
+            inside = shapely.intersects_xy(self.polygons[polygon_idx], x[point_idx], y[point_idx])
+            point_idx, polygon_idx = point_idx[inside], polygon_idx[inside]
+            if len(point_idx) == 0:
+                continue
+
+            # 좌표별로 가장 앞선 폴리곤 하나만 남김
+            order = np.lexsort((polygon_idx, point_idx))
+            point_idx, polygon_idx = point_idx[order], polygon_idx[order]
+            first = np.r_[True, point_idx[1:] != point_idx[:-1]]
+            result[start + point_idx[first]] = polygon_idx[first]
+        return result
+
+
+def locate_points(lon, lat, polygons, chunk_size=CHUNK_SIZE):
+    """
+    각 좌표가 속한 폴리곤의 위치(0부터 시작) 배열 반환 (어느 폴리곤에도 없으면 -1)
+
+    경계선 위의 좌표처럼 여러 폴리곤에 걸치면 위치가 가장 앞선 폴리곤에 배정한다.
+    결측 좌표는 -1이 된다.
+    """
+    return PointLocator(polygons).locate(lon, lat, chunk_size)
+
+
+def count_points(lon, lat, gdf, chunk_size=CHUNK_SIZE):
+    """
+    폴리곤별 좌표 건수, 경계 면적, 면적당 밀도 집계
+
+    gdf와 같은 인덱스(같은 행 순서)에 '건수', '경계면적_km2', '밀도' 컬럼을 가진
+    데이터프레임을 반환한다. 좌표는 WGS84 경도/위도로 받는다.
+    """
+    if gdf.crs is not None and gdf.crs != TARGET_CRS:
+        gdf = gdf.to_crs(TARGET_CRS)
+
+    located = locate_points(lon, lat, gdf.geometry.values, chunk_size)
+    counts = np.bincount(located[located >= 0], minlength=len(gdf))
+    area_km2 = gdf.geometry.to_crs(AREA_CRS).area.to_numpy() / 1_000_000
+
+    return pd.DataFrame({
+        '건수': counts,
+        '경계면적_km2': area_km2,
+        '밀도': counts / area_km2
+    }, index=gdf.index)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 결과 파일(CSV/Parquet) 입출력
+
+각 단계 스크립트는 기존대로 utf-8(-sig) CSV를 쓰고, 파이프라인 실행 시
+--parquet 옵션을 주면 같은 이름의 .parquet 파일(타입 지정, zstd 압축)이
+함께 만들어진다. read_table()은 최신 Parquet 파일이 있으면 그것을 읽고,
+없으면 CSV를 읽어 같은 규칙으로 타입을 정리해 반환한다. numeric으로 지정한 건수 컬럼은
+반드시 숫자 컬럼으로 돌려주며('-', 빈 값은 0), 숫자로 해석할 수 없는 값이 있으면 ValueError를 낸다.
+
+share_tables()를 호출한 프로세스에서는 읽은 표를 기억해 두었다가 같은 파일을 다시
+요청하면 복사본을 돌려준다 (일괄 렌더링에서 작업 프로세스가 fork 전에 읽은 표를 공유).
+"""
+import os
+import re
+
+import pandas as pd
+
+# KOSIS 통계표에서 값 없음(0)을 의미하는 표기
+MISSING_TOKENS = ['-', '']
+
+# '0123' 처럼 앞자리 0이 있는 코드값은 숫자로 바꾸지 않음
+_LEADING_ZERO = re.compile(r'^0\d')
+
+# 이 행 수 이상이고 고유값 비율이 낮은 문자열 컬럼은 category로 저장
+CATEGORY_MIN_ROWS = 1000
+CATEGORY_MAX_RATIO = 0.1
+
+# share_tables()로 켠 경우 (절대 경로, 컬럼, 파일 상태) → 데이터프레임
+_shared_tables = None
+
+
+def parquet_path(csv_path):
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _to_numeric(series):
+    """
+    문자열 컬럼이 모두 숫자('-'는 0)로 해석되면 숫자 컬럼으로, 아니면 None 반환
+    """
+    values = series.dropna().astype(str).str.strip()
+    if len(values) == 0:
+        return None
+    # 앞부분 표본으로 먼저 판정하여 일반 문자열 컬럼은 빠르게 제외
+    sample = values.head(100).replace(MISSING_TOKENS, '0').str.replace(',', '', regex=False)
+    sample = pd.to_numeric(sample, errors='coerce')
+    if sample.isna().any():
+        return None
+    if values.str.match(_LEADING_ZERO).any():
+        return None
+
+    cleaned = series.astype(str).str.strip().where(series.notna())
+    cleaned = cleaned.replace(MISSING_TOKENS, '0').str.replace(',', '', regex=False)
+    numeric = pd.to_numeric(cleaned, errors='coerce')
+    if numeric[series.notna()].isna().any():
+        return None
+    return numeric
+
+
+def to_typed_frame(df):
+    """
+    CSV에서 읽은 데이터프레임의 컬럼 타입 정리
+
+    - '-', 빈 문자열이 섞인 숫자 컬럼 → 숫자(정수로 표현 가능하면 int64)
+    - 대용량 데이터의 반복되는 문자열 컬럼 → category
+    """
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype != 'object':
+            continue
+
+        numeric = _to_numeric(df[col])
+        if numeric is not None:
+            if numeric.notna().all() and (numeric % 1 == 0).all():
+                numeric = numeric.astype('int64')
+            df[col] = numeric
+            continue
+
+        if len(df) >= CATEGORY_MIN_ROWS and df[col].nunique() <= len(df) * CATEGORY_MAX_RATIO:
+            df[col] = df[col].astype('category')
+
+    # 모두 정수인 실수 컬럼(결측 없음)은 int64로
+    for col in df.select_dtypes(include='float').columns:
+        if df[col].notna().all() and (df[col] % 1 == 0).all():
+            df[col] = df[col].astype('int64')
+    return df
+
+
+def to_count_columns(df, columns, source=''):
+    """
+    건수 컬럼들을 숫자로 변환한 데이터프레임 반환
+
+    '-', 빈 문자열, 결측은 0으로, 천 단위 쉼표는 제거하며 정수로 표현 가능하면 int64로 둔다.
+    그 밖에 숫자로 해석할 수 없는 값이 있으면 ValueError를 낸다.
+    """
+    df = df.copy()
+    for col in columns:
+        if col not in df.columns:
+            raise ValueError(f"{source} 건수 컬럼이 없습니다: {col}")
+        series = df[col]
+        if not pd.api.types.is_numeric_dtype(series):
+            text = series.astype(str).str.strip().where(series.notna())
+            text = text.replace(MISSING_TOKENS, '0').str.replace(',', '', regex=False)
+            numeric = pd.to_numeric(text, errors='coerce')
+            invalid = numeric.isna() & series.notna()
+            if invalid.any():
+                tokens = ', '.join(repr(v) for v in series[invalid].astype(str).unique()[:5])
+                raise ValueError(f"{source} '{col}' 컬럼에 숫자로 해석할 수 없는 값이 있습니다: {tokens}")
+            series = numeric
+        series = series.fillna(0)
+        if (series % 1 == 0).all():
+            series = series.astype('int64')
+        df[col] = series
+    return df
+
+
+def write_parquet(csv_path):
+    """
+    CSV 결과 파일을 타입 정리 후 같은 이름의 Parquet 파일로 저장
+    """
+    df = to_typed_frame(pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, keep_default_na=False,
+                                    na_values=['']))
+    output = parquet_path(csv_path)
+    df.to_parquet(output, index=False, compression='zstd')
+    return output
+
+
+def is_parquet_fresh(csv_path):
+    """
+    Parquet 파일이 존재하고 CSV보다 최신인지 확인
+    """
+    pq_file = parquet_path(csv_path)
+    if not os.path.exists(pq_file):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(pq_file) >= os.path.getmtime(csv_path)
+
+
+def share_tables(enabled=True):
+    """
+    이 프로세스에서 read_table() 결과 재사용 켜기/끄기 (끄면 기억해 둔 표도 비움)
+    """
+    global _shared_tables
+    _shared_tables = {} if enabled else None
+
+
+def _file_state(csv_path):
+    paths = [csv_path, parquet_path(csv_path)]
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in paths)
+
+
+def read_table(csv_path, columns=None, numeric=None):
+    """
+    단계 결과 파일 읽기 (최신 Parquet 우선, 없으면 CSV)
+
+    어느 쪽을 읽어도 같은 타입 규칙이 적용된 데이터프레임을 반환한다. numeric에 준 컬럼은
+    to_count_columns()로 숫자임을 보장한다.
+    """
+    df = _shared_table(csv_path, columns)
+    if numeric:
+        df = to_count_columns(df, numeric, os.path.basename(csv_path))
+    return df
+
+
+def _shared_table(csv_path, columns):
+    if _shared_tables is None:
+        return _read_table(csv_path, columns)
+    key = (os.path.abspath(csv_path), tuple(columns) if columns else None)
+    state = _file_state(csv_path)
+    shared = _shared_tables.get(key)
+    if shared is None or shared[0] != state:
+        shared = (state, _read_table(csv_path, columns))
+        _shared_tables[key] = shared
+    return shared[1].copy()
+
+
+def _read_table(csv_path, columns=None):
+    if is_parquet_fresh(csv_path):
+        return pd.read_parquet(parquet_path(csv_path), columns=columns)
+
+    df = pd.read_csv(csv_path, encoding='utf-8-sig', usecols=columns)
+    return to_typed_frame(df)
@@ -0,0 +1,571 @@
+# -*- coding: utf-8 -*-
+"""
+부하 시험용 합성 입력 자료 생성
+
+저장소 원본 자료와 파일명, 헤더 구조, 따옴표/빈 값('-') 표기까지 같은 가짜 입력을
+원하는 규모(동 수, 구조출동 건수)로 만든다. 생성한 dataset 폴더에 파이프라인과 지도
+스크립트를 그대로 실행할 수 있다.
+
+- 0_original: KOSIS 다중 헤더 표(화재발생/노후주택/동별 면적), 등록인구, 맞벌이 가구,
+  소방서별 재난안전취약자 정보
+- 1_merge_column_names: 구조출동 원본 (파이프라인이 읽는 컬럼만 포함)
+- 서울시_행정구역_경계: 구/동 경계 shapefile (EPSG:5186, cp949)
+
+구는 실제 25개 구(core.boundaries.GU_CODE_MAPPING)를 5 × 5 격자 칸에 배치하고,
+동은 각 구 칸 안의 무작위 점으로 만든 보로노이 다각형이다. 인구/면적/주택/화재
+값은 실제 자료의 비율을 바탕으로 동 인구에 비례하게 뽑으며, 같은 seed(와
+chunk_size)이면 같은 파일이 만들어진다.
+
+구조출동 원본은 묶음(chunk) 단위로 좌표를 뽑아 CSV 바이트를 배열 연산으로 직접
+만들어 이어 쓰므로 메모리 사용량은 묶음 크기에 비례한다 (단일 코어에서 백만 건당
+약 2초, pandas to_csv의 약 1/3).
+"""
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from pyproj import Transformer
+
+from core.boundaries import GU_CODE_MAPPING
+from core.paths import BOUNDARY_DIR, DATASET_DIR, MERGE_DIR, ORIGINAL_DIR
+from core.pipeline import AREA, DUAL_INCOME, FIRE, HOUSING, POPULATION, RESCUE_RAW, VULNERABLE
+
+SOURCE_CRS = 'EPSG:5186'
+
+# 서울시 구경계 shapefile의 범위 (EPSG:5186, 미터)
+SEOUL_BOUNDS = (179191.0, 536562.0, 216242.0, 566863.0)
+GU_GRID = (5, 5)
+
+# 실제 행정동 수 (등록인구 기준)
+REAL_DONGS = 426
+
+# 동 인구: 실제 동 인구 분포(평균 약 22,500명)에 맞춘 로그정규 분포
+DONG_POPULATION_MEDIAN = 21_000
+DONG_POPULATION_SIGMA = 0.45
+
+# 등록인구 연령 구간과 서울시 전체 구성비 (천분율, 2025년 1분기)
+AGE_GROUPS = ['0~4세', '5~9세', '10~14세', '15~19세', '20~24세', '25~29세', '30~34세',
+              '35~39세', '40~44세', '45~49세', '50~54세', '55~59세', '60~64세', '65~69세',
+              '70~74세', '75~79세', '80~84세', '85~89세', '90~94세', '95~99세', '100세 이상']
+AGE_SHARES = np.array([21.4, 29.3, 37.1, 39.5, 59.4, 85.3, 85.9, 69.8, 75.1, 72.3, 82.1,
+                       76.4, 73.2, 66.7, 47.5, 35.7, 24.7, 12.8, 4.4, 1.0, 0.2])
+FOREIGNER_RATE = 0.028
+POPULATION_PERIOD = '2025. 1/4'
+
+# 구조출동 원본 컬럼 (파이프라인이 읽는 컬럼만)과 값 분포 (2023년 원본 보고서 기준)
+DISPATCH_COLUMNS = ['ACDNT_CS_NM', 'SEASN_NM', 'GRNDS_CTPV_NM', 'GRNDS_SGG_NM',
+                    'ACDNT_OCRN_PLC_NM', 'DAMG_RGN_LOT', 'DAMG_RGN_LAT', 'PRCS_RSLT_SE_NM']
+ACCIDENT_TYPES = {
+    '화재': 56290, '위치확인': 21508, '기타 사고': 9876, '자살추정': 8933, '승강기': 8388,
+    '교통': 8092, '인명 갇힘': 5774, '수난': 3758, '산악': 2142, '끼임': 1153, '추락': 846,
+    '테러(의심)': 627, '붕괴·도괴(깔림)': 529, '누출사고': 458, '폭발': 182, '항공기 사고': 6
+}
+RESULT_TYPES = {
+    '타 기관처리': 9123, '기타안전조치': 7915, '시설물': 6676, '자체처리': 6382, '오인신고': 4899,
+    '안전조치': 3910, '인명검색': 3143, '타기관 인계': 2593, '기타활동': 2081, '구조물': 880,
+    '기타 구조활동': 588, '구급대 인계': 449, '인명대피': 378, '차단': 268, '차량': 232,
+    '인명구조': 205, '공동대응': 143, '보호자 인계': 83, '수거': 78, '제독': 4, '항공대 인계': 2,
+    '구조거부': 1
+}
+SEASONS = {'겨울': 14682, '봄': 14650, '여름': 13872, '가을': 13086}
+# 사고발생 장소: '도로' 비율만 실제 값(화재 중 12%)이고 나머지 분류는 임의 값
+PLACES = {'도로': 12, '주거': 38, '비주거': 30, '차량': 8, '기타': 12}
+REAL_DISPATCHES = 128_564
+
+# 구조출동 좌표: 동 중심점에서 표준편차만큼 흩어진 점 (미터), 좌표 결측 비율
+DISPATCH_SPREAD = 400.0
+MISSING_COORD_RATE = 0.0013
+COORD_DECIMALS = 7
+
+CHUNK_SIZE = 500_000
+
+# 인구 1명당 연간 값 (2024년 서울시 화재 통계, 2023년 노후주택 통계)
+SEOUL_POPULATION = 9_602_826
+FIRE_RATES = {'발생': 5654, '소실동수': 348, '이재세대수': 340, '소실면적': 34822,
+              '사망': 23, '부상': 305, '이재민수': 740, '인명구조': 426}
+FIRE_CAUSE_SHARES = [5048, 89, 517]            # 실화, 방화, 기타
+CASUALTY_SEX_SHARES = [0.56, 0.40, 0.04]      # 남, 여, 미상
+DAMAGE_PER_FIRE = (2045.0, 1772.0)             # 부동산, 동산 (천원)
+MITIGATION_PER_FIRE = 147_550.0                # 재산피해경감액 (천원)
+HOUSING_TYPES = ['계', '단독주택', '아파트', '연립주택', '다세대주택', '비주거용 건물내주택']
+HOUSING_TOTALS = {'20년~30년미만': [60570, 602154, 44712, 232495, 5622],
+                  '30년 이상': [204533, 423038, 49501, 127077, 16118]}
+
+# 소방서 관할구역이 둘인 구 (재난안전취약자정보 원본과 같이 한 행으로 기록)
+SHARED_STATION = ('구로구', '금천구')
+
+DUAL_INCOME_YEARS = range(2011, 2025)
+
+
+def _shares(counts):
+    values = np.asarray(list(counts.values()) if isinstance(counts, dict) else counts, dtype=float)
+    return values / values.sum()
+
+
+def _split(n, parts):
+    """
+    n개를 parts개 묶음으로 최대한 고르게 나눈 개수 배열
+    """
+    return np.full(parts, n // parts) + (np.arange(parts) < n % parts)
+
+
+def make_regions(dongs, rng):
+    """
+    구/동 경계와 동 속성
+
+    (구 GeoDataFrame: 구코드, 구명, geometry / 동 GeoDataFrame: 구코드, 구명, 동명, ADM_CD,
+    center_x, center_y, 면적_km2, geometry) 반환. 좌표계는 EPSG:5186이다.
+    """
+    gu_codes = list(GU_CODE_MAPPING)
+    if dongs < len(gu_codes):
+        raise ValueError(f"동 수는 구 수({len(gu_codes)}) 이상이어야 합니다: {dongs}")
+    if dongs > len(gu_codes) * 999:
+        raise ValueError(f"구마다 동 코드가 세 자리이므로 동 수는 {len(gu_codes) * 999} 이하여야 합니다.")
+
+    cols, rows = GU_GRID
+    min_x, min_y, max_x, max_y = SEOUL_BOUNDS
+    width = (max_x - min_x) / cols
+    height = (max_y - min_y) / rows
+    index = np.arange(len(gu_codes))
+    # 북쪽 행부터 서→동 순서로 배치
+    left = min_x + (index % cols) * width
+    top = max_y - (index // cols) * height
+    gu_boxes = shapely.box(left, top - height, left + width, top)
+
+    dong_frames = []
+    for gu_index, (code, count) in enumerate(zip(gu_codes, _split(dongs, len(gu_codes)))):
+        box = gu_boxes[gu_index]
+        x = rng.uniform(left[gu_index], left[gu_index] + width, count)
+        y = rng.uniform(top[gu_index] - height, top[gu_index], count)
+        if count == 1:
+            cells = np.array([box])
+        else:
+            diagram = shapely.voronoi_polygons(shapely.multipoints(np.column_stack([x, y])),
+                                               extend_to=box, ordered=True)
+            cells = shapely.intersection(shapely.get_parts(diagram), box)
+        gu_name = GU_CODE_MAPPING[code]
+        numbers = np.arange(1, count + 1)
+        dong_frames.append(pd.DataFrame({
+            '구코드': code,
+            '구명': gu_name,
+            '동명': [f'{gu_name[:-1]}{n}동' for n in numbers],
+            'ADM_CD': [f'{code}{n:03d}' for n in numbers],
+            'center_x': x,
+            'center_y': y,
+            'geometry': cells
+        }))
+
+    dong = gpd.GeoDataFrame(pd.concat(dong_frames, ignore_index=True), crs=SOURCE_CRS)
+    dong['면적_km2'] = dong.geometry.area / 1e6
+    gu = gpd.GeoDataFrame({'구코드': gu_codes, '구명': [GU_CODE_MAPPING[c] for c in gu_codes]},
+                          geometry=gu_boxes, crs=SOURCE_CRS)
+    return gu, dong
+
+
+def make_population(dong, rng):
+    """
+    동별 연령 구간 인구 (동 수 × 연령 구간 수) 배열 (한국인, 등록외국인)
+    """
+    totals = np.maximum(rng.lognormal(np.log(DONG_POPULATION_MEDIAN), DONG_POPULATION_SIGMA,
+                                      len(dong)).astype(np.int64), 100)
+    # 동마다 연령 구성을 조금씩 다르게 (디리클레 분포)
+    shares = rng.dirichlet(AGE_SHARES / AGE_SHARES.sum() * 400, len(dong))
+    people = rng.multinomial(totals, shares)
+    foreigners = rng.binomial(people, FOREIGNER_RATE)
+    return people - foreigners, foreigners
+
+
+def _cell(value):
+    """
+    KOSIS 표기: 0은 '-'
+    """
+    return '-' if value == 0 else str(value)
+
+
+def _kosis_line(first, values):
+    # KOSIS 내려받기 형식: 첫 컬럼만 따옴표
+    return f'"{first}",' + ','.join(values) + '\n'
+
+
+def _write_lines(path, lines):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        f.writelines(lines)
+
+
+def write_population(path, dong, korean, foreign):
+    """
+    등록인구 원본 (합계 → 구 → 그 구의 동 순서, 연령 구간별 22행, 모든 값 따옴표)
+    """
+    def block(name, korean_counts, foreign_counts):
+        korean_counts = np.concatenate([[korean_counts.sum()], korean_counts])
+        foreign_counts = np.concatenate([[foreign_counts.sum()], foreign_counts])
+        lines = []
+        for age, k, f in zip(['합계'] + AGE_GROUPS, korean_counts.tolist(), foreign_counts.tolist()):
+            values = [name, age, POPULATION_PERIOD, _cell(k + f), _cell(k), _cell(f)]
+            lines.append(','.join(f'"{v}"' for v in values) + ',\n')
+        return lines
+
+    lines = ['"동별","연령별","시점","계","한국인","등록외국인",\n']
+    lines += block('합계', korean.sum(axis=0), foreign.sum(axis=0))
+    for _, rows in dong.groupby('구코드', sort=False).groups.items():
+        gu_name = dong.at[rows[0], '구명']
+        lines += block(gu_name, korean[rows].sum(axis=0), foreign[rows].sum(axis=0))
+        for row in rows:
+            lines += block(dong.at[row, '동명'], korean[row], foreign[row])
+    _write_lines(path, lines)
+
+
+def write_area(path, dong, rng):
+    """
+    행정구역(동별) 면적 (구마다 소계 행 다음에 동 행, 3행 헤더)
+    """
+    total_area = dong['면적_km2'].sum()
+    legal = rng.integers(0, 13, len(dong))
+    lines = [
+        '"동별(1)",동별(2),동별(3),2023,2023,2023,2023\n',
+        '"동별(1)",동별(2),동별(3),면적,면적,동,동\n',
+        '"동별(1)",동별(2),동별(3),면적 (k㎡),구성비 (%),행정,법정\n',
+    ]
+    for _, rows in dong.groupby('구코드', sort=False).groups.items():
+        area = dong.loc[rows, '면적_km2'].to_numpy()
+        gu_name = dong.at[rows[0], '구명']
+        lines.append(_kosis_line('서울시', [gu_name, '소계', f'{area.sum():.2f}',
+                                            f'{area.sum() / total_area * 100:.2f}',
+                                            str(len(rows)), _cell(int(legal[rows].sum()))]))
+        for row, value in zip(rows, area):
+            lines.append(_kosis_line('서울시', [gu_name, dong.at[row, '동명'], f'{value:.2f}',
+                                                f'{value / total_area * 100:.2f}', '1',
+                                                _cell(int(legal[row]))]))
+    _write_lines(path, lines)
+
+
+def write_housing(path, gu_names, gu_population, rng):
+    """
+    노후기간별 주택현황 (서울시 소계 행 다음에 구 행, 3행 헤더)
+    """
+    periods = list(HOUSING_TOTALS)
+    header = [[], [], []]
+    for period in periods:
+        header[0] += ['2023'] * len(HOUSING_TYPES)
+        header[1] += [period] * len(HOUSING_TYPES)
+        header[2] += HOUSING_TYPES
+
+    counts = []
+    for period in periods:
+        totals = np.asarray(HOUSING_TOTALS[period])
+        expected = gu_population * totals.sum() / SEOUL_POPULATION
+        by_type = rng.multinomial(rng.poisson(expected), totals / totals.sum())
+        counts.append(np.column_stack([by_type.sum(axis=1), by_type]))
+    counts = np.hstack(counts)
+
+    lines = [_kosis_line('자치구(1)', ['자치구(2)'] + row) for row in header]
+    lines.append(_kosis_line('서울시', ['소계'] + [_cell(v) for v in counts.sum(axis=0).tolist()]))
+    for name, row in zip(gu_names, counts.tolist()):
+        lines.append(_kosis_line('서울시', [name] + [_cell(v) for v in row]))
+    _write_lines(path, lines)
+
+
+def write_fire(path, gu_names, gu_population, rng):
+    """
+    화재발생 현황 (합계 소계 행 다음에 구 행, 3행 헤더, 소계 = 세부 항목 합)
+    """
+    rate = {key: gu_population * value / SEOUL_POPULATION for key, value in FIRE_RATES.items()}
+    fires = rng.poisson(rate['발생'])
+    causes = rng.multinomial(fires, _shares(FIRE_CAUSE_SHARES))
+    damage = np.column_stack([rng.gamma(2.0, per_fire / 2.0 * np.maximum(fires, 1)).astype(np.int64)
+                              for per_fire in DAMAGE_PER_FIRE])
+    mitigation = rng.gamma(2.0, MITIGATION_PER_FIRE / 2.0 * np.maximum(fires, 1)).astype(np.int64)
+    deaths = rng.multinomial(rng.poisson(rate['사망']), CASUALTY_SEX_SHARES)
+    injuries = rng.multinomial(rng.poisson(rate['부상']), CASUALTY_SEX_SHARES)
+    casualties = deaths + injuries
+
+    table = np.column_stack([
+        fires, causes,
+        rng.poisson(rate['소실동수']), rng.poisson(rate['이재세대수']), rng.poisson(rate['소실면적']),
+        damage.sum(axis=1), damage, mitigation,
+        casualties.sum(axis=1), casualties,
+        deaths.sum(axis=1), deaths,
+        injuries.sum(axis=1), injuries,
+        rng.poisson(rate['이재민수']), rng.poisson(rate['인명구조'])
+    ])
+
+    sex = ['소계', '남', '여', '미상']
+    categories = (['발생 (건)'] * 4 + ['소실'] * 3 + ['피해액 (천원)'] * 3 + ['재산피해경감액 (천원)']
+                  + ['인명피해 (명)'] * 4 + ['사망 (명)'] * 4 + ['부상 (명)'] * 4
+                  + ['이재민수 (명)', '인명구조 (명)'])
+    details = (['소계', '실화', '방화', '기타', '동수 (동)', '이재세대수 (가구)', '면적 (m²)',
+                '소계', '부동산', '동산', '소계'] + sex * 3 + ['소계', '소계'])
+    lines = [
+        _kosis_line('동별(1)', ['동별(2)'] + ['2024'] * len(categories)),
+        _kosis_line('동별(1)', ['동별(2)'] + categories),
+        _kosis_line('동별(1)', ['동별(2)'] + details),
+        _kosis_line('합계', ['소계'] + [_cell(v) for v in table.sum(axis=0).tolist()]),
+    ]
+    for name, row in zip(gu_names, table.tolist()):
+        lines.append(_kosis_line('합계', [name] + [_cell(v) for v in row]))
+    _write_lines(path, lines)
+
+
+def write_vulnerable(path, gu_names, gu_area, korean, foreign, dong_gu, rng):
+    """
+    소방서별 재난안전취약자 정보 (구마다 한 소방서, 구로구/금천구는 한 행)
+    """
+    people = korean + foreign
+    zones = []
+    for name in gu_names:
+        if name == SHARED_STATION[1]:
+            continue
+        members = list(SHARED_STATION) if name == SHARED_STATION[0] else [name]
+        zones.append(members)
+
+    rows = []
+    for members in zones:
+        mask = np.isin(dong_gu, members)
+        population = int(people[mask].sum())
+        elderly = int(people[mask][:, AGE_GROUPS.index('65~69세'):].sum())
+        infants = int(people[mask][:, 0].sum())
+        area = float(sum(gu_area[gu_names.index(m)] for m in members))
+        fires = int(rng.poisson(population * FIRE_RATES['발생'] / SEOUL_POPULATION * 0.9))
+        rows.append([
+            '서울', f'{members[0][:-1]}소방서', int(rng.integers(3, 9)), int(rng.integers(200, 400)),
+            int(population * rng.uniform(0.15, 0.3)), int(rng.integers(400, 1900)), population,
+            int(elderly * rng.uniform(0.12, 0.18)), elderly, int(population * rng.uniform(0.15, 0.25)),
+            infants, int(foreign[mask].sum()), int(population * rng.uniform(0.03, 0.05)),
+            int(population * rng.uniform(0.03, 0.06)), round(area, 2), int(population / area),
+            ', '.join(members), int(rng.integers(6000, 14000)), int(rng.integers(30, 60)), fires
+        ])
+
+    columns = ['CTPV_NM', 'FRSTN_NM', 'SF119CN_EAQT', 'FRFGH_PBOFC_CNT', 'CNTR_TKCG_PPLTN_CNT',
+               'FRFGH_PBOFC_TKCG_PPLTN_CNT', 'CMPTNC_ZONE_RSRGS_PPLTN_CNT', 'EDRLVNALN_HSHD_CNT',
+               'ADVAG_PPLTN_CNT', 'ONPSHH_CNT', 'INFNT_PPLTN_CNT', 'REG_FRGNR_CNT', 'REG_PWDBS_CNT',
+               'ROBL_CNT', 'CMPTNC_AREA', 'PPLTN_DN', 'CMPTNC_ZONE_NM', 'SPFPTG_CNT',
+               'FRFGH_EQPMNT_VHCL_CNT', 'FIRE_OCRN_NOCS']
+    df = pd.DataFrame(rows, columns=columns).sort_values('FRSTN_NM')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def write_dual_income(path, rng):
+    """
+    맞벌이 가구 현황 (연도별 서울시 전체, 규모와 무관)
+    """
+    lines = ['"시점",유배우가구 (천가구),맞벌이가구 (천가구),맞벌이가구 비율 (%)\n']
+    married = 2250
+    for year in DUAL_INCOME_YEARS:
+        married -= int(rng.integers(0, 25))
+        dual = int(married * rng.uniform(0.37, 0.44))
+        lines.append(_kosis_line(str(year), [str(married), str(dual), f'{dual / married * 100:.1f}']))
+    _write_lines(path, lines)
+
+
+def write_boundaries(directory, gu, dong):
+    """
+    구/동 경계 shapefile (원본과 같은 컬럼, cp949)
+    """
+    os.makedirs(directory, exist_ok=True)
+    gu_shp = gpd.GeoDataFrame({
+        'ADM_SECT_C': gu['구코드'],
+        'SGG_NM': '서울특별시 ' + gu['구명'],
+        'SGG_OID': np.arange(1, len(gu) + 1, dtype=float),
+        'COL_ADM_SE': gu['구코드']
+    }, geometry=gu.geometry.values, crs=SOURCE_CRS)
+    dong_shp = gpd.GeoDataFrame({
+        'BASE_DATE': '20240630',
+        'ADM_CD': dong['ADM_CD'],
+        'ADM_NM': dong['동명']
+    }, geometry=dong.geometry.values, crs=SOURCE_CRS)
+    gu_shp.to_file(os.path.join(directory, '서울시_구경계.shp'), encoding='cp949')
+    dong_shp.to_file(os.path.join(directory, '서울시_동경계.shp'), encoding='cp949')
+
+
+def _quote(text):
+    # csv.QUOTE_MINIMAL 규칙 (pandas to_csv 기본값)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _category_bytes(codes, categories):
+    """
+    범주 코드 배열의 (행 수 × 최대 바이트 수) 바이트 행렬과 유효 바이트 마스크
+
+    쉼표, 큰따옴표, 줄바꿈이 든 범주는 pandas to_csv와 같이 큰따옴표로 감싸고 안의 큰따옴표를 겹친다.
+    """
+    encoded = [_quote(str(category)).encode('utf-8') for category in categories]
+    width = max(len(e) for e in encoded)
+    table = np.zeros((len(encoded), width), dtype=np.uint8)
+    valid = np.zeros((len(encoded), width), dtype=bool)
+    for i, e in enumerate(encoded):
+        table[i, :len(e)] = np.frombuffer(e, dtype=np.uint8)
+        valid[i, :len(e)] = True
+    return table[codes], valid[codes]
+
+
+def _fixed_bytes(values, decimals):
+    """
+    음이 아닌 실수 배열을 소수점 decimals자리로 표기한 오른쪽 정렬 바이트 행렬과 유효 바이트
+    마스크 (결측은 빈 값)
+    """
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    scaled = np.rint(np.where(missing, 0, values) * 10 ** decimals).astype(np.int64)
+    digits = np.maximum(np.floor(np.log10(np.maximum(scaled, 1))).astype(np.int64) + 1, decimals + 1)
+
+    width = int(digits.max(initial=decimals + 1)) + (1 if decimals else 0)
+    # 열마다 오른쪽에서 몇 번째 자리인지 (소수점 열은 -1)
+    from_right = np.arange(width - 1, -1, -1)
+    place = np.where(from_right > decimals, from_right - 1, from_right) if decimals else from_right
+    if decimals:
+        place[width - 1 - decimals] = -1
+    powers = 10 ** np.maximum(place, 0)
+
+    matrix = ((scaled[:, None] // powers) % 10 + ord('0')).astype(np.uint8)
+    valid = place < digits[:, None]
+    if decimals:
+        matrix[:, width - 1 - decimals] = ord('.')
+    valid[missing] = False
+    return matrix, valid
+
+
+def encode_csv(fields):
+    """
+    컬럼 배열들을 CSV 바이트로 변환 (DataFrame.to_csv(index=False, header=False)와 같은 바이트)
+
+    fields는 ('category', 코드 배열, 범주 문자열 목록) 또는 ('fixed', 실수 배열, 소수 자리수)
+    튜플의 목록이다. 필드마다 최대 너비의 고정 열에 바이트를 채운 행렬과 유효 바이트 마스크를
+    만들어 쉼표/줄바꿈 열과 이어 붙인 뒤, 마스크로 한 번에 골라내어 가변 길이 행을 만든다.
+    """
+    encoded = []
+    for kind, values, spec in fields:
+        encoded.append(_category_bytes(values, spec) if kind == 'category' else _fixed_bytes(values, spec))
+
+    rows = len(encoded[0][0])
+    width = sum(matrix.shape[1] + 1 for matrix, _ in encoded)
+    matrix = np.full((rows, width), ord(','), dtype=np.uint8)
+    valid = np.ones((rows, width), dtype=bool)
+    column = 0
+    for field_matrix, field_valid in encoded:
+        field_width = field_matrix.shape[1]
+        matrix[:, column:column + field_width] = field_matrix
+        valid[:, column:column + field_width] = field_valid
+        column += field_width + 1
+    matrix[:, -1] = ord('\n')
+    return matrix[valid].tobytes()
+
+
+def _dispatch_chunk(size, dong, weights, gu_bounds, transformer, categories, rng):
+    """
+    구조출동 원본 한 묶음의 encode_csv 필드 목록
+    """
+    index = rng.choice(len(dong), size=size, p=weights)
+    gu_index = dong['gu_index'].to_numpy()[index]
+    x = dong['center_x'].to_numpy()[index] + rng.normal(0, DISPATCH_SPREAD, size)
+    y = dong['center_y'].to_numpy()[index] + rng.normal(0, DISPATCH_SPREAD, size)
+    # 구 칸 안으로 제한하여 발생지역 구명과 좌표가 일치하도록 함
+    x = np.clip(x, gu_bounds[gu_index, 0] + 1, gu_bounds[gu_index, 2] - 1)
+    y = np.clip(y, gu_bounds[gu_index, 1] + 1, gu_bounds[gu_index, 3] - 1)
+    lon, lat = transformer.transform(x, y)
+    missing = rng.random(size) < MISSING_COORD_RATE
+    lon[missing] = np.nan
+    lat[missing] = np.nan
+
+    def draw(name):
+        labels, shares = categories[name]
+        return ('category', rng.choice(len(labels), size=size, p=shares), labels)
+
+    return [
+        draw('ACDNT_CS_NM'),
+        draw('SEASN_NM'),
+        ('category', np.zeros(size, dtype=np.int64), ['서울특별시']),
+        ('category', gu_index, categories['GRNDS_SGG_NM']),
+        draw('ACDNT_OCRN_PLC_NM'),
+        ('fixed', lon, COORD_DECIMALS),
+        ('fixed', lat, COORD_DECIMALS),
+        draw('PRCS_RSLT_SE_NM'),
+    ]
+
+
+def write_dispatch(path, gu, dong, population, count, rng, chunk_size=CHUNK_SIZE):
+    """
+    구조출동 원본 CSV를 묶음 단위로 생성하여 이어 쓰기 (BOM 없는 utf-8, 원본과 동일)
+
+    좌표는 동 인구에 비례하게 고른 동 중심점 주변에 흩뿌린다.
+    """
+    gu_index = {code: i for i, code in enumerate(gu['구코드'])}
+    dong = dong.assign(gu_index=dong['구코드'].map(gu_index))
+    weights = population / population.sum()
+    gu_bounds = shapely.bounds(gu.geometry.values)
+    transformer = Transformer.from_crs(SOURCE_CRS, 'EPSG:4326', always_xy=True)
+    categories = {
+        name: (list(counts), _shares(counts))
+        for name, counts in [('ACDNT_CS_NM', ACCIDENT_TYPES), ('SEASN_NM', SEASONS),
+                             ('ACDNT_OCRN_PLC_NM', PLACES), ('PRCS_RSLT_SE_NM', RESULT_TYPES)]
+    }
+    categories['GRNDS_SGG_NM'] = list(gu['구명'])
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_file = path + '.tmp'
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write((','.join(DISPATCH_COLUMNS) + '\n').encode('utf-8'))
+            for start in range(0, count, chunk_size):
+                size = min(chunk_size, count - start)
+                f.write(encode_csv(_dispatch_chunk(size, dong, weights, gu_bounds, transformer,
+                                                   categories, rng)))
+        os.replace(temp_file, path)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def generate(dataset_dir, dongs=REAL_DONGS, dispatches=REAL_DISPATCHES, seed=0,
+             chunk_size=CHUNK_SIZE, progress=print):
+    """
+    dataset_dir 아래에 저장소 dataset 폴더와 같은 구조로 합성 입력 자료를 저장
+
+    저장소의 실제 dataset 폴더에는 쓰지 않는다. {파일 경로: 행 수} 딕셔너리를 반환한다.
+    """
+    if os.path.abspath(dataset_dir) == os.path.abspath(DATASET_DIR):
+        raise ValueError(f"저장소 dataset 폴더에는 합성 자료를 쓸 수 없습니다: {dataset_dir}")
+
+    def target(directory, file_name):
+        return os.path.join(dataset_dir, os.path.relpath(directory, DATASET_DIR), file_name)
+
+    # 항목마다 독립된 난수열을 써서 동/구조출동 수를 바꿔도 다른 파일의 난수가 밀리지 않게 함
+    streams = dict(zip(['regions', 'population', 'area', 'housing', 'fire', 'vulnerable',
+                        'dual_income', 'dispatch'],
+                       (np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(8))))
+
+    progress(f"🏙️  구/동 경계 생성 중... (동 {dongs:,}개)")
+    gu, dong = make_regions(dongs, streams['regions'])
+    korean, foreign = make_population(dong, streams['population'])
+    people = korean + foreign
+    dong_population = people.sum(axis=1)
+    gu_names = list(gu['구명'])
+    gu_population = (pd.Series(dong_population).groupby(dong['구명'].to_numpy()).sum()
+                     .reindex(gu_names).to_numpy())
+    gu_area = list(dong.groupby('구명')['면적_km2'].sum().reindex(gu_names))
+
+    summary = {}
+    write_boundaries(os.path.join(dataset_dir, os.path.relpath(BOUNDARY_DIR, DATASET_DIR)), gu, dong)
+    summary['서울시_행정구역_경계'] = len(dong)
+
+    progress("📄 통계표 생성 중...")
+    write_population(target(ORIGINAL_DIR, POPULATION), dong, korean, foreign)
+    write_area(target(ORIGINAL_DIR, AREA), dong, streams['area'])
+    write_housing(target(ORIGINAL_DIR, HOUSING), gu_names, gu_population, streams['housing'])
+    write_fire(target(ORIGINAL_DIR, FIRE), gu_names, gu_population, streams['fire'])
+    write_vulnerable(target(ORIGINAL_DIR, VULNERABLE), gu_names, gu_area, korean, foreign,
+                     dong['구명'].to_numpy(), streams['vulnerable'])
+    write_dual_income(target(ORIGINAL_DIR, DUAL_INCOME), streams['dual_income'])
+    summary[POPULATION] = len(dong) * (len(AGE_GROUPS) + 1)
+    summary[AREA] = len(dong) + len(gu)
+
+    progress(f"🚒 구조출동 원본 생성 중... ({dispatches:,}건)")
+    write_dispatch(target(MERGE_DIR, RESCUE_RAW), gu, dong, dong_population, dispatches,
+                   streams['dispatch'], chunk_size)
+    summary[RESCUE_RAW] = dispatches
+    return summary
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+구/동 경계 벡터 타일 (Mapbox Vector Tile)
+
+경계 폴리곤과 속성을 확대 수준별 Web Mercator 타일로 잘라 MVT(protobuf) 타일로
+인코딩하고, z/x/y.pbf 타일 폴더 또는 MBTiles(SQLite) 파일 하나로 저장한다.
+지도 클라이언트는 화면에 보이는 타일만 내려받으므로 경계 전체를 GeoJSON으로 HTML에
+넣는 Folium 지도와 달리 레이어와 속성이 늘어나도 처음 여는 크기가 변하지 않는다.
+
+확대 수준마다 타일 해상도에 맞게 경계를 한 번 단순화한 뒤, 타일 행(같은 y) 단위로
+프로세스 풀에 나누어 타일마다 여백(BUFFER)을 둔 사각형으로 자르고 정수 타일 좌표로
+반올림한다. protobuf 인코딩은 외부 패키지 없이 이 모듈에서 직접 한다.
+"""
+import gzip
+import json
+import math
+import os
+import shutil
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import shapely
+
+from core.paths import FIGURE_DIR
+from core.tiles import _ORIGIN_SHIFT
+
+VECTOR_TILE_DIR = os.path.join(FIGURE_DIR, 'tiles', '종합위험도_벡터')
+
+MIN_ZOOM = 9
+MAX_ZOOM = 14
+
+# 타일 좌표 범위와 타일 밖 여백 (타일 좌표 단위, 경계선이 타일 가장자리에서 끊겨 보이지 않도록)
+EXTENT = 4096
+BUFFER = 64
+
+# 확대 수준별 단순화 허용 오차 (타일 좌표 단위, 256px 타일 기준 약 1/8 픽셀)
+SIMPLIFY_UNITS = 2
+
+METADATA_FILE = 'metadata.json'
+
+# MVT 도형 명령과 도형 종류
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+_POLYGON = 3
+
+
+def _varint(value):
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _field(number, wire_type, payload):
+    """
+    protobuf 필드 하나 (wire_type 0: varint 정수, 1: 64비트, 2: 길이 지정 바이트)
+    """
+    key = _varint((number << 3) | wire_type)
+    if wire_type == 0:
+        return key + _varint(payload)
+    if wire_type == 1:
+        return key + payload
+    return key + _varint(len(payload)) + payload
+
+
+def _packed(number, values):
+    return _field(number, 2, b''.join(_varint(value) for value in values))
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _value(value):
+    """
+    MVT Value 메시지 (문자열, 실수, 음이 아닌 정수, 음수 정수, 참/거짓)
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return _field(7, 0, int(value))
+    if isinstance(value, (int, np.integer)):
+        value = int(value)
+        return _field(5, 0, value) if value >= 0 else _field(6, 0, _zigzag(value))
+    if isinstance(value, (float, np.floating)):
+        return _field(3, 1, np.float64(value).astype('<f8').tobytes())
+    return _field(1, 2, str(value).encode('utf-8'))
+
+
+def _ring_area(ring):
+    """
+    타일 좌표(y 아래 방향) 고리의 부호 있는 면적 ×2 (양수: MVT 외곽 고리 방향)
+    """
+    x, y = ring[:, 0], ring[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def encode_polygons(polygons):
+    """
+    정수 타일 좌표 폴리곤 목록을 MVT 도형 명령 정수 목록으로 인코딩
+
+    외곽 고리는 면적이 양수, 구멍 고리는 음수가 되도록 방향을 맞춘다.
+    """
+    commands = []
+    cursor = np.zeros(2, dtype=np.int64)
+    for polygon in polygons:
+        rings = [shapely.get_coordinates(polygon.exterior)]
+        rings += [shapely.get_coordinates(interior) for interior in polygon.interiors]
+        for i, ring in enumerate(rings):
+            ring = np.rint(ring[:-1]).astype(np.int64)
+            if len(ring) < 3:
+                continue
+            area = _ring_area(ring)
+            if area == 0:
+                continue
+            if (area > 0) != (i == 0):
+                ring = ring[::-1]
+            deltas = np.diff(np.vstack([cursor, ring]), axis=0)
+            cursor = ring[-1]
+            zigzag = (deltas << 1) ^ (deltas >> 63)
+            commands.append(_MOVE_TO | (1 << 3))
+            commands.extend(zigzag[0].tolist())
+            commands.append(_LINE_TO | ((len(ring) - 1) << 3))
+            commands.extend(zigzag[1:].ravel().tolist())
+            commands.append(_CLOSE_PATH | (1 << 3))
+    return commands
+
+
+def encode_layer(name, features):
+    """
+    MVT Layer 메시지. features: [(id, {속성}, 도형 명령)] (결측 속성은 생략)
+    """
+    keys, values = {}, {}
+    encoded = []
+    for feature_id, properties, commands in features:
+        tags = []
+        for key, value in properties.items():
+            if value is None or (isinstance(value, (float, np.floating)) and math.isnan(value)):
+                continue
+            value_key = (type(value).__name__, value)
+            tags += [keys.setdefault(key, len(keys)), values.setdefault(value_key, len(values))]
+        feature = _field(1, 0, int(feature_id)) + _packed(2, tags) + _field(3, 0, _POLYGON) + _packed(4, commands)
+        encoded.append(_field(2, 2, feature))
+
+    layer = [_field(15, 0, 2), _field(1, 2, name.encode('utf-8'))] + encoded
+    layer += [_field(3, 2, key.encode('utf-8')) for key in keys]
+    layer += [_field(4, 2, _value(value)) for _, value in values]
+    layer.append(_field(5, 0, EXTENT))
+    return _field(3, 2, b''.join(layer))
+
+
+def tile_span(zoom):
+    """
+    확대 수준별 타일 한 변의 Web Mercator 거리 (미터)
+    """
+    return 2 * _ORIGIN_SHIFT / 2 ** zoom
+
+
+def _polygon_parts(geometry):
+    """
+    잘린 도형에서 폴리곤 부분만 추출 (자르면서 생긴 선/점 제외)
+    """
+    parts = shapely.get_parts(geometry)
+    return [part for part in parts if part.geom_type == 'Polygon' and not part.is_empty]
+
+
+def render_row(zoom, tile_y, layers):
+    """
+    한 타일 행의 MVT 타일 목록 [(z, x, y, 바이트)] 반환
+
+    layers: [(레이어 이름, 도형 배열, id 배열, 속성 사전 목록)] - 이 행과 여백에 걸친 도형만
+    """
+    span = tile_span(zoom)
+    margin = span * BUFFER / EXTENT
+    top = _ORIGIN_SHIFT - tile_y * span
+
+    columns = set()
+    for _, geometries, _, _ in layers:
+        bounds = shapely.bounds(geometries)
+        first = np.floor((bounds[:, 0] - margin + _ORIGIN_SHIFT) / span).astype(np.int64)
+        last = np.floor((bounds[:, 2] + margin + _ORIGIN_SHIFT) / span).astype(np.int64)
+        for start, stop in zip(first.tolist(), last.tolist()):
+            columns.update(range(start, stop + 1))
+
+    tiles = []
+    for tile_x in sorted(columns):
+        left = tile_x * span - _ORIGIN_SHIFT
+        encoded = []
+        for name, geometries, ids, properties in layers:
+            clipped = shapely.clip_by_rect(geometries, left - margin, top - span - margin,
+                                           left + span + margin, top + margin)
+            features = []
+            for i in np.flatnonzero(~shapely.is_empty(clipped)):
+                # Web Mercator → 타일 좌표 (y 아래 방향) 후 정수 격자에 맞춤
+                local = shapely.transform(clipped[i], lambda c: np.column_stack(
+                    [(c[:, 0] - left) / span * EXTENT, (top - c[:, 1]) / span * EXTENT]))
+                local = shapely.set_precision(local, 1.0)
+                commands = encode_polygons(_polygon_parts(local))
+                if commands:
+                    features.append((ids[i], properties[i], commands))
+            if features:
+                encoded.append(encode_layer(name, features))
+        if encoded:
+            tiles.append((zoom, tile_x, tile_y, b''.join(encoded)))
+    return tiles
+
+
+def _row_tasks(layers, zoom):
+    """
+    확대 수준 하나의 타일 행별 작업 인자 목록 (단순화 후 행마다 걸친 도형만 전달)
+    """
+    span = tile_span(zoom)
+    margin = span * BUFFER / EXTENT
+    rows = {}
+    for name, geometries, ids, properties in layers:
+        simplified = shapely.simplify(geometries, span * SIMPLIFY_UNITS / EXTENT, preserve_topology=True)
+        bounds = shapely.bounds(simplified)
+        first = np.floor((_ORIGIN_SHIFT - bounds[:, 3] - margin) / span).astype(np.int64)
+        last = np.floor((_ORIGIN_SHIFT - bounds[:, 1] + margin) / span).astype(np.int64)
+        for tile_y in range(int(first.min()), int(last.max()) + 1):
+            index = np.flatnonzero((first <= tile_y) & (last >= tile_y))
+            if len(index):
+                rows.setdefault(tile_y, []).append(
+                    (name, simplified[index], ids[index], [properties[i] for i in index]))
+    return [(zoom, tile_y, row_layers) for tile_y, row_layers in sorted(rows.items())]
+
+
+def _properties(gdf, id_column):
+    """
+    GeoDataFrame → (Web Mercator 도형 배열, id 배열, 속성 사전 목록)
+    """
+    gdf = gdf.to_crs('EPSG:3857')
+    columns = [column for column in gdf.columns if column != gdf.geometry.name]
+    records = gdf[columns].astype(object).where(gdf[columns].notna(), None).to_dict('records')
+    return gdf.geometry.to_numpy(), gdf[id_column].to_numpy(dtype=np.int64), records
+
+
+def _field_types(gdf):
+    return {column: 'Number' if np.issubdtype(gdf[column].dtype, np.number) else 'String'
+            for column in gdf.columns if column != gdf.geometry.name}
+
+
+def write_directory(tiles, output_dir, zooms):
+    """
+    output_dir/z/x/y.pbf 로 저장 (저장할 확대 수준의 기존 타일 폴더는 먼저 지움)
+    """
+    for zoom in zooms:
+        shutil.rmtree(os.path.join(output_dir, str(zoom)), ignore_errors=True)
+    for zoom, tile_x, tile_y, data in tiles:
+        tile_dir = os.path.join(output_dir, str(zoom), str(tile_x))
+        os.makedirs(tile_dir, exist_ok=True)
+        with open(os.path.join(tile_dir, f'{tile_y}.pbf'), 'wb') as f:
+            f.write(data)
+
+
+def write_mbtiles(tiles, path, metadata):
+    """
+    MBTiles(SQLite) 파일로 저장 (타일은 gzip 압축, 행 번호는 TMS 규칙으로 아래에서 위로)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_file = path + '.tmp'
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+    with sqlite3.connect(temp_file) as db:
+        db.execute('CREATE TABLE metadata (name TEXT, value TEXT)')
+        db.execute('CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)')
+        db.execute('CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)')
+        db.executemany('INSERT INTO metadata VALUES (?, ?)', metadata.items())
+        db.executemany('INSERT INTO tiles VALUES (?, ?, ?, ?)',
+                       ((zoom, tile_x, (1 << zoom) - 1 - tile_y, gzip.compress(data, mtime=0))
+                        for zoom, tile_x, tile_y, data in tiles))
+    db.close()
+    os.replace(temp_file, path)
+
+
+def render_vector_tiles(layers, output, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, workers=None, mbtiles=False,
+                        metadata=None):
+    """
+    경계 레이어들의 MVT 타일 피라미드를 output(폴더 또는 mbtiles=True이면 MBTiles 파일)에 저장
+
+    layers: [(레이어 이름, GeoDataFrame, id 컬럼)]. 도형 외 모든 컬럼이 타일 속성이 된다.
+    확대 수준별 타일 수와 크기, 레이어별 속성 종류를 담은 메타데이터를 반환한다.
+    """
+    prepared = [(name, *_properties(gdf, id_column)) for name, gdf, id_column in layers]
+    zooms = list(range(min_zoom, max_zoom + 1))
+    tasks = [task for zoom in zooms for task in _row_tasks(prepared, zoom)]
+
+    if workers == 1:
+        results = [render_row(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(render_row, *zip(*tasks)))
+    tiles = [tile for row in results for tile in row]
+
+    west, south, east, north = (float(v) for v in layers[0][1].to_crs('EPSG:4326').total_bounds)
+    counts = {str(zoom): {'tiles': 0, 'bytes': 0} for zoom in zooms}
+    for zoom, _, _, data in tiles:
+        counts[str(zoom)]['tiles'] += 1
+        counts[str(zoom)]['bytes'] += len(data)
+    vector_layers = [{'id': name, 'fields': _field_types(gdf), 'minzoom': min_zoom, 'maxzoom': max_zoom}
+                     for name, gdf, _ in layers]
+    info = {
+        'format': 'pbf',
+        'minzoom': min_zoom,
+        'maxzoom': max_zoom,
+        'bounds': [west, south, east, north],
+        'center': [(west + east) / 2, (south + north) / 2, min_zoom],
+        'vector_layers': vector_layers,
+        'tiles': counts
+    }
+    info.update(metadata or {})
+
+    if mbtiles:
+        write_mbtiles(tiles, output, {
+            'name': info.get('name', os.path.splitext(os.path.basename(output))[0]),
+            'format': 'pbf',
+            'minzoom': str(min_zoom),
+            'maxzoom': str(max_zoom),
+            'bounds': ','.join(f'{v:.6f}' for v in info['bounds']),
+            'center': ','.join(f'{v:.6f}' for v in info['center'][:2]) + f',{min_zoom}',
+            'json': json.dumps({'vector_layers': vector_layers}, ensure_ascii=False)
+        })
+    else:
+        write_directory(tiles, output, zooms)
+        with open(os.path.join(output, METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(dict(info, tiles_template='{z}/{x}/{y}.pbf'), f, ensure_ascii=False, indent=2)
+    return info
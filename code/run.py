@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+소방안전 빅데이터 분석 통합 실행 명령
+
+하위 명령마다 필요한 모듈만 불러온다. top은 동별 지표 캐시(core.indicators)만 읽으므로
+pandas/geopandas/folium을 불러오지 않고 바로 응답하고, render는 히트맵들을 작업 프로세스
+풀로 한 번에 생성하며(core.batch), 나머지 명령은 기존 스크립트를 같은 인자로 실행한다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/run.py top                      # 종합 위험도 상위 10개 동
+    python code/run.py top -n 20 --weights 0.3 0.3 0.2 0.2
+    python code/run.py render                   # 히트맵 6개 일괄 생성
+    python code/run.py render 종합 취약연령 --workers 2
+    python code/run.py pipeline --parquet       # = python code/run_pipeline.py --parquet
+    python code/run.py benchmark --variants real
+    python code/run.py sensitivity --samples 10000
+    python code/run.py correlation --workers 4
+    python code/run.py synthetic /tmp/synthetic/dataset --dongs 3500
+    python code/run.py serve --port 8765        # = python code/위험도_조회_서버.py --port 8765
+    python code/run.py replay | python code/run.py stream   # 구조출동 기록으로 경보 스트리밍 집계
+    python code/run.py top --live               # 게시된 실시간 구조출동 밀도로 순위 계산
+"""
+import argparse
+import contextlib
+import io
+import os
+import runpy
+import sys
+import time
+
+from core.paths import CODE_DIR, REPO_ROOT
+
+# 하위 명령 → (스크립트, 작업 디렉토리, 설명)
+SCRIPT_COMMANDS = {
+    'pipeline': ('run_pipeline.py', CODE_DIR, '전처리 파이프라인 증분 실행'),
+    'benchmark': ('run_benchmark.py', CODE_DIR, '파이프라인 단계 및 지도 스크립트 벤치마크'),
+    'sensitivity': ('종합_재난위험도_민감도분석.py', REPO_ROOT, '종합 재난 위험도 가중치 민감도 분석'),
+    'correlation': ('화재_위험요인_상관분석.py', REPO_ROOT, '위험요인 × 화재 피해 상관분석'),
+    'synthetic': ('합성_데이터_생성.py', CODE_DIR, '부하 시험용 합성 입력 자료 생성'),
+    'serve': ('위험도_조회_서버.py', CODE_DIR, '경보 좌표 → 동 위험도 조회 서버'),
+    'stream': ('구조출동_경보_집계.py', CODE_DIR, 'IoT 화재 경보 스트리밍 집계'),
+    'replay': ('구조출동_경보_재생.py', CODE_DIR, '구조출동 기록 → 경보 이벤트 재생'),
+}
+
+
+def print_top(count, weights=None, refresh=False, live=False):
+    """
+    종합 위험도 상위 동 출력 (동별 지표 캐시 사용, 캐시가 없거나 오래되었으면 다시 계산)
+
+    live=True이면 스트리밍 집계기가 게시한 실시간 지표(core.alarm_stream)를 사용한다.
+    """
+    import numpy as np
+
+    from core.indicators import dong_indicator_arrays
+    from core.scoring import DEFAULT_WEIGHTS, INDICATOR_LABELS, score
+
+    start = time.time()
+    # 캐시를 다시 만드는 경우 지표 계산 과정 출력은 생략
+    with contextlib.redirect_stdout(io.StringIO()):
+        if live:
+            from core.alarm_stream import live_indicator_arrays
+
+            arrays = live_indicator_arrays()
+        else:
+            arrays = dong_indicator_arrays(refresh=refresh)
+    weights = DEFAULT_WEIGHTS if weights is None else np.asarray(weights, dtype=float)
+
+    # 종합 위험도 지도와 같이 결측 지표는 0으로 보고 계산
+    risk, weighted = score(np.nan_to_num(arrays['matrix']), weights)
+    order = np.argsort(-risk, kind='stable')[:count]
+
+    print(f"🔝 종합 위험도 상위 {len(order)}개 동 (가중치: {', '.join(f'{w:g}' for w in weights)})")
+    for rank, i in enumerate(order, start=1):
+        parts = ', '.join(f"{label}:{value:.3f}" for label, value in zip(INDICATOR_LABELS, weighted[i]))
+        print(f"  {rank:>3}. {arrays['구명'][i]} {arrays['동명'][i]}: {risk[i]:.3f} ({parts})")
+    print(f"⏱️ {time.time() - start:.3f}초")
+
+
+def render_maps(names, workers):
+    """
+    히트맵 일괄 생성 후 결과 요약 출력. 실패한 지도가 있으면 False 반환
+    """
+    from core.batch import render_all
+
+    start = time.time()
+    print("🗺️ 히트맵 일괄 생성 시작...")
+    results = render_all(names, workers)
+    elapsed = time.time() - start
+
+    failed = [result for result in results if not result['success']]
+    for result in failed:
+        print(f"\n❌ {result['name']} 실패, 마지막 출력:")
+        print('\n'.join(result['log'].rstrip().splitlines()[-20:]))
+    print(f"\n✅ {len(results) - len(failed)}/{len(results)}개 지도 생성 ({elapsed:.2f}초, "
+          f"지도별 시간 합 {sum(result['seconds'] for result in results):.2f}초)")
+    return not failed
+
+
+def run_script(script, cwd, argv):
+    """
+    기존 스크립트를 주어진 작업 디렉토리와 인자로 현재 프로세스에서 실행
+    """
+    path = os.path.join(CODE_DIR, script)
+    os.chdir(cwd)
+    sys.argv = [path] + argv
+    runpy.run_path(path, run_name='__main__')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='소방안전 빅데이터 분석 통합 실행 명령')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    top = commands.add_parser('top', help='종합 위험도 상위 동 조회')
+    top.add_argument('-n', '--count', type=int, default=10, help='출력할 동 수')
+    top.add_argument('--weights', type=float, nargs=4, help='지표 가중치 (취약연령 취약자 노후주택 구조출동)')
+    top.add_argument('--refresh', action='store_true', help='캐시와 관계없이 지표 다시 계산')
+    top.add_argument('--live', action='store_true', help='게시된 실시간 구조출동 밀도 사용 (run.py stream)')
+
+    render = commands.add_parser('render', help='히트맵 일괄 생성')
+    render.add_argument('names', nargs='*', help='생성할 지도 (기본: 전체, 예: 종합 취약연령)')
+    render.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)')
+
+    for name, (_, _, help_text) in SCRIPT_COMMANDS.items():
+        commands.add_parser(name, help=help_text)
+
+    # 스크립트 명령은 나머지 인자를 그대로 스크립트에 전달 (--help도 스크립트 도움말로 전달)
+    if len(sys.argv) > 1 and sys.argv[1] in SCRIPT_COMMANDS:
+        script, cwd, _ = SCRIPT_COMMANDS[sys.argv[1]]
+        run_script(script, cwd, sys.argv[2:])
+        return
+
+    args = parser.parse_args()
+    if args.command == 'render':
+        if not render_maps(args.names, args.workers):
+            raise SystemExit(1)
+        return
+    print_top(args.count, args.weights, args.refresh, args.live)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 단계 및 지도 스크립트 벤치마크 실행
+
+저장소를 임시 작업 폴더에 복사하여 실행하므로 저장소의 dataset/figure 파일은 바뀌지 않는다.
+결과 JSON은 benchmark_results/ 에 저장되며, --compare로 이전 결과와 비교할 수 있다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/run_benchmark.py                                  # 모든 배율
+    python code/run_benchmark.py --variants real dispatch_x10
+    python code/run_benchmark.py --only 히트맵 --variants real
+    python code/run_benchmark.py --variants synthetic_real synthetic_3500
+    python code/run_benchmark.py --compare benchmark_results/이전결과.json
+"""
+import argparse
+import os
+import tempfile
+from datetime import datetime
+
+from core.benchmark import (SYNTHETIC_VARIANTS, VARIANTS, compare_results, load_results, run_benchmarks,
+                            save_results)
+from core.paths import REPO_ROOT
+
+RESULT_DIR = os.path.join(REPO_ROOT, 'benchmark_results')
+
+
+def print_comparison(rows, threshold):
+    print(f"\n📊 이전 결과와 비교 (기준: {threshold:.0%} 이상 증가)")
+    regressions = 0
+    for row in rows:
+        old_time, new_time, time_ratio = row['wall_s']
+        old_rss, new_rss, rss_ratio = row['peak_rss_mb']
+        mark = '⚠️ ' if row['regression'] else '  '
+        regressions += row['regression']
+        if None in (old_time, new_time):
+            print(f"{mark}[{row['variant']}] {row['case']}: {row['status'][0]} → {row['status'][1]}")
+            continue
+        print(f"{mark}[{row['variant']}] {row['case']}: {old_time:.2f}초 → {new_time:.2f}초 ({time_ratio:+.0%}), "
+              f"{old_rss:,.0f}MB → {new_rss:,.0f}MB ({rss_ratio:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파이프라인 단계 및 지도 스크립트 벤치마크')
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS) + list(SYNTHETIC_VARIANTS),
+                        default=list(VARIANTS), help='입력 배율 (synthetic_*: 합성 자료)')
+    parser.add_argument('--only', nargs='+', help='이름에 이 문자열이 들어간 대상만 실행')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmark_results/<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 볼 증가 비율')
+    parser.add_argument('--workspace', help='작업 폴더 (기본: 임시 폴더)')
+    parser.add_argument('--keep-workspace', action='store_true', help='작업 폴더와 실행 로그를 남김')
+    parser.add_argument('--seed', type=int, default=0, help='좌표 복제 잡음 및 합성 자료 난수 시드')
+    args = parser.parse_args()
+
+    workspace_root = args.workspace or tempfile.mkdtemp(prefix='benchmark_')
+    report = run_benchmarks(args.variants, workspace_root, only=args.only,
+                            keep=args.keep_workspace, seed=args.seed)
+    if not args.keep_workspace and not args.workspace:
+        os.rmdir(workspace_root)
+
+    output = args.output or os.path.join(RESULT_DIR, f"{datetime.now():%Y%m%d_%H%M%S}.json")
+    save_results(report, output)
+
+    failed = [r for r in report['results'] if r['status'] == 'failed']
+    print(f"\n✅ 완료: {len(report['results']) - len(failed)}개 성공/건너뜀, {len(failed)}개 실패")
+    print(f"📁 결과 저장: {output}")
+    if args.keep_workspace:
+        print(f"📁 작업 폴더: {workspace_root}")
+
+    regressions = 0
+    if args.compare:
+        regressions = print_comparison(compare_results(load_results(args.compare), report, args.threshold),
+                                       args.threshold)
+    if failed or regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
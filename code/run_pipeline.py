@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+전처리 파이프라인 증분 실행 스크립트
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/run_pipeline.py            # 변경된 단계만 실행
+    python code/run_pipeline.py --dry-run  # 실행될 단계만 출력
+    python code/run_pipeline.py --force    # 모든 단계 강제 재실행
+    python code/run_pipeline.py --parquet  # CSV 출력마다 타입 지정 Parquet 파일도 생성
+"""
+import argparse
+
+from core.pipeline import STAGES, order_stages, run_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전처리 파이프라인 증분 실행')
+    parser.add_argument('--force', action='store_true', help='해시와 관계없이 모든 단계 재실행')
+    parser.add_argument('--dry-run', action='store_true', help='실행하지 않고 실행될 단계만 출력')
+    parser.add_argument('--list', action='store_true', help='단계 의존성 목록 출력')
+    parser.add_argument('--parquet', action='store_true', help='CSV 출력을 Parquet(zstd)으로도 저장')
+    parser.add_argument('--verbose', action='store_true', help='각 스크립트의 출력 표시')
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in order_stages(STAGES):
+            print(f"{stage['name']}")
+            for path in stage['inputs']:
+                print(f"    ← {path}")
+            for path in stage['outputs']:
+                print(f"    → {path}")
+        return
+
+    summary = run_pipeline(force=args.force, dry_run=args.dry_run, verbose=args.verbose,
+                           parquet=args.parquet)
+    if summary['failed']:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-import geopandas as gpd
 import folium
 import os
+from core.boundaries import DONG_SHP, GU_SHP, load_boundaries
 
 def test_boundary_display():
     """
@@ -9,9 +9,8 @@ def test_boundary_display():
     print("=== 서울시 행정구역 경계 표시 테스트 ===")
     
     # 파일 경로 설정
-    boundary_dir = '../dataset/서울시_행정구역_경계'
-    gu_file = os.path.join(boundary_dir, '서울시_구경계.shp')
-    dong_file = os.path.join(boundary_dir, '서울시_동경계.shp')
+    gu_file = GU_SHP
+    dong_file = DONG_SHP
     
     # 파일 존재 확인
     if not os.path.exists(gu_file):
@@ -22,29 +21,24 @@ def test_boundary_display():
         return
     
     try:
-        # 1. Shapefile 데이터 로드
-        print("📂 Shapefile 데이터 로딩 중...")
-        gu_gdf = gpd.read_file(gu_file, encoding='cp949')
-        dong_gdf = gpd.read_file(dong_file, encoding='cp949')
+        # 1. 경계 데이터 로드
+        print("📂 경계 데이터 로딩 중...")
+        # 지도 zoom_start(11)에 맞게 단순화된 경계 사용 (HTML 크기 절감)
+        gu_gdf, dong_gdf = load_boundaries(zoom=11)
         
         print(f"✅ 구경계 데이터: {len(gu_gdf)}개 구")
         print(f"✅ 동경계 데이터: {len(dong_gdf)}개 동")
         print(f"📍 구경계 좌표계: {gu_gdf.crs}")
         print(f"📍 동경계 좌표계: {dong_gdf.crs}")
         
-        # 2. 좌표계 변환 (WGS84로 변환)
-        print("🌐 좌표계를 WGS84로 변환 중...")
-        gu_gdf = gu_gdf.to_crs('EPSG:4326')
-        dong_gdf = dong_gdf.to_crs('EPSG:4326')
-        
-        # 3. 서울시 중심 좌표 계산
+        # 2. 서울시 중심 좌표 계산
         bounds = gu_gdf.total_bounds  # [minx, miny, maxx, maxy]
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
         
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 4. Folium 지도 생성
+        # 3. Folium 지도 생성
         print("🗺️  인터랙티브 지도 생성 중...")
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -52,7 +46,7 @@ def test_boundary_display():
             tiles='OpenStreetMap'
         )
         
-        # 5. 동경계 추가 (더 세밀한 경계)
+        # 4. 동경계 추가 (더 세밀한 경계)
         print("📍 동경계 추가 중...")
         folium.GeoJson(
             dong_gdf.to_json(),
@@ -67,7 +61,7 @@ def test_boundary_display():
             tooltip=folium.GeoJsonTooltip(fields=['ADM_NM'], aliases=['동명:'])
         ).add_to(m)
         
-        # 6. 구경계 추가 (굵은 경계선)
+        # 5. 구경계 추가 (굵은 경계선)
         print("📍 구경계 추가 중...")
         folium.GeoJson(
             gu_gdf.to_json(),
@@ -82,7 +76,7 @@ def test_boundary_display():
             tooltip=folium.GeoJsonTooltip(fields=['SGG_NM'], aliases=['구명:'])
         ).add_to(m)
         
-        # 7. 범례 추가
+        # 6. 범례 추가
         legend_html = '''
         <div style="position: fixed; 
                     top: 10px; right: 10px; width: 280px; height: 120px; 
@@ -95,7 +89,7 @@ def test_boundary_display():
         '''
         m.get_root().html.add_child(folium.Element(legend_html))
         
-        # 8. figure 폴더 생성 및 지도 저장
+        # 7. figure 폴더 생성 및 지도 저장
         figure_dir = '../figure'
         os.makedirs(figure_dir, exist_ok=True)
         
@@ -105,9 +99,9 @@ def test_boundary_display():
         print(f"✅ 지도 파일 저장 완료: {output_file}")
         print(f"🌐 브라우저에서 {output_file} 파일을 열어서 확인하세요!")
         
-        # 9. 간단한 통계 출력
+        # 8. 간단한 통계 출력
         print("\n=== 데이터 통계 ===")
-        print(f"구 목록 (샘플): {', '.join(gu_gdf['SGG_NM'].str.replace('서울특별시 ', '').head(5).tolist())}...")
+        print(f"구 목록 (샘플): {', '.join(gu_gdf['구명'].head(5).tolist())}...")
         print(f"동 목록 (샘플): {', '.join(dong_gdf['ADM_NM'].head(5).tolist())}...")
         
         return True
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+pytest 공통 설정 - 저장소 루트나 code 폴더 어디서 실행해도 core 패키지를 불러올 수 있게 함
+
+사용법:
+    python -m pytest -q code/tests
+"""
+import os
+import sys
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CODE_DIR not in sys.path:
+    sys.path.insert(0, CODE_DIR)
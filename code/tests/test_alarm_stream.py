@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+core.alarm_stream 슬라이딩 창 건수가 재생한 이벤트를 직접 다시 센 결과와 같은지 확인
+"""
+import io
+import os
+
+import numpy as np
+import pytest
+
+from core.alarm_stream import BUCKETS, WINDOWS, SlidingWindow, split_lines
+from 구조출동_경보_재생 import event_times, replay
+
+DONGS = 50
+
+
+def recount(timestamps, dongs, seconds, size, buckets=BUCKETS):
+    """
+    지금까지 받은 이벤트 중 마지막 칸에서 buckets칸 안에 드는 이벤트의 동별 건수
+    """
+    width = seconds / buckets
+    bucket = np.floor(timestamps / width).astype(np.int64)
+    head = bucket.max()
+    return np.bincount(dongs[bucket > head - buckets], minlength=size)
+
+
+def _batches(rng, count):
+    # 1~300건씩 나눈 묶음 경계
+    return np.cumsum(np.r_[0, rng.integers(1, 300, count // 50)]).clip(max=count)
+
+
+@pytest.mark.parametrize('name', list(WINDOWS))
+def test_window_matches_recount(name):
+    seconds = WINDOWS[name]
+    rng = np.random.default_rng(len(name))
+    # 재생기와 같은 시각열에 늦게 도착하는 이벤트와 창보다 긴 공백을 섞음
+    timestamps = event_times(5_000, '2023-01-01', 30, rng)
+    timestamps[2_500:] += 3 * seconds
+    late = rng.random(len(timestamps)) < 0.05
+    timestamps[late] -= rng.uniform(0, 2 * seconds, late.sum())
+    dongs = rng.integers(0, DONGS, len(timestamps))
+
+    window = SlidingWindow(seconds, DONGS)
+    bounds = _batches(rng, len(timestamps))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start == stop:
+            continue
+        window.add(timestamps[start:stop], dongs[start:stop])
+        expected = recount(timestamps[:stop], dongs[:stop], seconds, DONGS)
+        np.testing.assert_array_equal(window.counts, expected)
+        np.testing.assert_array_equal(window.ring.sum(axis=0), expected)
+
+
+def test_aggregator_replay_matches_recount():
+    from core.boundaries import DONG_SHP
+    if not os.path.exists(DONG_SHP):
+        pytest.skip(f'동 경계 파일이 없습니다: {DONG_SHP}')
+    from core.alarm_stream import AlarmAggregator
+    from core.geocode import locate_dongs
+
+    aggregator = AlarmAggregator()
+    rng = np.random.default_rng(0)
+    west, south, east, north = aggregator.dong.total_bounds
+    count = 20_000
+    lon = rng.uniform(west - 0.05, east + 0.05, count)
+    lat = rng.uniform(south - 0.05, north + 0.05, count)
+    timestamps = event_times(count, '2023-01-01', 20, rng)
+
+    # 재생기가 쓴 JSON 줄을 임의 크기 조각으로 나누어 집계기에 넣음
+    out = io.BytesIO()
+    replay(out, timestamps, lon, lat)
+    data = out.getvalue()
+    cuts = np.sort(rng.integers(0, len(data), 200))
+    pending = b''
+    for start, stop in zip(np.r_[0, cuts], np.r_[cuts, len(data)]):
+        lines, pending = split_lines(pending, data[start:stop])
+        aggregator.add_lines(lines)
+    aggregator.add_lines([pending])
+
+    # encode_events가 시각을 소수 셋째 자리까지 쓰므로 같은 값으로 다시 셈
+    timestamps = np.round(timestamps, 3)
+    located, _ = locate_dongs(lon, lat)
+    inside = located >= 0
+    assert aggregator.stats['수신'] == count and aggregator.stats['배정'] == inside.sum()
+    snapshot = aggregator.snapshot()
+    for name, seconds in WINDOWS.items():
+        expected = recount(timestamps[inside], located[inside], seconds, len(aggregator.dong))
+        np.testing.assert_array_equal(snapshot[name]['건수'], expected)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+core.geocode 좌표 → 행정동 배정의 경계 사례 (서울 밖 좌표만 있는 묶음, 스칼라 좌표)
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core.boundaries import DONG_SHP
+
+pytestmark = pytest.mark.skipif(not os.path.exists(DONG_SHP), reason=f'동 경계 파일이 없습니다: {DONG_SHP}')
+
+
+def test_geocode_all_far_outside():
+    # 보정 거리 안에 동이 하나도 없는 묶음 (가장 가까운 동 검색 결과가 비어 있음)
+    from core.geocode import geocode
+
+    result = geocode(np.array([130.0, 131.0, 125.0]), np.array([30.0, 31.0, 33.0]))
+    assert (result['동코드'] == -1).all()
+    assert (result['구코드'] == -1).all()
+    assert result['보정거리_m'].isna().all()
+    assert result['동명'].isna().all()
+
+
+def test_geocode_mixed_batch():
+    from core.geocode import geocode
+
+    result = geocode([126.97, 130.0, np.nan], [37.56, 30.0, 37.5])
+    assert result['동코드'].iat[0] > 0 and result['보정거리_m'].iat[0] == 0
+    assert (result['동코드'].iloc[1:] == -1).all() and result['보정거리_m'].iloc[1:].isna().all()
+
+
+def test_geocode_scalar():
+    from core.geocode import geocode, locate_dongs
+
+    result = geocode(126.97, 37.56)
+    assert len(result) == 1
+    assert result['구명'].iat[0] == '중구'
+    located, distance = locate_dongs(130.0, 30.0)
+    assert located.tolist() == [-1] and np.isnan(distance).all()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+core.pipeline 증분 실행이 스크립트가 불러오는 core 모듈 변경을 감지하는지 확인
+"""
+import os
+
+import pytest
+
+import core.pipeline as pipeline
+
+STAGE_SCRIPT = '''from core.helper import transform
+
+with open('dataset/out.csv', 'w', encoding='utf-8') as f:
+    f.write(transform(open('dataset/in.csv', encoding='utf-8').read()))
+'''
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def scratch_repo(tmp_path, monkeypatch):
+    """
+    code/stage.py → core/helper.py → core/util.py 를 불러오는 단계 하나짜리 임시 저장소
+    """
+    _write(tmp_path / 'code' / 'stage.py', STAGE_SCRIPT)
+    _write(tmp_path / 'code' / 'core' / '__init__.py', '')
+    _write(tmp_path / 'code' / 'core' / 'helper.py',
+           'from core.util import suffix\n\n\ndef transform(text):\n    return text.upper() + suffix()\n')
+    _write(tmp_path / 'code' / 'core' / 'util.py', "def suffix():\n    return '!'\n")
+    _write(tmp_path / 'dataset' / 'in.csv', 'a,b\n')
+
+    root = str(tmp_path)
+    monkeypatch.setattr(pipeline, 'repo_path', lambda p: os.path.join(root, *p.split('/')))
+    monkeypatch.setattr(pipeline, 'REPO_ROOT', root)
+    monkeypatch.setattr(pipeline, 'CODE_DIR', os.path.join(root, 'code'))
+    monkeypatch.setattr(pipeline, 'CACHE_DIR', os.path.join(root, 'dataset', '.cache'))
+    monkeypatch.setattr(pipeline, 'STATE_FILE', os.path.join(root, 'dataset', '.cache', 'pipeline_state.json'))
+    monkeypatch.setattr(pipeline, 'STAGES', [
+        pipeline._script('stage.py', pipeline.CWD_ROOT, ['dataset/in.csv'], ['dataset/out.csv'])])
+    return tmp_path
+
+
+def test_core_dependencies_transitive(scratch_repo):
+    assert pipeline.core_dependencies('stage.py') == ['code/core/helper.py', 'code/core/util.py']
+
+
+def test_population_stage_depends_on_core_population():
+    assert 'code/core/population.py' in pipeline.core_dependencies('4_select_feature_서울시_등록인구_통합.py')
+    assert 'code/core/density.py' in pipeline.core_dependencies('구조출동_밀도격자.py')
+
+
+@pytest.mark.parametrize('module', ['helper.py', 'util.py'])
+def test_core_module_change_reruns_stage(scratch_repo, module):
+    assert pipeline.run_pipeline()['executed'] == ['stage']
+    assert pipeline.run_pipeline()['skipped'] == ['stage']
+
+    with open(scratch_repo / 'code' / 'core' / module, 'a', encoding='utf-8') as f:
+        f.write('\n# 변경\n')
+    assert pipeline.run_pipeline(dry_run=True)['executed'] == ['stage']
+    assert pipeline.run_pipeline()['executed'] == ['stage']
+    assert pipeline.run_pipeline()['skipped'] == ['stage']
+    assert (scratch_repo / 'dataset' / 'out.csv').read_text(encoding='utf-8') == 'A,B\n!'
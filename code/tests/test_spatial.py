@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+core.spatial.PointLocator 격자 배정이 정밀 판정(_locate_exact)과 같은지 확인
+"""
+import numpy as np
+import pytest
+import shapely
+
+from core.boundaries import DONG_SHP, load_dong_boundary
+from core.geocode import GRID_CELL
+from core.spatial import CHUNK_SIZE, PointLocator
+
+
+@pytest.fixture(scope='module')
+def dong_locator():
+    import os
+    if not os.path.exists(DONG_SHP):
+        pytest.skip(f'동 경계 파일이 없습니다: {DONG_SHP}')
+    locator = PointLocator(load_dong_boundary().geometry.values)
+    # 캐시(core.geocode._load_grid)를 거치지 않고 현재 경계로 새로 만든 격자
+    locator.grid = locator.build_grid(GRID_CELL)
+    return locator
+
+
+def _edge_points(polygons, rng, count):
+    """
+    경계선 위의 점 (꼭짓점과 선분 중점)과 그 주변으로 아주 조금 흔든 점
+    """
+    coords = shapely.get_coordinates(shapely.get_rings(polygons))
+    vertices = coords[rng.choice(len(coords) - 1, count)]
+    index = rng.choice(len(coords) - 1, count)
+    midpoints = (coords[index] + coords[index + 1]) / 2
+    jittered = np.vstack([vertices, midpoints]) + rng.normal(0, GRID_CELL / 1000, (2 * count, 2))
+    return np.vstack([vertices, midpoints, jittered])
+
+
+def _assert_same(locator, lon, lat):
+    exact = locator._locate_exact(lon, lat, CHUNK_SIZE)
+    np.testing.assert_array_equal(locator.locate(lon, lat), exact)
+    return exact
+
+
+def test_grid_matches_exact_random(dong_locator):
+    # 서울 경계 사각형보다 넓게 뿌려 서울 밖 좌표와 격자 밖 좌표도 포함
+    rng = np.random.default_rng(0)
+    west, south, east, north = shapely.total_bounds(dong_locator.polygons)
+    lon = rng.uniform(west - 0.1, east + 0.1, 200_000)
+    lat = rng.uniform(south - 0.1, north + 0.1, 200_000)
+    exact = _assert_same(dong_locator, lon, lat)
+    assert (exact >= 0).any() and (exact == -1).any()
+
+
+def test_grid_matches_exact_edges(dong_locator):
+    rng = np.random.default_rng(1)
+    points = _edge_points(dong_locator.polygons, rng, 20_000)
+    _assert_same(dong_locator, points[:, 0], points[:, 1])
+
+
+def test_grid_matches_exact_cell_corners(dong_locator):
+    # 칸 경계선(floor 판정이 바뀌는 좌표) 위와 결측 좌표
+    cells = dong_locator.grid['cells']
+    west, south = dong_locator.grid['origin']
+    rng = np.random.default_rng(2)
+    col = rng.integers(0, cells.shape[1] + 1, 50_000)
+    row = rng.integers(0, cells.shape[0] + 1, 50_000)
+    lon = np.r_[west + col * GRID_CELL, np.nan, 127.0]
+    lat = np.r_[south + row * GRID_CELL, 37.5, np.nan]
+    exact = _assert_same(dong_locator, lon, lat)
+    assert exact[-1] == exact[-2] == -1
+
+
+def test_grid_matches_exact_overlapping():
+    # 겹치거나 맞닿은 작은 폴리곤 (경계 위 좌표는 앞선 폴리곤에 배정)
+    polygons = [shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1), shapely.box(0.5, 0.5, 1.5, 1.5),
+                shapely.Point(3, 3).buffer(0.7)]
+    locator = PointLocator(polygons)
+    locator.grid = locator.build_grid(0.1)
+    rng = np.random.default_rng(3)
+    points = np.vstack([rng.uniform(-0.5, 4, (20_000, 2)), _edge_points(locator.polygons, rng, 2_000),
+                        np.round(rng.uniform(-0.5, 4, (5_000, 2)), 1)])
+    _assert_same(locator, points[:, 0], points[:, 1])
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+core.storage.read_table(numeric=...)가 건수 컬럼을 숫자로 보장하는지 확인
+"""
+import pandas as pd
+import pytest
+
+from core.storage import read_table, to_count_columns, write_parquet
+
+CSV = '''구명,발생(건),사망(명),비고
+종로구,"1,234",-,a
+중구,-,,b
+용산구,12,3,c
+성동구,7,0.5,d
+'''
+
+
+def _write_csv(tmp_path, text=CSV):
+    path = tmp_path / '표.csv'
+    path.write_text(text, encoding='utf-8-sig')
+    return str(path)
+
+
+@pytest.mark.parametrize('parquet', [False, True])
+def test_read_table_numeric_columns(tmp_path, parquet):
+    path = _write_csv(tmp_path)
+    if parquet:
+        write_parquet(path)
+    df = read_table(path, numeric=['발생(건)', '사망(명)'])
+    assert df['발생(건)'].dtype == 'int64'
+    assert df['발생(건)'].tolist() == [1234, 0, 12, 7]
+    assert pd.api.types.is_float_dtype(df['사망(명)'])
+    assert df['사망(명)'].tolist() == [0, 0, 3, 0.5]
+
+
+@pytest.mark.parametrize('parquet', [False, True])
+def test_read_table_numeric_rejects_unknown_tokens(tmp_path, parquet):
+    # 'X'처럼 값 없음 표기가 아닌 문자열은 0으로 바꾸지 않고 오류
+    path = _write_csv(tmp_path, CSV.replace('용산구,12', '용산구,X'))
+    if parquet:
+        write_parquet(path)
+    assert read_table(path)['발생(건)'].dtype == 'object'
+    with pytest.raises(ValueError, match="발생\\(건\\).*'X'"):
+        read_table(path, numeric=['발생(건)'])
+
+
+def test_to_count_columns_missing_column():
+    with pytest.raises(ValueError, match='건수 컬럼이 없습니다'):
+        to_count_columns(pd.DataFrame({'a': [1]}), ['b'])
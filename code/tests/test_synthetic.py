@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+core.synthetic.encode_csv가 DataFrame.to_csv(index=False)와 같은 바이트를 만드는지 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.synthetic import encode_csv
+
+# 따옴표가 필요한 범주 (쉼표, 큰따옴표, 줄바꿈)와 필요 없는 범주를 섞음
+LABELS = ['강남구', '종로구,청운동', '따옴표 "안" 값', '줄\n바꿈', '', 'plain']
+
+
+def _to_csv(fields):
+    # 같은 필드를 DataFrame으로 만들어 pandas로 쓴 바이트 (헤더 줄 제외)
+    columns = {}
+    float_format = None
+    for i, (kind, values, spec) in enumerate(fields):
+        if kind == 'category':
+            columns[f'c{i}'] = np.asarray(spec, dtype=object)[values]
+        else:
+            columns[f'c{i}'] = values
+            float_format = f'%.{spec}f'
+    text = pd.DataFrame(columns).to_csv(index=False, float_format=float_format, lineterminator='\n')
+    return text.split('\n', 1)[1].encode('utf-8')
+
+
+@pytest.mark.parametrize('decimals', [0, 1, 6])
+def test_encode_csv_matches_to_csv(decimals):
+    rng = np.random.default_rng(decimals)
+    size = 500
+    values = rng.uniform(0, 1000, size) * rng.choice([1e-3, 1, 1e3], size)
+    values[rng.random(size) < 0.2] = np.nan
+    values[:3] = [0.0, np.nan, 0.5]
+    fields = [
+        ('category', rng.integers(0, len(LABELS), size), LABELS),
+        ('fixed', values, decimals),
+        ('category', rng.integers(0, 2, size), ['a', 'b,c']),
+    ]
+    assert encode_csv(fields) == _to_csv(fields)
+
+
+def test_encode_csv_all_missing():
+    # 결측만 있는 열은 빈 값만 남음
+    fields = [('fixed', np.full(4, np.nan), 6), ('category', np.array([0, 1, 0, 1]), ['"x"', 'y'])]
+    assert encode_csv(fields) == _to_csv(fields)
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+core.vector_tiles로 만든 MVT 타일을 다시 읽어 도형, 고리 방향, 속성을 확인하는 회귀 테스트
+"""
+import struct
+
+import numpy as np
+import shapely
+from shapely.geometry import Polygon, box
+
+from core.tiles import _ORIGIN_SHIFT
+from core.vector_tiles import EXTENT, encode_layer, encode_polygons, render_row, tile_span
+
+ZOOM = 12
+
+
+def _varint(data, i):
+    result = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return result, i
+
+
+def _fields(data):
+    # protobuf 메시지 → [(필드 번호, 값)] (길이 지정 값은 바이트, 64비트 값은 8바이트)
+    i, out = 0, []
+    while i < len(data):
+        key, i = _varint(data, i)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, i = _varint(data, i)
+        elif wire_type == 1:
+            value, i = data[i:i + 8], i + 8
+        else:
+            length, i = _varint(data, i)
+            value, i = data[i:i + length], i + length
+        out.append((number, value))
+    return out
+
+
+def _packed(data):
+    i, out = 0, []
+    while i < len(data):
+        value, i = _varint(data, i)
+        out.append(value)
+    return out
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def _decode_value(data):
+    (number, value), = _fields(data)
+    if number == 1:
+        return value.decode('utf-8')
+    if number == 3:
+        return struct.unpack('<d', value)[0]
+    if number == 6:
+        return _unzigzag(value)
+    if number == 7:
+        return bool(value)
+    return value
+
+
+def _decode_rings(commands):
+    # 도형 명령 → 고리 좌표 목록 (타일 좌표, 닫는 점 제외)
+    rings, ring = [], None
+    x = y = i = 0
+    while i < len(commands):
+        command, count = commands[i] & 7, commands[i] >> 3
+        i += 1
+        if command == 7:
+            rings.append(ring)
+            continue
+        for _ in range(count):
+            x += _unzigzag(commands[i])
+            y += _unzigzag(commands[i + 1])
+            i += 2
+            ring = [(x, y)] if command == 1 else ring + [(x, y)]
+    return rings
+
+
+def _ring_area(ring):
+    ring = np.asarray(ring, dtype=float)
+    return float(np.dot(ring[:, 0], np.roll(ring[:, 1], -1)) - np.dot(np.roll(ring[:, 0], -1), ring[:, 1]))
+
+
+def decode_tile(data):
+    """
+    MVT 타일 바이트 → {레이어 이름: {'version', 'extent', 'features': [(id, 종류, 속성, 고리 목록)]}}
+    """
+    layers = {}
+    for number, layer_data in _fields(data):
+        assert number == 3
+        layer = _fields(layer_data)
+        keys = [value.decode('utf-8') for number, value in layer if number == 3]
+        values = [_decode_value(value) for number, value in layer if number == 4]
+        features = []
+        for number, feature_data in layer:
+            if number != 2:
+                continue
+            feature = dict(_fields(feature_data))
+            tags = _packed(feature[2])
+            properties = {keys[tags[j]]: values[tags[j + 1]] for j in range(0, len(tags), 2)}
+            features.append((feature[1], feature[3], properties, _decode_rings(_packed(feature[4]))))
+        name = next(value for number, value in layer if number == 1).decode('utf-8')
+        layers[name] = {
+            'version': next(value for number, value in layer if number == 15),
+            'extent': next(value for number, value in layer if number == 5),
+            'features': features
+        }
+    return layers
+
+
+def _polygons(rings):
+    # 면적 양수 고리가 새 폴리곤의 외곽, 이어지는 음수 고리가 그 구멍 (MVT 2.1 규칙)
+    polygons = []
+    for ring in rings:
+        if _ring_area(ring) > 0:
+            polygons.append([ring, []])
+        else:
+            polygons[-1][1].append(ring)
+    return [Polygon(shell, holes) for shell, holes in polygons]
+
+
+def _tile_origin(tile_x, tile_y):
+    span = tile_span(ZOOM)
+    return tile_x * span - _ORIGIN_SHIFT, _ORIGIN_SHIFT - tile_y * span
+
+
+def _to_mercator(geometry, tile_x, tile_y):
+    span = tile_span(ZOOM)
+    left, top = _tile_origin(tile_x, tile_y)
+    return shapely.transform(geometry, lambda c: np.column_stack(
+        [left + c[:, 0] / EXTENT * span, top - c[:, 1] / EXTENT * span]))
+
+
+def test_encode_polygons_winding():
+    # 방향을 일부러 뒤집어 넣어도 외곽은 양수, 구멍은 음수 면적으로 인코딩됨
+    shell = [(0, 0), (0, 100), (100, 100), (100, 0)]
+    hole = [(20, 20), (60, 20), (60, 60), (20, 60)]
+    for polygon in [Polygon(shell, [hole]), Polygon(shell[::-1], [hole[::-1]])]:
+        rings = _decode_rings(encode_polygons([polygon]))
+        assert len(rings) == 2
+        assert _ring_area(rings[0]) > 0 > _ring_area(rings[1])
+        assert _polygons(rings)[0].equals(polygon)
+
+
+def test_encode_layer_properties():
+    commands = encode_polygons([box(0, 0, 10, 10)])
+    data = encode_layer('동', [(7, {'동명': '청운효자동', '점수': 0.25, '순위': 3, '결측': float('nan')}, commands)])
+    layer = decode_tile(data)['동']
+    assert layer['version'] == 2 and layer['extent'] == EXTENT
+    feature_id, kind, properties, rings = layer['features'][0]
+    assert (feature_id, kind) == (7, 3)
+    assert properties == {'동명': '청운효자동', '점수': 0.25, '순위': 3}
+    assert _polygons(rings)[0].equals(box(0, 0, 10, 10))
+
+
+def test_render_row_roundtrip():
+    # 서울 부근 타일 행에서 구멍 있는 폴리곤 하나는 타일 안에, 하나는 두 타일 경계에 걸치게 둠
+    span = tile_span(ZOOM)
+    tile_x = int((14_137_000 + _ORIGIN_SHIFT) // span)
+    tile_y = int((_ORIGIN_SHIFT - 4_516_000) // span)
+    left, top = _tile_origin(tile_x, tile_y)
+    cx, cy = left + span / 2, top - span / 2
+    inner = Polygon(shapely.get_coordinates(box(cx - 3000, cy - 3000, cx + 3000, cy + 3000).exterior),
+                    [shapely.get_coordinates(box(cx - 1000, cy - 1000, cx + 500, cy + 1500).exterior)])
+    edge = shapely.Point(left + span, cy).buffer(1500)
+    geometries = np.array([inner, edge], dtype=object)
+    properties = [{'이름': '안쪽'}, {'이름': '경계'}]
+
+    tiles = render_row(ZOOM, tile_y, [('경계', geometries, np.array([1, 2]), properties)])
+    assert [(z, x, y) for z, x, y, _ in tiles] == [(ZOOM, tile_x, tile_y), (ZOOM, tile_x + 1, tile_y)]
+
+    # 1 타일 단위 반올림 오차 (둘레 × 반 칸) 안에서 원래 도형과 같아야 함
+    unit = span / EXTENT
+    decoded = {1: [], 2: []}
+    for _, x, y, data in tiles:
+        for feature_id, kind, feature_properties, rings in decode_tile(data)['경계']['features']:
+            assert kind == 3
+            assert feature_properties == properties[feature_id - 1]
+            for ring in rings:
+                assert len(ring) >= 3 and _ring_area(ring) != 0
+            polygons = _polygons(rings)
+            assert all(polygon.is_valid for polygon in polygons)
+            decoded[feature_id] += [_to_mercator(polygon, x, y) for polygon in polygons]
+
+    assert len(decoded[1]) == 1 and len(decoded[1][0].interiors) == 1
+    assert len(decoded[2]) == 2
+    for feature_id, original in [(1, inner), (2, edge)]:
+        merged = shapely.union_all(decoded[feature_id])
+        assert original.symmetric_difference(merged).area < original.length * unit
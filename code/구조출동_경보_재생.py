@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 기록 → IoT 화재 경보 이벤트 재생기
+
+실제 센서 대신 4_select_feature 구조출동 좌표를 경보 이벤트 JSON 줄로 내보내
+구조출동_경보_집계.py를 시험한다. 구조출동 자료에는 출동 시각이 없으므로 기록마다
+--start부터 --days일 사이의 시각을 무작위로(같은 --seed이면 같게) 붙여 시각 순으로
+내보낸다. --speed를 주면 이벤트 시각 간격을 그 배율로 줄여 실제 시간에 맞춰 보내고,
+주지 않으면 최대한 빨리 보낸다. 이벤트는 표준출력(파이프), 파일 또는 TCP 소켓으로
+보내며 진행 메시지는 표준오류로 출력한다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/구조출동_경보_재생.py | python code/구조출동_경보_집계.py
+    python code/구조출동_경보_재생.py --repeat 20 --output /tmp/경보.jsonl      # 약 90만 건
+    python code/구조출동_경보_재생.py --connect 127.0.0.1:8766 --speed 3600      # 1시간을 1초에
+"""
+import argparse
+import os
+import socket
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from core.alarm_stream import encode_events
+from core.dispatch import valid_coordinates
+from core.paths import SELECT_DIR
+from core.storage import read_table
+
+DEFAULT_INPUT = os.path.join(SELECT_DIR, '서울시_구조출동_selected_features.csv')
+
+# 구조출동 원본(서울시_구조출동_2023_한강.csv)의 자료 기간
+DEFAULT_START = '2023-01-01'
+DEFAULT_DAYS = 365
+
+# 한 번에 내보낼 최대 이벤트 수
+WRITE_BATCH = 10_000
+
+
+def event_times(count, start, days, rng):
+    """
+    start부터 days일 사이의 무작위 시각 count개 (유닉스 초, 오름차순)
+    """
+    origin = datetime.fromisoformat(start).timestamp()
+    return np.sort(origin + rng.uniform(0, days * 86400, count))
+
+
+def replay(out, timestamps, lon, lat, speed=None):
+    """
+    이벤트를 out에 써 넣음. speed가 있으면 (이벤트 시각 - 첫 시각) / speed초에 맞춰 보냄
+    """
+    started = time.monotonic()
+    position = 0
+    while position < len(timestamps):
+        if speed:
+            # 지금까지 보낼 때가 된 이벤트까지 (없으면 다음 이벤트 시각까지 대기)
+            elapsed = (time.monotonic() - started) * speed
+            due = int(np.searchsorted(timestamps, timestamps[0] + elapsed, side='right'))
+            if due <= position:
+                time.sleep(min((timestamps[position] - timestamps[0] - elapsed) / speed, 0.1))
+                continue
+            stop = min(due, position + WRITE_BATCH)
+        else:
+            stop = min(position + WRITE_BATCH, len(timestamps))
+        out.write(encode_events(timestamps[position:stop], lon[position:stop], lat[position:stop]))
+        out.flush()
+        position = stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구조출동 기록 → IoT 화재 경보 이벤트 재생기')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='구조출동 좌표 CSV')
+    parser.add_argument('--start', default=DEFAULT_START, help='첫 이벤트 기간 시작 (ISO 날짜/시각)')
+    parser.add_argument('--days', type=float, default=DEFAULT_DAYS, help='이벤트 기간 (일)')
+    parser.add_argument('--repeat', type=int, default=1, help='기록을 반복할 횟수 (기간도 이어서 늘어남)')
+    parser.add_argument('--speed', type=float, help='재생 배율 (예: 3600 = 1시간을 1초에, 생략: 최대 속도)')
+    parser.add_argument('--seed', type=int, default=0, help='시각 난수 시드')
+    destination = parser.add_mutually_exclusive_group()
+    destination.add_argument('--output', help='표준출력 대신 저장할 JSON 줄 파일')
+    destination.add_argument('--connect', metavar='HOST:PORT', help='표준출력 대신 보낼 집계기 소켓 주소')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 구조출동 데이터를 찾을 수 없습니다: {args.input}", file=sys.stderr)
+        raise SystemExit(1)
+
+    # 1. 좌표 로드와 시각 부여 (반복마다 기간을 이어 붙임)
+    coord_df = read_table(args.input, columns=['피해지역_경도', '피해지역_위도'])
+    coord_df = coord_df[valid_coordinates(coord_df)]
+    lon = np.tile(coord_df['피해지역_경도'].to_numpy(dtype=float), args.repeat)
+    lat = np.tile(coord_df['피해지역_위도'].to_numpy(dtype=float), args.repeat)
+    rng = np.random.default_rng(args.seed)
+    timestamps = np.concatenate([event_times(len(coord_df), args.start, args.days, rng) + i * args.days * 86400
+                                 for i in range(args.repeat)])
+    order = np.argsort(timestamps, kind='stable')
+    timestamps, lon, lat = timestamps[order], lon[order], lat[order]
+    print(f"✅ 경보 이벤트 {len(timestamps):,}건 ({args.start}부터 {args.days * args.repeat:g}일)", file=sys.stderr)
+
+    # 2. 재생
+    start = time.time()
+    try:
+        if args.connect:
+            host, _, port = args.connect.rpartition(':')
+            with socket.create_connection((host, int(port))) as connection, connection.makefile('wb') as out:
+                replay(out, timestamps, lon, lat, args.speed)
+        elif args.output:
+            with open(args.output, 'wb') as out:
+                replay(out, timestamps, lon, lat, args.speed)
+        else:
+            replay(sys.stdout.buffer, timestamps, lon, lat, args.speed)
+    except BrokenPipeError:
+        # 받는 쪽이 먼저 끝난 경우
+        sys.stderr.close()
+        return
+    elapsed = time.time() - start
+    print(f"📨 재생 완료: {len(timestamps):,}건, {elapsed:.2f}초", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+IoT 화재 경보 스트리밍 집계기
+
+경보 이벤트 JSON 줄({"ts": 유닉스 초 또는 ISO 시각, "lon": 경도, "lat": 위도})을 파일,
+표준입력 파이프 또는 로컬 TCP 소켓에서 받아 동별 최근 1시간/1일/7일 경보 건수와 밀도를
+집계하고(core.alarm_stream), 주기적으로 실시간 지표 저장소에 게시한다. 게시된 지표는
+`python code/run.py top --live`로 종합 위험도 순위에 바로 반영된다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/구조출동_경보_재생.py | python code/구조출동_경보_집계.py       # 파이프
+    python code/구조출동_경보_집계.py 경보1.jsonl 경보2.jsonl
+    python code/구조출동_경보_집계.py --listen 127.0.0.1:8766                   # 소켓 (종료: Ctrl+C)
+    python code/구조출동_경보_재생.py --connect 127.0.0.1:8766 --speed 3600
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from core.alarm_stream import (LIVE_STORE, LIVE_WINDOW, PUBLISH_INTERVAL, WINDOWS, AlarmAggregator,
+                               consume_stream, serve_socket)
+
+
+def print_summary(aggregator, elapsed, top):
+    stats = aggregator.stats
+    print(f"\n📊 수신 {stats['수신']:,}건 (동 배정 {stats['배정']:,}, 동 밖 {stats['동밖']:,}, "
+          f"형식 오류 {stats['오류']:,}, 가장 긴 창을 지나 도착 {stats['지연']:,})")
+    if elapsed:
+        print(f"⏱️ {elapsed:.2f}초, 초당 {stats['수신'] / elapsed:,.0f}건")
+    if aggregator.clock is None:
+        return
+
+    print(f"🕒 마지막 경보 시각: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(aggregator.clock))}")
+    dong = aggregator.dong
+    for name, result in aggregator.snapshot().items():
+        counts = result['건수']
+        order = np.argsort(-counts, kind='stable')[:top]
+        ranked = ', '.join(f"{dong['구명'].iat[i]} {dong['동명'].iat[i]} {counts[i]:,}" for i in order if counts[i])
+        print(f"  최근 {name}: {counts.sum():,}건, {(counts > 0).sum()}개 동 - {ranked or '없음'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IoT 화재 경보 스트리밍 집계기')
+    parser.add_argument('inputs', nargs='*', help="경보 JSON 줄 파일 ('-' 또는 생략: 표준입력)")
+    parser.add_argument('--listen', metavar='HOST:PORT', help='파일 대신 이 주소의 TCP 소켓에서 경보 수신')
+    parser.add_argument('--window', default=LIVE_WINDOW, choices=list(WINDOWS),
+                        help='종합 위험도의 구조출동밀도로 게시할 창')
+    parser.add_argument('--output', default=LIVE_STORE, help='실시간 지표 저장소 경로')
+    parser.add_argument('--publish-interval', type=float, default=PUBLISH_INTERVAL, help='게시 주기 (초)')
+    parser.add_argument('--top', type=int, default=3, help='창별로 출력할 상위 동 수')
+    args = parser.parse_args()
+
+    print("📂 동 경계와 공간 인덱스 로딩 중...")
+    aggregator = AlarmAggregator(live_window=args.window)
+
+    start = time.time()
+    if args.listen:
+        host, _, port = args.listen.rpartition(':')
+        print(f"✅ 경보 수신 대기: {host}:{port} (종료: Ctrl+C)")
+        try:
+            asyncio.run(serve_socket(aggregator, host, int(port), args.output, args.publish_interval))
+        except KeyboardInterrupt:
+            print("\n👋 경보 수신 종료")
+    else:
+        for path in args.inputs or ['-']:
+            if path == '-':
+                consume_stream(sys.stdin.buffer, aggregator, args.output, args.publish_interval)
+            else:
+                with open(path, 'rb') as f:
+                    consume_stream(f, aggregator, args.output, args.publish_interval)
+
+    # 소켓 수신은 대기 시간이 섞이므로 처리 속도를 출력하지 않음
+    print_summary(aggregator, None if args.listen else time.time() - start, args.top)
+    print(f"📁 실시간 지표 저장소: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 커널 밀도 격자 사전 계산
+
+4_select_feature 구조출동 좌표를 서울 전체 고정 격자에 모아 대역폭별 커널 밀도
+(건/km²)를 FFT 합성곱으로 계산하고 dataset/.cache/density/ 에 저장한다.
+구조출동_히트맵.py는 원본 좌표 대신 이 격자를 이미지로 지도에 넣는다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/구조출동_밀도격자.py
+    python code/구조출동_밀도격자.py --bandwidths 200 400 800 --cell-size 50
+"""
+import argparse
+import os
+import time
+
+from core.density import BANDWIDTHS, CELL_SIZE, DEFAULT_CACHE_FILE, load_density
+from core.paths import SELECT_DIR
+
+DEFAULT_INPUT = os.path.join(SELECT_DIR, '서울시_구조출동_selected_features.csv')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구조출동 커널 밀도 격자 사전 계산')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='구조출동 좌표 CSV')
+    parser.add_argument('--output', default=DEFAULT_CACHE_FILE, help='밀도 격자 .npz 경로')
+    parser.add_argument('--bandwidths', type=float, nargs='+', default=list(BANDWIDTHS),
+                        help='커널 대역폭 (미터)')
+    parser.add_argument('--cell-size', type=float, default=CELL_SIZE, help='격자 칸 크기 (미터)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 구조출동 데이터를 찾을 수 없습니다: {args.input}")
+        raise SystemExit(1)
+
+    print("🚒 구조출동 밀도 격자 계산 중...")
+    start = time.time()
+    # 파이프라인 단계로도 실행되므로 캐시가 최신이어도 항상 다시 계산하여 저장
+    grid = load_density(args.input, bandwidths=args.bandwidths, cell_size=args.cell_size,
+                        cache_file=args.output, force=True)
+    elapsed = time.time() - start
+
+    _, ny, nx = grid['density'].shape
+    print(f"✅ 격자: {nx} × {ny}칸 ({grid['cell_size']:.0f}m), 좌표 {grid['points']:,}개 "
+          f"(격자 밖 {grid['outside']:,}개), {elapsed:.2f}초")
+    for bandwidth, density in zip(grid['bandwidths'], grid['density']):
+        print(f"  대역폭 {bandwidth:.0f}m: 최대 밀도 {density.max():,.1f} 건/km²")
+    print(f"📁 저장 위치: {args.output} ({os.path.getsize(args.output) / 1024:,.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
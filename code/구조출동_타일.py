@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+구조출동 밀도 XYZ 타일 생성
+
+4_select_feature 구조출동 좌표로 확대 수준 10~17의 밀도 PNG 타일을 만들어
+figure/tiles/구조출동_밀도/{z}/{x}/{y}.png 에 저장한다. 타일이 있으면
+구조출동_히트맵.py는 좌표나 이미지를 HTML에 넣지 않고 이 폴더를 타일 레이어로
+참조하므로, 자료 기간이 늘어나도 지도 HTML 크기와 화면 이동 속도가 변하지 않는다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/구조출동_타일.py
+    python code/구조출동_타일.py --min-zoom 10 --max-zoom 15 --workers 4
+"""
+import argparse
+import os
+import time
+
+from core.density import file_key
+from core.dispatch import valid_coordinates
+from core.paths import SELECT_DIR
+from core.storage import read_table
+from core.tiles import MAX_ZOOM, MIN_ZOOM, SIGMA_PX, TILE_DIR, render_tiles
+
+DEFAULT_INPUT = os.path.join(SELECT_DIR, '서울시_구조출동_selected_features.csv')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='구조출동 밀도 XYZ 타일 생성')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='구조출동 좌표 CSV')
+    parser.add_argument('--output-dir', default=TILE_DIR, help='타일 폴더')
+    parser.add_argument('--min-zoom', type=int, default=MIN_ZOOM, help='최소 확대 수준')
+    parser.add_argument('--max-zoom', type=int, default=MAX_ZOOM, help='최대 확대 수준')
+    parser.add_argument('--sigma', type=float, default=SIGMA_PX, help='커널 표준편차 (화면 픽셀)')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"❌ 구조출동 데이터를 찾을 수 없습니다: {args.input}")
+        raise SystemExit(1)
+
+    # 1. 좌표 로드
+    coord_df = read_table(args.input, columns=['피해지역_경도', '피해지역_위도'])
+    coord_df = coord_df[valid_coordinates(coord_df)]
+    print(f"✅ 유효한 좌표 데이터: {len(coord_df):,}개")
+
+    # 2. 타일 렌더링
+    print(f"🗺️  확대 수준 {args.min_zoom}~{args.max_zoom} 타일 생성 중...")
+    start = time.time()
+    info = render_tiles(coord_df['피해지역_경도'], coord_df['피해지역_위도'], args.output_dir,
+                        min_zoom=args.min_zoom, max_zoom=args.max_zoom, sigma=args.sigma,
+                        workers=args.workers,
+                        metadata={'source': os.path.basename(args.input),
+                                  'source_key': file_key(args.input)})
+    elapsed = time.time() - start
+
+    # 3. 결과 출력
+    total = 0
+    for zoom, count in info['tiles'].items():
+        total += count['written']
+        print(f"  z{zoom}: {count['written']:,}개 (투명 타일 {count['skipped']:,}개 생략)")
+    print(f"\n✅ 타일 {total:,}개 생성 완료 ({elapsed:.1f}초)")
+    print(f"📁 저장 위치: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
-import geopandas as gpd
 import folium
-import pandas as pd
 import os
-from folium.plugins import HeatMap
-import numpy as np
+from core.boundaries import DONG_SHP, GU_SHP, load_boundaries
+from core.density import density_image, file_key, load_density
+from core.dispatch import valid_coordinates
+from core.storage import read_table
+from core.tiles import TILE_DIR, read_metadata
+
+# 지도에 기본으로 표시할 밀도 대역폭 (미터)
+DEFAULT_BANDWIDTH = 500.0
 
 def test_coordinate_mapping():
     """
@@ -13,9 +17,8 @@ def test_coordinate_mapping():
     print("=== 서울시 구조출동 좌표 지도 매핑 테스트 ===")
     
     # 파일 경로 설정
-    boundary_dir = '../dataset/서울시_행정구역_경계'
-    gu_file = os.path.join(boundary_dir, '서울시_구경계.shp')
-    dong_file = os.path.join(boundary_dir, '서울시_동경계.shp')
+    gu_file = GU_SHP
+    dong_file = DONG_SHP
     coord_file = '../dataset/4_select_feature/서울시_구조출동_selected_features.csv'
     
     # 파일 존재 확인
@@ -30,49 +33,35 @@ def test_coordinate_mapping():
         return
     
     try:
-        # 1. Shapefile 데이터 로드
-        print("📂 Shapefile 데이터 로딩 중...")
-        gu_gdf = gpd.read_file(gu_file, encoding='cp949')
-        dong_gdf = gpd.read_file(dong_file, encoding='cp949')
+        # 1. 경계 데이터 로드
+        print("📂 경계 데이터 로딩 중...")
+        # 지도 zoom_start(11)에 맞게 단순화된 경계 사용 (HTML 크기 절감)
+        gu_gdf, dong_gdf = load_boundaries(zoom=11)
         
         print(f"✅ 구경계 데이터: {len(gu_gdf)}개 구")
         print(f"✅ 동경계 데이터: {len(dong_gdf)}개 동")
         
         # 2. 구조출동 좌표 데이터 로드
         print("📂 구조출동 좌표 데이터 로딩 중...")
-        coord_df = pd.read_csv(coord_file, encoding='utf-8-sig')
+        coord_df = read_table(coord_file)
         print(f"✅ 구조출동 데이터: {len(coord_df):,}개 레코드")
         
         # 3. 좌표 데이터 전처리
         print("🔧 좌표 데이터 전처리 중...")
         # 좌표 유효성 검사
-        valid_coord_mask = (
-            (coord_df['피해지역_경도'].notna()) & 
-            (coord_df['피해지역_위도'].notna()) &
-            (coord_df['피해지역_경도'] != 0) &
-            (coord_df['피해지역_위도'] != 0) &
-            (coord_df['피해지역_경도'] > 126) &
-            (coord_df['피해지역_경도'] < 128) &
-            (coord_df['피해지역_위도'] > 37) &
-            (coord_df['피해지역_위도'] < 38)
-        )
+        valid_coord_mask = valid_coordinates(coord_df)
         
         coord_df_valid = coord_df[valid_coord_mask].copy()
         print(f"✅ 유효한 좌표 데이터: {len(coord_df_valid):,}개 레코드")
         
-        # 4. 좌표계 변환 (WGS84로 변환)
-        print("🌐 좌표계를 WGS84로 변환 중...")
-        gu_gdf = gu_gdf.to_crs('EPSG:4326')
-        dong_gdf = dong_gdf.to_crs('EPSG:4326')
-        
-        # 5. 서울시 중심 좌표 계산
+        # 4. 서울시 중심 좌표 계산
         bounds = gu_gdf.total_bounds  # [minx, miny, maxx, maxy]
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
         
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 6. Folium 지도 생성
+        # 5. Folium 지도 생성
         print("🗺️  인터랙티브 지도 생성 중...")
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -80,7 +69,7 @@ def test_coordinate_mapping():
             tiles='OpenStreetMap'
         )
         
-        # 7. 동경계 추가 (더 세밀한 경계)
+        # 6. 동경계 추가 (더 세밀한 경계)
         print("📍 동경계 추가 중...")
         folium.GeoJson(
             dong_gdf.to_json(),
@@ -95,7 +84,7 @@ def test_coordinate_mapping():
             tooltip=folium.GeoJsonTooltip(fields=['ADM_NM'], aliases=['동명:'])
         ).add_to(m)
         
-        # 8. 구경계 추가 (굵은 경계선)
+        # 7. 구경계 추가 (굵은 경계선)
         print("📍 구경계 추가 중...")
         folium.GeoJson(
             gu_gdf.to_json(),
@@ -110,29 +99,43 @@ def test_coordinate_mapping():
             tooltip=folium.GeoJsonTooltip(fields=['SGG_NM'], aliases=['구명:'])
         ).add_to(m)
         
-        # 9. 구조출동 좌표를 HeatMap으로 추가
-        print("🚒 구조출동 히트맵 생성 중...")
-        
-        # HeatMap용 데이터 준비 (위도, 경도 순서)
-        heat_data = []
-        for idx, row in coord_df_valid.iterrows():
-            lat = row['피해지역_위도']
-            lon = row['피해지역_경도']
-            # 좌표값이 숫자인지 확인
-            if pd.notna(lat) and pd.notna(lon) and isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                heat_data.append([float(lat), float(lon)])
-        
-        print(f"✅ 히트맵 데이터 포인트: {len(heat_data):,}개")
-        
-        # HeatMap 생성 (파라미터 단순화)
-        HeatMap(
-            heat_data,
-            min_opacity=0.2,
-            radius=15,
-            blur=10
-        ).add_to(m)
-        
-        # 10. 범례 추가
+        # 8. 구조출동 밀도 추가
+        # 구조출동_타일.py로 만든 같은 원본의 타일이 있으면 타일 폴더를 참조하고,
+        # 없으면 사전 계산된 밀도 격자를 이미지로 HTML에 넣음
+        figure_dir = '../figure'
+        tile_info = read_metadata(TILE_DIR)
+        if tile_info is not None and tile_info.get('source_key') == file_key(coord_file):
+            print("🚒 구조출동 밀도 타일 레이어 추가 중...")
+            tile_url = os.path.relpath(TILE_DIR, figure_dir).replace(os.sep, '/') + '/{z}/{x}/{y}.png'
+            folium.TileLayer(
+                tiles=tile_url,
+                attr='구조출동 밀도',
+                name='구조출동 밀도',
+                overlay=True,
+                min_zoom=tile_info['min_zoom'],
+                max_native_zoom=tile_info['max_zoom'],
+                max_zoom=tile_info['max_zoom'] + 2
+            ).add_to(m)
+            density_points = tile_info['points']
+            print(f"✅ 밀도 타일: z{tile_info['min_zoom']}~{tile_info['max_zoom']} ({tile_url})")
+        else:
+            print("🚒 구조출동 밀도 격자 로딩 중... (타일이 없거나 원본과 달라 이미지로 포함)")
+            grid = load_density(coord_file)
+            _, grid_rows, grid_cols = grid['density'].shape
+            print(f"✅ 밀도 격자: {grid_cols} × {grid_rows}칸 ({grid['cell_size']:.0f}m), "
+                  f"좌표 {grid['points']:,}개")
+            
+            for bandwidth, density in zip(grid['bandwidths'], grid['density']):
+                folium.raster_layers.ImageOverlay(
+                    image=density_image(density),
+                    bounds=grid['latlon_bounds'],
+                    name=f'구조출동 밀도 (대역폭 {bandwidth:.0f}m)',
+                    pixelated=False,
+                    show=bool(bandwidth == DEFAULT_BANDWIDTH)
+                ).add_to(m)
+            density_points = grid['points']
+        
+        # 9. 범례 추가
         legend_html = f'''
         <div style="position: fixed; 
                     top: 10px; right: 10px; width: 300px; height: 220px; 
@@ -142,7 +145,7 @@ def test_coordinate_mapping():
         <p><i class="fa fa-square" style="color:red"></i> 구경계 (25개구)</p>
         <p><i class="fa fa-square" style="color:blue"></i> 동경계 (426개동)</p>
         <hr>
-        <p><b>구조출동 밀도 ({len(heat_data):,}개 데이터)</b></p>
+        <p><b>구조출동 밀도 ({density_points:,}개 데이터)</b></p>
         <div style="background: linear-gradient(to right, blue, cyan, lime, yellow, orange, red); 
                     height: 20px; width: 200px; margin: 10px 0;"></div>
         <div style="display: flex; justify-content: space-between; width: 200px; font-size: 12px;">
@@ -158,11 +161,10 @@ def test_coordinate_mapping():
         '''
         m.get_root().html.add_child(folium.Element(legend_html))
         
-        # 11. 레이어 컨트롤 추가
+        # 10. 레이어 컨트롤 추가
         folium.LayerControl().add_to(m)
         
-        # 12. figure 폴더 생성 및 지도 저장
-        figure_dir = '../figure'
+        # 11. figure 폴더 생성 및 지도 저장
         os.makedirs(figure_dir, exist_ok=True)
         
         output_file = os.path.join(figure_dir, '구조출동_좌표_히트맵.html')
@@ -171,11 +173,11 @@ def test_coordinate_mapping():
         print(f"✅ 지도 파일 저장 완료: {output_file}")
         print(f"🌐 브라우저에서 {output_file} 파일을 열어서 확인하세요!")
         
-        # 13. 데이터 통계 출력
+        # 12. 데이터 통계 출력
         print("\n=== 데이터 통계 ===")
         print(f"📊 전체 구조출동 데이터: {len(coord_df):,}개")
         print(f"📊 유효한 좌표 데이터: {len(coord_df_valid):,}개")
-        print(f"📊 히트맵에 표시된 데이터: {len(heat_data):,}개")
+        print(f"📊 밀도에 반영된 데이터: {density_points:,}개")
         
         # 처리결과별 통계
         print("\n=== 처리결과별 통계 ===")
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-import geopandas as gpd
 import folium
 import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 import warnings
+from core.boundaries import load_boundaries
+from core.choropleth import add_choropleth, classify_colors, fill_template
+from core.regions import GU_KEY, attach_codes, report_unmatched
+from core.scoring import minmax
+from core.storage import read_table
 warnings.filterwarnings('ignore')
 
 def create_aging_housing_density_heatmap():
@@ -17,40 +19,20 @@ def create_aging_housing_density_heatmap():
         # 1. 데이터 로드
         print("\n📂 데이터 로딩 중...")
         
-        # 구 경계 데이터
-        gu_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_구경계.shp', encoding='cp949')
-        gu_boundary = gu_boundary.to_crs('EPSG:4326')
-        gu_boundary['구명'] = gu_boundary['SGG_NM'].str.replace('서울특별시 ', '')
+        # 구/동 경계 데이터 (지도 확대 수준 11에 맞게 단순화된 캐시 사용)
+        gu_boundary, dong_boundary = load_boundaries(zoom=11)
         print(f"✅ 구 경계 데이터: {len(gu_boundary)}개 구")
-        
-        # 동 경계 데이터
-        dong_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_동경계.shp', encoding='cp949')
-        dong_boundary = dong_boundary.to_crs('EPSG:4326')
-        
-        # 구 매핑을 위한 코드
-        gu_code_mapping = {
-            '11010': '종로구', '11020': '중구', '11030': '용산구', '11040': '성동구',
-            '11050': '광진구', '11060': '동대문구', '11070': '중랑구', '11080': '성북구',
-            '11090': '강북구', '11100': '도봉구', '11110': '노원구', '11120': '은평구',
-            '11130': '서대문구', '11140': '마포구', '11150': '양천구', '11160': '강서구',
-            '11170': '구로구', '11180': '금천구', '11190': '영등포구', '11200': '동작구',
-            '11210': '관악구', '11220': '서초구', '11230': '강남구', '11240': '송파구',
-            '11250': '강동구'
-        }
-        dong_boundary['구코드'] = dong_boundary['ADM_CD'].str[:5]
-        dong_boundary['구명'] = dong_boundary['구코드'].map(gu_code_mapping)
-        dong_boundary['동명'] = dong_boundary['ADM_NM']
         print(f"✅ 동 경계 데이터: {len(dong_boundary)}개 동")
         
         # 노후 주택 현황 데이터
-        housing_df = pd.read_csv('dataset/4_select_feature/노후기간별_주택현황_selected_features.csv')
+        housing_df = read_table('dataset/4_select_feature/노후기간별_주택현황_selected_features.csv')
         housing_df = housing_df[housing_df['구명'] != '소계'].copy()
         print(f"✅ 노후 주택 데이터: {len(housing_df)}개 구")
         print("노후 주택 데이터 샘플:")
         print(housing_df.head())
         
         # 면적 데이터 - ✅ 소계 값만 사용
-        area_df = pd.read_csv('dataset/4_select_feature/서울시_행정구역(동별)_면적.csv')
+        area_df = read_table('dataset/4_select_feature/서울시_행정구역(동별)_면적.csv')
         print(f"전체 면적 데이터: {len(area_df)}개 행")
         
         # ✅ 소계 행만 선택하여 구별 면적 추출
@@ -71,23 +53,22 @@ def create_aging_housing_density_heatmap():
         
         # 3. 데이터 병합
         print("\n🔗 데이터 병합 중...")
-        # 구명에서 '구' 제거하여 매칭
-        housing_df['구명_clean'] = housing_df['구명'].str.replace('구', '')
-        gu_area['구명_clean'] = gu_area['구명'].str.replace('구', '')
+        # 구코드 기준으로 매칭
+        housing_df = attach_codes(housing_df, '구명', label='노후 주택')
+        gu_area = attach_codes(gu_area, '구명', label='구별 면적')
         
-        merged_data = pd.merge(housing_df, gu_area, on='구명_clean', how='inner')
+        merged_data = pd.merge(housing_df, gu_area[[GU_KEY, '총면적_km2']], on=GU_KEY, how='inner')
         print(f"병합 결과: {len(merged_data)}개 구")
         
         # 4. 밀도 계산 (가중 노후주택수 / 면적)
         print("\n📊 노후 주택 밀도 계산 중...")
         merged_data['housing_density'] = merged_data['weighted_old_housing'] / merged_data['총면적_km2']
         print("노후 주택 밀도 상위 5개:")
-        print(merged_data.nlargest(5, 'housing_density')[['구명_x', 'housing_density', 'weighted_old_housing', '총면적_km2']])
+        print(merged_data.nlargest(5, 'housing_density')[['구명', 'housing_density', 'weighted_old_housing', '총면적_km2']])
         
         # 5. Min-Max Scaling
         print("\n⚖️ Min-Max Scaling 적용 중...")
-        scaler = MinMaxScaler()
-        merged_data['density_normalized'] = scaler.fit_transform(merged_data[['housing_density']]).flatten()
+        merged_data['density_normalized'] = minmax(merged_data[['housing_density']])[:, 0]
         
         print(f"정규화 결과:")
         print(f"원본 밀도 범위: {merged_data['housing_density'].min():.2f} ~ {merged_data['housing_density'].max():.2f}")
@@ -95,9 +76,9 @@ def create_aging_housing_density_heatmap():
         
         # 6. 경계 데이터와 병합
         print("\n🗺️ 지도 데이터 병합 중...")
-        gu_boundary['구명_clean'] = gu_boundary['구명'].str.replace('구', '')
-        gu_merged = gu_boundary.merge(merged_data, left_on='구명_clean', right_on='구명_clean', how='left')
+        gu_merged = gu_boundary.merge(merged_data.drop(columns='구명'), on=GU_KEY, how='left')
         print(f"지도 데이터 병합 결과: {len(gu_merged)}개 구")
+        report_unmatched(gu_merged, 'housing_density', '노후 주택 밀도')
         
         # 7. 서울시 중심 좌표 계산
         bounds = gu_boundary.total_bounds
@@ -105,23 +86,15 @@ def create_aging_housing_density_heatmap():
         center_lon = (bounds[0] + bounds[2]) / 2
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 8. 색상 함수 정의
-        def get_color(value):
-            """정규화된 값에 따른 색상 반환"""
-            if pd.isna(value):
-                return '#CCCCCC'  # 회색 (데이터 없음)
-            
-            # 0-1 범위의 값을 색상으로 변환
-            if value <= 0.2:
-                return '#FFF5B7'  # 연한 노란색
-            elif value <= 0.4:
-                return '#FFD93D'  # 노란색
-            elif value <= 0.6:
-                return '#FF8A00'  # 주황색
-            elif value <= 0.8:
-                return '#FF4500'  # 빨간 주황색
-            else:
-                return '#DC143C'  # 진한 빨간색
+        # 8. 색상 팔레트 정의 (0.2 간격 구간)
+        palette = [
+            '#FFF5B7',  # 연한 노란색
+            '#FFD93D',  # 노란색
+            '#FF8A00',  # 주황색
+            '#FF4500',  # 빨간 주황색
+            '#DC143C'   # 진한 빨간색
+        ]
+        nodata_color = '#CCCCCC'  # 회색 (데이터 없음)
         
         # 9. Folium 지도 생성
         print("\n🗺️ 인터랙티브 지도 생성 중...")
@@ -151,40 +124,30 @@ def create_aging_housing_density_heatmap():
         # 11. 구별 노후 주택 밀도 히트맵 추가
         print("구별 노후 주택 밀도 히트맵 추가...")
         
-        for idx, row in gu_merged.iterrows():
-            density_normalized = row.get('density_normalized', np.nan)
-            fill_color = get_color(density_normalized)
-            
-            # 구 경계에 색상 적용
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x, color=fill_color: {
-                    'fillColor': color,
-                    'color': '#2C3E50',
-                    'weight': 2,
-                    'opacity': 0.8,
-                    'fillOpacity': 0.7
-                },
-                popup=folium.Popup(
-                    f"""
+        gu_merged['채우기색'] = classify_colors(gu_merged['density_normalized'], palette, nodata_color)
+        gu_merged['팝업'] = fill_template(gu_merged, """
                     <div style="font-family: Arial; padding: 10px; width: 250px;">
-                    <h4 style="margin: 0; color: #2C3E50;">🏠 {row.get('구명', 'N/A')}</h4>
+                    <h4 style="margin: 0; color: #2C3E50;">🏠 {구명}</h4>
                     <hr style="margin: 5px 0;">
-                    <p><strong>📊 노후주택 밀도:</strong> {row.get('housing_density', 0):.2f} 호/km²</p>
-                    <p><strong>📈 정규화 값:</strong> {row.get('density_normalized', 0):.3f}</p>
-                    <p><strong>🏘️ 가중 노후주택:</strong> {row.get('weighted_old_housing', 0):,.0f} 호</p>
-                    <p><strong>📐 총 면적 (소계):</strong> {row.get('총면적_km2', 0):.2f} km²</p>
+                    <p><strong>📊 노후주택 밀도:</strong> {housing_density:.2f} 호/km²</p>
+                    <p><strong>📈 정규화 값:</strong> {density_normalized:.3f}</p>
+                    <p><strong>🏘️ 가중 노후주택:</strong> {weighted_old_housing:,.0f} 호</p>
+                    <p><strong>📐 총 면적 (소계):</strong> {총면적_km2:.2f} km²</p>
                     <hr style="margin: 5px 0;">
                     <p style="font-size: 11px; color: #7F8C8D;">
                     30년이상(×1.5) + 20~30년 미만 주택수<br>
                     ✅ 공식 소계 면적 사용
                     </p>
                     </div>
-                    """,
-                    max_width=300
-                ),
-                tooltip=f"{row.get('구명', 'N/A')}: {row.get('housing_density', 0):.2f} 호/km²"
-            ).add_to(m)
+                    """)
+        gu_merged['툴팁'] = fill_template(gu_merged, "{구명}: {housing_density:.2f} 호/km²")
+        
+        # 모든 구를 하나의 GeoJson 레이어로 추가
+        add_choropleth(
+            m, gu_merged, '채우기색',
+            style={'color': '#2C3E50', 'weight': 2, 'opacity': 0.8, 'fillOpacity': 0.7},
+            popup_column='팝업', tooltip_column='툴팁'
+        )
         
         # 12. 범례 추가
         print("범례 추가...")
@@ -266,10 +229,10 @@ def create_aging_housing_density_heatmap():
         
         print(f"\n🔝 노후주택 밀도 상위 10개 구:")
         top_density = merged_data.nlargest(10, 'housing_density')[
-            ['구명_x', 'housing_density', 'weighted_old_housing', '총면적_km2', 'density_normalized']
+            ['구명', 'housing_density', 'weighted_old_housing', '총면적_km2', 'density_normalized']
         ]
         for idx, row in top_density.iterrows():
-            print(f"  {row['구명_x']}: {row['housing_density']:.2f} 호/km² "
+            print(f"  {row['구명']}: {row['housing_density']:.2f} 호/km² "
                   f"(가중주택: {row['weighted_old_housing']:,.0f}호, 면적: {row['총면적_km2']:.2f}km², 정규화: {row['density_normalized']:.3f})")
         
         # 15. 면적 데이터 검증 정보 출력
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+동 위험도 좌표 조회 서버 (IoT 화재 자동신고 경보 태깅용)
+
+경보 좌표(위도, 경도)를 받아 동과 종합위험도, 지표별 기여도를 JSON으로 돌려주는
+로컬 HTTP 서버를 실행한다 (core.risk_service). --self-test를 주면 같은 프로세스에서
+서버를 띄워 서울 범위의 합성 경보 좌표로 단건/묶음 조회 응답 시간을 재고 종료한다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/위험도_조회_서버.py                        # http://127.0.0.1:8765
+    python code/위험도_조회_서버.py --port 9000
+    python code/위험도_조회_서버.py --self-test 10000      # 합성 경보 10,000건으로 시험 후 종료
+
+    curl "http://127.0.0.1:8765/risk?lat=37.5665&lon=126.9780"
+    curl -d '{"points": [[37.5665, 126.9780], [37.50, 127.03]]}' http://127.0.0.1:8765/risk
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from core.risk_service import DEFAULT_HOST, DEFAULT_PORT, RiskIndex, request, start_server
+
+# 합성 경보 좌표 범위 (서울시 경계 사각형)
+SEOUL_BOUNDS = (126.76, 37.42, 127.19, 37.71)
+
+# 단건 조회 시험 횟수 (나머지는 묶음 조회)
+SINGLE_QUERIES = 1000
+
+
+async def serve(index, host, port):
+    server = await start_server(index, host, port)
+    print(f"✅ 조회 서버 실행 중: http://{host}:{port}/risk?lat=37.5665&lon=126.9780 (종료: Ctrl+C)")
+    async with server:
+        await server.serve_forever()
+
+
+async def self_test(index, count, seed):
+    """
+    합성 경보 좌표로 단건(GET)/묶음(POST) 조회 응답 시간 측정 및 두 결과 일치 확인
+    """
+    rng = np.random.default_rng(seed)
+    west, south, east, north = SEOUL_BOUNDS
+    lat = rng.uniform(south, north, count).round(6)
+    lon = rng.uniform(west, east, count).round(6)
+
+    server = await start_server(index, DEFAULT_HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection(DEFAULT_HOST, port)
+    try:
+        # 1. 단건 조회 (같은 연결로 차례로 요청)
+        singles = min(SINGLE_QUERIES, count)
+        single_results = []
+        latencies = np.empty(singles)
+        for i in range(singles):
+            start = time.perf_counter()
+            status, result = await request(reader, writer, 'GET', f'/risk?lat={lat[i]}&lon={lon[i]}')
+            latencies[i] = (time.perf_counter() - start) * 1000
+            if status != 200:
+                raise RuntimeError(f"단건 조회 실패 ({status}): {result}")
+            single_results.append(result['동코드'])
+        print(f"📨 단건 조회 {singles:,}건: 중앙값 {np.median(latencies):.3f}ms, "
+              f"p99 {np.percentile(latencies, 99):.3f}ms (HTTP 왕복 포함)")
+
+        # 2. 묶음 조회
+        start = time.perf_counter()
+        status, batch = await request(reader, writer, 'POST', '/risk',
+                                      {'points': np.column_stack([lat, lon]).tolist()})
+        elapsed = (time.perf_counter() - start) * 1000
+        if status != 200:
+            raise RuntimeError(f"묶음 조회 실패 ({status}): {batch}")
+        codes = [result['동코드'] for result in batch['results']]
+        print(f"📦 묶음 조회 {count:,}건: 서버 처리 {batch['elapsed_ms']:.1f}ms "
+              f"(좌표당 {batch['elapsed_ms'] * 1000 / count:.1f}µs), HTTP 포함 {elapsed:.1f}ms")
+
+        matched = sum(code is not None for code in codes)
+        mismatched = sum(a != b for a, b in zip(single_results, codes))
+        print(f"📊 동에 배정된 경보: {matched:,}/{count:,}건 ({matched / count:.1%}), "
+              f"단건/묶음 결과 불일치 {mismatched}건")
+        # 3. 상태 확인 후 연결 종료
+        status, health = await request(reader, writer, 'GET', '/health', close=True)
+        return status == 200 and mismatched == 0
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동 위험도 좌표 조회 서버')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='서버 주소')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='서버 포트')
+    parser.add_argument('--weights', type=float, nargs=4, help='지표 가중치 (취약연령 취약자 노후주택 구조출동)')
+    parser.add_argument('--self-test', type=int, metavar='N', help='합성 경보 N건으로 응답 시간을 재고 종료')
+    parser.add_argument('--seed', type=int, default=0, help='합성 경보 난수 시드')
+    args = parser.parse_args()
+
+    print("📂 동 경계, 공간 인덱스, 점수 표 로딩 중...")
+    start = time.time()
+    index = RiskIndex(args.weights)
+    print(f"✅ 동 {len(index)}개 로딩 완료 ({time.time() - start:.2f}초)")
+
+    if args.self_test:
+        if not asyncio.run(self_test(index, args.self_test, args.seed)):
+            raise SystemExit(1)
+        return
+    try:
+        asyncio.run(serve(index, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 조회 서버 종료")
+
+
+if __name__ == "__main__":
+    main()
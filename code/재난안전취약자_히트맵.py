@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-import geopandas as gpd
 import folium
 import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 import warnings
+from core.boundaries import load_boundaries
+from core.choropleth import add_choropleth, classify_colors, fill_template
+from core.regions import GU_KEY, attach_codes, report_unmatched
+from core.scoring import minmax
+from core.storage import read_table
 warnings.filterwarnings('ignore')
 
 def create_vulnerable_population_heatmap():
@@ -17,33 +19,13 @@ def create_vulnerable_population_heatmap():
         # 1. 데이터 로드
         print("\n📂 데이터 로딩 중...")
         
-        # 구 경계 데이터
-        gu_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_구경계.shp', encoding='cp949')
-        gu_boundary = gu_boundary.to_crs('EPSG:4326')
-        gu_boundary['구명'] = gu_boundary['SGG_NM'].str.replace('서울특별시 ', '')
+        # 구/동 경계 데이터 (지도 확대 수준 11에 맞게 단순화된 캐시 사용)
+        gu_boundary, dong_boundary = load_boundaries(zoom=11)
         print(f"✅ 구 경계 데이터: {len(gu_boundary)}개 구")
-        
-        # 동 경계 데이터
-        dong_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_동경계.shp', encoding='cp949')
-        dong_boundary = dong_boundary.to_crs('EPSG:4326')
-        
-        # 구 매핑을 위한 코드
-        gu_code_mapping = {
-            '11010': '종로구', '11020': '중구', '11030': '용산구', '11040': '성동구',
-            '11050': '광진구', '11060': '동대문구', '11070': '중랑구', '11080': '성북구',
-            '11090': '강북구', '11100': '도봉구', '11110': '노원구', '11120': '은평구',
-            '11130': '서대문구', '11140': '마포구', '11150': '양천구', '11160': '강서구',
-            '11170': '구로구', '11180': '금천구', '11190': '영등포구', '11200': '동작구',
-            '11210': '관악구', '11220': '서초구', '11230': '강남구', '11240': '송파구',
-            '11250': '강동구'
-        }
-        dong_boundary['구코드'] = dong_boundary['ADM_CD'].str[:5]
-        dong_boundary['구명'] = dong_boundary['구코드'].map(gu_code_mapping)
-        dong_boundary['동명'] = dong_boundary['ADM_NM']
         print(f"✅ 동 경계 데이터: {len(dong_boundary)}개 동")
         
         # 재난안전취약자 정보 데이터
-        vulnerable_df = pd.read_csv('dataset/4_select_feature/재난안전취약자정보_selected_features.csv')
+        vulnerable_df = read_table('dataset/4_select_feature/재난안전취약자정보_selected_features.csv')
         print(f"✅ 재난안전취약자 데이터: {len(vulnerable_df)}개 구역")
         print("재난안전취약자 데이터 샘플:")
         print(vulnerable_df.head())
@@ -92,15 +74,13 @@ def create_vulnerable_population_heatmap():
         print("취약자 밀도 상위 5개:")
         print(vulnerable_df.nlargest(5, '취약자밀도')[['관할구역명', '취약자밀도', '총취약자수', '관할면적']])
         
-        # 4. 구명 정리 (매칭을 위해)
+        # 4. 구코드 부여 (매칭을 위해)
         print("\n🔗 데이터 매칭 준비 중...")
-        vulnerable_df['구명'] = vulnerable_df['관할구역명'].str.replace('구', '')
-        gu_boundary['구명_clean'] = gu_boundary['구명'].str.replace('구', '')
+        vulnerable_df = attach_codes(vulnerable_df, '관할구역명', label='재난안전취약자')
         
         # 5. Min-Max Scaling
         print("\n⚖️ Min-Max Scaling 적용 중...")
-        scaler = MinMaxScaler()
-        vulnerable_df['밀도_normalized'] = scaler.fit_transform(vulnerable_df[['취약자밀도']]).flatten()
+        vulnerable_df['밀도_normalized'] = minmax(vulnerable_df[['취약자밀도']])[:, 0]
         
         print(f"정규화 결과:")
         print(f"원본 밀도 범위: {vulnerable_df['취약자밀도'].min():.2f} ~ {vulnerable_df['취약자밀도'].max():.2f}")
@@ -108,8 +88,9 @@ def create_vulnerable_population_heatmap():
         
         # 6. 경계 데이터와 병합
         print("\n🗺️ 지도 데이터 병합 중...")
-        gu_merged = gu_boundary.merge(vulnerable_df, left_on='구명_clean', right_on='구명', how='left')
+        gu_merged = gu_boundary.merge(vulnerable_df, on=GU_KEY, how='left')
         print(f"지도 데이터 병합 결과: {len(gu_merged)}개 구")
+        report_unmatched(gu_merged, '취약자밀도', '재난안전취약자 밀도')
         
         # 7. 서울시 중심 좌표 계산
         bounds = gu_boundary.total_bounds
@@ -117,23 +98,15 @@ def create_vulnerable_population_heatmap():
         center_lon = (bounds[0] + bounds[2]) / 2
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 8. 색상 함수 정의
-        def get_color(value):
-            """정규화된 값에 따른 색상 반환 (취약자 밀도용 빨간색 계열)"""
-            if pd.isna(value):
-                return '#CCCCCC'  # 회색 (데이터 없음)
-            
-            # 0-1 범위의 값을 색상으로 변환 (빨간색 계열)
-            if value <= 0.2:
-                return '#FFE5E5'  # 연한 빨간색
-            elif value <= 0.4:
-                return '#FFB3B3'  # 밝은 빨간색
-            elif value <= 0.6:
-                return '#FF8080'  # 중간 빨간색
-            elif value <= 0.8:
-                return '#FF4D4D'  # 진한 빨간색
-            else:
-                return '#CC0000'  # 매우 진한 빨간색
+        # 8. 색상 팔레트 정의 (취약자 밀도용 빨간색 계열, 0.2 간격 구간)
+        palette = [
+            '#FFE5E5',  # 연한 빨간색
+            '#FFB3B3',  # 밝은 빨간색
+            '#FF8080',  # 중간 빨간색
+            '#FF4D4D',  # 진한 빨간색
+            '#CC0000'   # 매우 진한 빨간색
+        ]
+        nodata_color = '#CCCCCC'  # 회색 (데이터 없음)
         
         # 9. Folium 지도 생성
         print("\n🗺️ 인터랙티브 지도 생성 중...")
@@ -163,44 +136,34 @@ def create_vulnerable_population_heatmap():
         # 11. 구별 재난안전취약자 밀도 히트맵 추가
         print("구별 재난안전취약자 밀도 히트맵 추가...")
         
-        for idx, row in gu_merged.iterrows():
-            density_normalized = row.get('밀도_normalized', np.nan)
-            fill_color = get_color(density_normalized)
-            
-            # 구 경계에 색상 적용
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x, color=fill_color: {
-                    'fillColor': color,
-                    'color': '#8B0000',  # 어두운 빨간색 테두리
-                    'weight': 2,
-                    'opacity': 0.8,
-                    'fillOpacity': 0.7
-                },
-                popup=folium.Popup(
-                    f"""
+        gu_merged['채우기색'] = classify_colors(gu_merged['밀도_normalized'], palette, nodata_color)
+        gu_merged['팝업'] = fill_template(gu_merged, """
                     <div style="font-family: Arial; padding: 10px; width: 280px;">
-                    <h4 style="margin: 0; color: #8B0000;">🚨 {row.get('관할구역명', 'N/A')}</h4>
+                    <h4 style="margin: 0; color: #8B0000;">🚨 {관할구역명}</h4>
                     <hr style="margin: 5px 0;">
-                    <p><strong>📊 취약자 밀도:</strong> {row.get('취약자밀도', 0):.2f} 명/km²</p>
-                    <p><strong>📈 정규화 값:</strong> {row.get('밀도_normalized', 0):.3f}</p>
-                    <p><strong>👥 총 취약자수:</strong> {row.get('총취약자수', 0):,.0f} 명</p>
-                    <p><strong>📐 관할 면적:</strong> {row.get('관할면적', 0):.2f} km²</p>
+                    <p><strong>📊 취약자 밀도:</strong> {취약자밀도:.2f} 명/km²</p>
+                    <p><strong>📈 정규화 값:</strong> {밀도_normalized:.3f}</p>
+                    <p><strong>👥 총 취약자수:</strong> {총취약자수:,.0f} 명</p>
+                    <p><strong>📐 관할 면적:</strong> {관할면적:.2f} km²</p>
                     <hr style="margin: 5px 0;">
                     <div style="font-size: 11px; color: #666;">
                     <p><strong>세부 구성:</strong></p>
-                    <p>👴 독거노인: {row.get('독거노인가구수', 0):,}가구</p>
-                    <p>🧓 고령인구: {row.get('고령인구수', 0):,}명</p>
-                    <p>👶 유아인구: {row.get('유아인구수', 0):,}명</p>
-                    <p>♿ 등록장애인: {row.get('등록장애인수', 0):,}명</p>
-                    <p>🏠 1인가구: {row.get('1인가구수', 0):,}가구</p>
+                    <p>👴 독거노인: {독거노인가구수:,}가구</p>
+                    <p>🧓 고령인구: {고령인구수:,}명</p>
+                    <p>👶 유아인구: {유아인구수:,}명</p>
+                    <p>♿ 등록장애인: {등록장애인수:,}명</p>
+                    <p>🏠 1인가구: {1인가구수:,}가구</p>
                     </div>
                     </div>
-                    """,
-                    max_width=320
-                ),
-                tooltip=f"{row.get('관할구역명', 'N/A')}: {row.get('취약자밀도', 0):.0f} 명/km²"
-            ).add_to(m)
+                    """)
+        gu_merged['툴팁'] = fill_template(gu_merged, "{관할구역명}: {취약자밀도:.0f} 명/km²")
+        
+        # 모든 구를 하나의 GeoJson 레이어로 추가 (어두운 빨간색 테두리)
+        add_choropleth(
+            m, gu_merged, '채우기색',
+            style={'color': '#8B0000', 'weight': 2, 'opacity': 0.8, 'fillOpacity': 0.7},
+            popup_column='팝업', tooltip_column='툴팁', max_width=320
+        )
         
         # 12. 범례 추가
         print("범례 추가...")
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+종합 재난 위험도 가중치 민감도 분석
+
+기본 가중치(core.scoring.DEFAULT_WEIGHTS)를
+무작위로 흔든 가중치 벡터 수천 개로 동별 순위를 한 번에 계산하여, 각 동이
+상위 k위 안에 머무는 비율과 순위 변동(표준편차, 최고/최저 순위)을 보고한다.
+
+사용법 (저장소 루트에서 실행):
+    python code/종합_재난위험도_민감도분석.py
+    python code/종합_재난위험도_민감도분석.py --samples 10000 --spread 0.3 --top-k 15
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from core.boundaries import load_dong_boundary
+from core.indicators import load_dong_indicators
+from core.scoring import DEFAULT_WEIGHTS, INDICATOR_LABELS, INDICATORS, rank_matrix, sample_weights, score, sweep
+
+OUTPUT_FILE = 'individual_analysis/종합위험도_가중치_민감도.csv'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종합 재난 위험도 가중치 민감도 분석')
+    parser.add_argument('--samples', type=int, default=5000, help='가중치 벡터 수')
+    parser.add_argument('--spread', type=float, default=0.5, help='가중치 변동 폭 (기본 가중치 × [1-spread, 1+spread])')
+    parser.add_argument('--top-k', type=int, default=15, help='상위 순위 기준')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    print("⚖️ 종합 재난 위험도 가중치 민감도 분석 시작...")
+    print(f"기본 가중치: {', '.join(f'{name} {w:g}' for name, w in zip(INDICATOR_LABELS, DEFAULT_WEIGHTS))}")
+
+    # 1. 동별 지표 행렬
+    dong_integrated = load_dong_indicators(load_dong_boundary())
+    indicator_matrix = dong_integrated[INDICATORS].fillna(0).to_numpy()
+
+    # 2. 기본 가중치 순위
+    base_score, _ = score(indicator_matrix, DEFAULT_WEIGHTS)
+    base_rank = rank_matrix(base_score[None, :])[0]
+
+    # 3. 가중치 일괄 적용
+    weight_matrix = sample_weights(args.samples, DEFAULT_WEIGHTS, args.spread, args.seed)
+    start = time.time()
+    stats = sweep(indicator_matrix, weight_matrix, top_k=args.top_k)
+    elapsed = time.time() - start
+    print(f"\n✅ 가중치 {args.samples:,}개 × {len(indicator_matrix)}개 동 순위 계산 완료 ({elapsed:.3f}초)")
+
+    result = pd.DataFrame({
+        '구명': dong_integrated['구명'],
+        '동명': dong_integrated['동명'],
+        '종합위험도': base_score,
+        '기본순위': base_rank,
+        f'상위{args.top_k}_비율': stats['topk_rate'],
+        '평균순위': stats['rank_mean'],
+        '순위_표준편차': stats['rank_std'],
+        '최고순위': stats['rank_min'],
+        '최저순위': stats['rank_max']
+    }).sort_values('기본순위')
+
+    # 4. 결과 출력
+    print(f"\n🔝 기본 가중치 상위 {args.top_k}개 동의 순위 안정성:")
+    for _, row in result.head(args.top_k).iterrows():
+        print(f"  {row['기본순위']:>3}위 {row['구명']} {row['동명']}: "
+              f"상위{args.top_k} 유지 {row[f'상위{args.top_k}_비율']*100:.1f}%, "
+              f"평균 {row['평균순위']:.1f}위 (±{row['순위_표준편차']:.1f}, {row['최고순위']}~{row['최저순위']}위)")
+
+    stable = (result[f'상위{args.top_k}_비율'] >= 0.9).sum()
+    entrants = result[(result['기본순위'] > args.top_k) & (result[f'상위{args.top_k}_비율'] > 0)]
+    print(f"\n📊 상위 {args.top_k}위를 90% 이상 유지한 동: {stable}개")
+    print(f"📊 기본 순위 밖에서 상위 {args.top_k}위에 진입한 적이 있는 동: {len(entrants)}개")
+    for _, row in entrants.sort_values(f'상위{args.top_k}_비율', ascending=False).head(5).iterrows():
+        print(f"  {row['구명']} {row['동명']} (기본 {row['기본순위']}위): "
+              f"{row[f'상위{args.top_k}_비율']*100:.1f}%")
+
+    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    result.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
+    print(f"\n📁 저장 위치: {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
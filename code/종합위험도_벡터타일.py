@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+종합 재난 위험도 벡터 타일 (MVT) 생성
+
+동 경계에 종합위험도, 지표별 정규화/가중 점수와 밀도 지표를, 구 경계에 구별 평균
+종합위험도와 구 단위 지표를 붙여 확대 수준별 Mapbox Vector Tile로 자른다.
+결과는 figure/tiles/종합위험도_벡터/{z}/{x}/{y}.pbf 폴더 또는 --mbtiles로 지정한
+MBTiles 파일 하나에 저장되며, 타일마다 'dong', 'gu' 두 레이어가 들어간다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/종합위험도_벡터타일.py
+    python code/종합위험도_벡터타일.py --min-zoom 10 --max-zoom 15 --workers 4
+    python code/종합위험도_벡터타일.py --mbtiles figure/tiles/종합위험도.mbtiles
+"""
+import argparse
+import time
+
+import numpy as np
+
+from core.boundaries import load_dong_boundary, load_gu_boundary
+from core.indicators import load_dong_indicators
+from core.regions import DONG_KEY, GU_KEY
+from core.scoring import DEFAULT_WEIGHTS, INDICATOR_LABELS, INDICATORS, minmax, score
+from core.vector_tiles import MAX_ZOOM, MIN_ZOOM, VECTOR_TILE_DIR, render_vector_tiles
+
+
+def risk_layers():
+    """
+    (동 레이어, 구 레이어) GeoDataFrame (원본 정밀도 경계 + 위험도 속성)
+    """
+    dong_boundary = load_dong_boundary()
+    dong = load_dong_indicators(dong_boundary)
+
+    # 종합 위험도 지도와 같이 결측 지표는 0으로 보고 점수 계산
+    matrix = np.nan_to_num(dong[INDICATORS].to_numpy(dtype=float))
+    risk, weighted = score(matrix, DEFAULT_WEIGHTS)
+    normalized = minmax(matrix)
+    for i, name in enumerate(INDICATOR_LABELS):
+        dong[f'{name}_정규화'] = normalized[:, i]
+        dong[f'{name}_가중'] = weighted[:, i]
+    dong['종합위험도'] = risk
+    dong['구명'] = dong['구명'].astype(str)
+    dong['동명'] = dong['동명'].astype(str)
+    dong_layer = dong_boundary[[DONG_KEY, 'geometry']].merge(dong, on=DONG_KEY, how='left')
+
+    # 구 레이어: 구 단위 지표는 그대로, 동 단위 값은 구별 평균/합계
+    by_gu = dong.groupby(GU_KEY).agg(
+        종합위험도=('종합위험도', 'mean'),
+        취약연령밀도=('취약연령밀도', 'mean'),
+        취약자밀도=('취약자밀도', 'first'),
+        housing_density=('housing_density', 'first'),
+        구조출동건수=('구조출동건수', 'sum'),
+        동수=(DONG_KEY, 'size')
+    ).reset_index()
+    gu_layer = load_gu_boundary()[[GU_KEY, '구명', 'geometry']].merge(by_gu, on=GU_KEY, how='left')
+    gu_layer['구명'] = gu_layer['구명'].astype(str)
+    return dong_layer, gu_layer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종합 재난 위험도 벡터 타일 (MVT) 생성')
+    parser.add_argument('--output-dir', default=VECTOR_TILE_DIR, help='타일 폴더')
+    parser.add_argument('--mbtiles', help='타일 폴더 대신 저장할 MBTiles 파일 경로')
+    parser.add_argument('--min-zoom', type=int, default=MIN_ZOOM, help='최소 확대 수준')
+    parser.add_argument('--max-zoom', type=int, default=MAX_ZOOM, help='최대 확대 수준')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    # 1. 동/구 위험도 속성 준비
+    print("📊 동/구 위험도 속성 준비 중...")
+    dong_layer, gu_layer = risk_layers()
+    print(f"✅ 동 {len(dong_layer)}개, 구 {len(gu_layer)}개")
+
+    # 2. 타일 생성
+    output = args.mbtiles or args.output_dir
+    print(f"🗺️  확대 수준 {args.min_zoom}~{args.max_zoom} 벡터 타일 생성 중...")
+    start = time.time()
+    info = render_vector_tiles([('dong', dong_layer, DONG_KEY), ('gu', gu_layer, GU_KEY)], output,
+                               min_zoom=args.min_zoom, max_zoom=args.max_zoom, workers=args.workers,
+                               mbtiles=bool(args.mbtiles), metadata={'name': '종합위험도'})
+    elapsed = time.time() - start
+
+    # 3. 결과 출력
+    total = 0
+    for zoom, count in info['tiles'].items():
+        total += count['tiles']
+        print(f"  z{zoom}: {count['tiles']:,}개 ({count['bytes'] / 1024:,.0f}KB)")
+    print(f"\n✅ 타일 {total:,}개 생성 완료 ({elapsed:.1f}초)")
+    print(f"📁 저장 위치: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-import geopandas as gpd
 import folium
 import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 import warnings
+from core.boundaries import load_boundaries
+from core.choropleth import add_choropleth, classify_colors, fill_template
+from core.regions import DONG_KEY, GU_KEY, attach_codes, report_unmatched
+from core.scoring import minmax
+from core.storage import read_table
 warnings.filterwarnings('ignore')
 
 def create_dong_vulnerable_age_heatmap():
@@ -17,39 +19,19 @@ def create_dong_vulnerable_age_heatmap():
         # 1. 데이터 로드
         print("\n📂 데이터 로딩 중...")
         
-        # 구 경계 데이터 (참조용)
-        gu_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_구경계.shp', encoding='cp949')
-        gu_boundary = gu_boundary.to_crs('EPSG:4326')
-        gu_boundary['구명'] = gu_boundary['SGG_NM'].str.replace('서울특별시 ', '')
+        # 구/동 경계 데이터 (지도 확대 수준 11에 맞게 단순화된 캐시 사용)
+        gu_boundary, dong_boundary = load_boundaries(zoom=11)
         print(f"✅ 구 경계 데이터: {len(gu_boundary)}개 구")
-        
-        # 동 경계 데이터 (메인)
-        dong_boundary = gpd.read_file('dataset/서울시_행정구역_경계/서울시_동경계.shp', encoding='cp949')
-        dong_boundary = dong_boundary.to_crs('EPSG:4326')
-        
-        # 구 매핑을 위한 코드
-        gu_code_mapping = {
-            '11010': '종로구', '11020': '중구', '11030': '용산구', '11040': '성동구',
-            '11050': '광진구', '11060': '동대문구', '11070': '중랑구', '11080': '성북구',
-            '11090': '강북구', '11100': '도봉구', '11110': '노원구', '11120': '은평구',
-            '11130': '서대문구', '11140': '마포구', '11150': '양천구', '11160': '강서구',
-            '11170': '구로구', '11180': '금천구', '11190': '영등포구', '11200': '동작구',
-            '11210': '관악구', '11220': '서초구', '11230': '강남구', '11240': '송파구',
-            '11250': '강동구'
-        }
-        dong_boundary['구코드'] = dong_boundary['ADM_CD'].str[:5]
-        dong_boundary['구명'] = dong_boundary['구코드'].map(gu_code_mapping)
-        dong_boundary['동명'] = dong_boundary['ADM_NM']
         print(f"✅ 동 경계 데이터: {len(dong_boundary)}개 동")
         
         # 동별 등록인구 데이터
-        population_df = pd.read_csv('dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv')
+        population_df = read_table('dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv')
         print(f"✅ 동별 등록인구 데이터: {len(population_df)}개 동")
         print("동별 등록인구 데이터 샘플:")
         print(population_df.head())
         
         # 동별 면적 데이터
-        area_df = pd.read_csv('dataset/4_select_feature/서울시_행정구역(동별)_면적.csv')
+        area_df = read_table('dataset/4_select_feature/서울시_행정구역(동별)_면적.csv')
         area_df = area_df[area_df['동명'] != '소계'].copy()  # 소계 제외
         print(f"✅ 동별 면적 데이터: {len(area_df)}개 동")
         
@@ -60,14 +42,14 @@ def create_dong_vulnerable_age_heatmap():
         print("취약연령층 인구 상위 5개:")
         print(population_df.nlargest(5, '취약연령인구')[['구', '동', '취약연령인구', '0~14세', '65~']])
         
-        # 3. 데이터 병합 (인구 + 면적)
+        # 3. 데이터 병합 (인구 + 면적, 동코드 기준)
         print("\n🔗 데이터 병합 중...")
-        # 구명과 동명 매칭을 위해 정리
+        population_df = attach_codes(population_df, '구', '동', '동별 등록인구')
+        area_df = attach_codes(area_df, '구명', '동명', '동별 면적')
         merged_data = pd.merge(
             population_df, 
-            area_df[['구명', '동명', '면적_km2']], 
-            left_on=['구', '동'], 
-            right_on=['구명', '동명'], 
+            area_df[[DONG_KEY, '면적_km2']], 
+            on=DONG_KEY, 
             how='inner'
         )
         print(f"병합 결과: {len(merged_data)}개 동")
@@ -81,8 +63,7 @@ def create_dong_vulnerable_age_heatmap():
         
         # 5. Min-Max Scaling
         print("\n⚖️ Min-Max Scaling 적용 중...")
-        scaler = MinMaxScaler()
-        merged_data['밀도_normalized'] = scaler.fit_transform(merged_data[['취약연령밀도']]).flatten()
+        merged_data['밀도_normalized'] = minmax(merged_data[['취약연령밀도']])[:, 0]
         
         print(f"정규화 결과:")
         print(f"원본 밀도 범위: {merged_data['취약연령밀도'].min():.2f} ~ {merged_data['취약연령밀도'].max():.2f}")
@@ -90,38 +71,12 @@ def create_dong_vulnerable_age_heatmap():
         
         # 6. 동 경계 데이터와 병합
         print("\n🗺️ 지도 데이터 병합 중...")
-        
-        # 디버깅: 매칭 확인
-        print("경계 데이터 샘플:")
-        print(dong_boundary[['구명', '동명']].head())
-        print("인구 데이터 샘플:")
-        print(merged_data[['구', '동']].head())
-        
-        dong_merged = dong_boundary.merge(
-            merged_data, 
-            left_on=['구명', '동명'], 
-            right_on=['구', '동'], 
-            how='left'
-        )
+        dong_merged = dong_boundary.merge(merged_data.drop(columns=GU_KEY), on=DONG_KEY, how='left')
         print(f"지도 데이터 병합 결과: {len(dong_merged)}개 동")
         
-        # 매칭 성공한 동 개수 확인
-        matched_count = dong_merged['취약연령밀도'].notna().sum()
-        print(f"데이터 매칭 성공: {matched_count}개 동")
-        print(f"데이터 매칭 실패: {len(dong_merged) - matched_count}개 동")
-        
-        if matched_count < 400:  # 대부분 매칭되지 않았다면
-            print("\n❌ 매칭 문제 발견! 샘플 확인:")
-            # 매칭 안된 경계 데이터 샘플
-            unmatched = dong_merged[dong_merged['취약연령밀도'].isna()]
-            print("매칭 안된 경계 데이터 샘플:")
-            print(unmatched[['구명', '동명']].head(10))
-            
-            # 인구 데이터의 고유값들 확인
-            print("인구 데이터 구 고유값:")
-            print(sorted(merged_data['구'].unique()))
-            print("인구 데이터 동 고유값 샘플:")
-            print(sorted(merged_data['동'].unique())[:20])
+        # 지표가 없는 동은 이름과 함께 출력
+        unmatched_count = report_unmatched(dong_merged, '취약연령밀도', '취약연령 밀도')
+        print(f"데이터 매칭 성공: {len(dong_merged) - unmatched_count}개 동")
         
         # 7. 서울시 중심 좌표 계산
         bounds = dong_boundary.total_bounds
@@ -129,23 +84,15 @@ def create_dong_vulnerable_age_heatmap():
         center_lon = (bounds[0] + bounds[2]) / 2
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 8. 색상 함수 정의
-        def get_color(value):
-            """정규화된 값에 따른 색상 반환 (취약연령층용 파란색-보라색 계열)"""
-            if pd.isna(value):
-                return '#F0F0F0'  # 연한 회색 (데이터 없음)
-            
-            # 0-1 범위의 값을 색상으로 변환 (파란색-보라색 계열)
-            if value <= 0.2:
-                return '#E6F3FF'  # 매우 연한 파란색
-            elif value <= 0.4:
-                return '#B3D9FF'  # 연한 파란색
-            elif value <= 0.6:
-                return '#66B3FF'  # 중간 파란색
-            elif value <= 0.8:
-                return '#3399FF'  # 진한 파란색
-            else:
-                return '#0066CC'  # 매우 진한 파란색
+        # 8. 색상 팔레트 정의 (취약연령층용 파란색-보라색 계열, 0.2 간격 구간)
+        palette = [
+            '#E6F3FF',  # 매우 연한 파란색
+            '#B3D9FF',  # 연한 파란색
+            '#66B3FF',  # 중간 파란색
+            '#3399FF',  # 진한 파란색
+            '#0066CC'   # 매우 진한 파란색
+        ]
+        nodata_color = '#F0F0F0'  # 연한 회색 (데이터 없음)
         
         # 9. Folium 지도 생성
         print("\n🗺️ 인터랙티브 지도 생성 중...")
@@ -175,55 +122,37 @@ def create_dong_vulnerable_age_heatmap():
         # 11. 동별 취약연령층 밀도 히트맵 추가
         print("동별 취약연령층 밀도 히트맵 추가...")
         
-        for idx, row in dong_merged.iterrows():
-            density_normalized = row.get('밀도_normalized', np.nan)
-            fill_color = get_color(density_normalized)
-            
-            # 구명, 동명 표시 형식 개선 - N/A 방지
-            # 구명 우선순위: 병합된 구명 > 매핑된 구명 > ADM_CD로 역추적
-            if pd.notna(row.get('구명')):
-                gu_name = row['구명']
-            elif pd.notna(row.get('ADM_CD')):
-                # ADM_CD에서 구 코드 추출하여 매핑
-                gu_code = str(row['ADM_CD'])[:5]
-                gu_name = gu_code_mapping.get(gu_code, f'구_{gu_code}')
-            else:
-                gu_name = 'N/A구'
-            
-            dong_name = row['ADM_NM'] if pd.notna(row.get('ADM_NM')) else 'N/A동'
-            title_text = f"{gu_name}, {dong_name}"
-            
-            # 동 경계에 색상 적용
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x, color=fill_color: {
-                    'fillColor': color,
-                    'color': '#1E3A8A',  # 어두운 파란색 테두리
-                    'weight': 1,
-                    'opacity': 0.7,
-                    'fillOpacity': 0.8
-                },
-                popup=folium.Popup(
-                    f"""
+        dong_merged['채우기색'] = classify_colors(dong_merged['밀도_normalized'], palette, nodata_color)
+        
+        # 구명은 경계의 ADM_CD 앞 5자리(구코드)에서 온 값이므로 항상 존재
+        gu_name = dong_merged['구명'].fillna('N/A구')
+        dong_name = dong_merged['ADM_NM'].fillna('N/A동')
+        dong_merged['제목'] = gu_name + ', ' + dong_name
+        
+        dong_merged['팝업'] = fill_template(dong_merged, """
                     <div style="font-family: Arial; padding: 10px; width: 260px;">
-                    <h4 style="margin: 0; color: #1E3A8A;">👶🧓 {title_text}</h4>
+                    <h4 style="margin: 0; color: #1E3A8A;">👶🧓 {제목}</h4>
                     <hr style="margin: 5px 0;">
-                    <p><strong>📊 취약연령 밀도:</strong> {row['취약연령밀도'] if pd.notna(row.get('취약연령밀도')) else 0:.2f} 명/km²</p>
-                    <p><strong>📈 정규화 값:</strong> {row['밀도_normalized'] if pd.notna(row.get('밀도_normalized')) else 0:.3f}</p>
-                    <p><strong>👥 취약연령 인구:</strong> {row['취약연령인구'] if pd.notna(row.get('취약연령인구')) else 0:,.0f} 명</p>
-                    <p><strong>📐 동 면적:</strong> {row['면적_km2'] if pd.notna(row.get('면적_km2')) else 0:.2f} km²</p>
+                    <p><strong>📊 취약연령 밀도:</strong> {취약연령밀도:.2f} 명/km²</p>
+                    <p><strong>📈 정규화 값:</strong> {밀도_normalized:.3f}</p>
+                    <p><strong>👥 취약연령 인구:</strong> {취약연령인구:,.0f} 명</p>
+                    <p><strong>📐 동 면적:</strong> {면적_km2:.2f} km²</p>
                     <hr style="margin: 5px 0;">
                     <div style="font-size: 11px; color: #666;">
                     <p><strong>연령대별 구성:</strong></p>
-                    <p>👶 0~14세: {row['0~14세'] if pd.notna(row.get('0~14세')) else 0:,}명</p>
-                    <p>🧓 65세이상: {row['65~'] if pd.notna(row.get('65~')) else 0:,}명</p>
+                    <p>👶 0~14세: {0~14세:,}명</p>
+                    <p>🧓 65세이상: {65~:,}명</p>
                     </div>
                     </div>
-                    """,
-                    max_width=300
-                ),
-                tooltip=f"{title_text}: {row['취약연령밀도'] if pd.notna(row.get('취약연령밀도')) else 0:.0f} 명/km²"
-            ).add_to(m)
+                    """)
+        dong_merged['툴팁'] = fill_template(dong_merged, "{제목}: {취약연령밀도:.0f} 명/km²")
+        
+        # 모든 동을 하나의 GeoJson 레이어로 추가 (어두운 파란색 테두리)
+        add_choropleth(
+            m, dong_merged, '채우기색',
+            style={'color': '#1E3A8A', 'weight': 1, 'opacity': 0.7, 'fillOpacity': 0.8},
+            popup_column='팝업', tooltip_column='툴팁'
+        )
         
         # 12. 범례 추가
         print("범례 추가...")
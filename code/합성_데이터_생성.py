@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+부하 시험용 합성 입력 자료 생성
+
+저장소 dataset 폴더와 같은 구조(0_original, 1_merge_column_names 구조출동 원본,
+서울시_행정구역_경계)로 원하는 규모의 가짜 입력을 만든다. 저장소의 실제 dataset
+폴더에는 쓰지 않는다.
+
+사용법 (저장소 루트 또는 code 폴더 어디서 실행해도 동일):
+    python code/합성_데이터_생성.py /tmp/synthetic/dataset
+    python code/합성_데이터_생성.py /tmp/synthetic/dataset --dongs 3500 --dispatches 10000000 --seed 1
+"""
+import argparse
+import os
+import time
+
+from core.synthetic import CHUNK_SIZE, REAL_DISPATCHES, REAL_DONGS, generate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부하 시험용 합성 입력 자료 생성')
+    parser.add_argument('output', help='합성 dataset 폴더')
+    parser.add_argument('--dongs', type=int, default=REAL_DONGS, help='행정동 수')
+    parser.add_argument('--dispatches', type=int, default=REAL_DISPATCHES, help='구조출동 원본 건수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='구조출동 생성 묶음 크기')
+    args = parser.parse_args()
+
+    start = time.time()
+    try:
+        summary = generate(args.output, dongs=args.dongs, dispatches=args.dispatches,
+                           seed=args.seed, chunk_size=args.chunk_size)
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    elapsed = time.time() - start
+
+    print(f"\n✅ 합성 자료 생성 완료 ({elapsed:.1f}초)")
+    for name, rows in summary.items():
+        print(f"  {name}: {rows:,}")
+    total = sum(os.path.getsize(os.path.join(root, f))
+                for root, _, files in os.walk(args.output) for f in files)
+    print(f"📁 저장 위치: {args.output} ({total / 1024 / 1024:,.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
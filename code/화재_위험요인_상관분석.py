@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+위험요인 × 화재 피해 상관분석 (individual_analysis/combined_correlation_matrix.csv 생성)
+
+종합 재난 위험도의 4개 위험요인(취약연령밀도, 취약자밀도, 노후주택밀도, 구조출동밀도)을
+구 단위로 집계하여 화재발생, 인명피해와의 피어슨/스피어만 상관계수를 계산한다.
+위험요인 정의와 기존 컬럼(유의성은 점근 p값 < 0.05 기준)은 종합 위험도 가중치
+(core.scoring.DEFAULT_WEIGHTS = 인명피해 피어슨 상관계수)를 정한 원래 분석과 같고,
+구가 25개뿐이라 점근 p값이 불안정하므로 순열검정 p값과 부트스트랩 95% 신뢰구간을
+뒤에 덧붙인다.
+
+취약연령/구조출동을 구 합계 ÷ 구 면적으로 다시 정의한 분석은 사망, 부상까지 포함하여
+별도 파일(individual_analysis/area_normalized_correlation_matrix.csv)에 저장한다.
+
+사용법 (저장소 루트에서 실행):
+    python code/화재_위험요인_상관분석.py
+    python code/화재_위험요인_상관분석.py --permutations 50000 --bootstrap 50000 --workers 4
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+
+import pandas as pd
+
+from core.boundaries import load_dong_boundary
+from core.correlation import correlations, resample_tests
+from core.indicators import load_dong_indicators
+from core.regions import GU_KEY, attach_codes
+from core.storage import read_table
+
+OUTPUT_FILE = 'individual_analysis/combined_correlation_matrix.csv'
+AREA_OUTPUT_FILE = 'individual_analysis/area_normalized_correlation_matrix.csv'
+FIRE_FILE = 'dataset/2_filtering/화재발생+현황_20250710140523_구별데이터.csv'
+
+# (컬럼, 한글명, 영문명)
+FACTORS = [
+    ('취약연령밀도', '취약연령밀도', 'VulnAge'),
+    ('취약자밀도', '취약자밀도', 'VulnPop'),
+    ('housing_density', '노후주택밀도', 'OldHouse'),
+    ('구조출동밀도', '구조출동밀도', 'Rescue')
+]
+TARGETS = [
+    ('2024_발생(건)_소계', 'Fire Incidents'),
+    ('2024_인명피해(명)_소계', 'Fire Casualties')
+]
+# 면적 기준 위험요인 분석은 사망/부상도 대상으로 함
+AREA_TARGETS = TARGETS + [
+    ('2024_사망(명)_소계', 'Fire Deaths'),
+    ('2024_부상(명)_소계', 'Fire Injuries')
+]
+
+
+def strength(r):
+    """
+    상관계수 절댓값 기준 강도 (0.5 이상 Strong, 0.3 이상 Medium)
+    """
+    r = abs(r)
+    if r >= 0.5:
+        return 'Strong'
+    if r >= 0.3:
+        return 'Medium'
+    return 'Weak'
+
+
+def load_dong():
+    # 지표 처리 과정 출력은 생략
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_dong_indicators(load_dong_boundary())
+
+
+def load_gu_factors(dong):
+    """
+    구별 위험요인 (구코드, 구명 + FACTORS 컬럼) - 원래 분석의 정의
+
+    취약자밀도, 노후주택밀도는 원래 구 단위 값이고, 취약연령밀도는 동 취약연령밀도의
+    구 평균, 구조출동밀도는 구 구조출동건수 합계 ÷ 구의 동 수(동 평균 출동 건수)이다.
+    """
+    by_gu = dong.groupby(GU_KEY)
+    gu = pd.DataFrame({
+        '구명': by_gu['구명'].first(),
+        '취약연령밀도': by_gu['취약연령밀도'].mean(),
+        '취약자밀도': by_gu['취약자밀도'].first(),
+        'housing_density': by_gu['housing_density'].first(),
+        '구조출동밀도': by_gu['구조출동건수'].sum() / by_gu.size()
+    })
+    # 순열검정/부트스트랩 난수열이 행 순서에 의존하므로 구명 순으로 정렬
+    return gu.dropna().sort_values('구명').reset_index()
+
+
+def load_gu_area_factors(dong):
+    """
+    면적 기준 구별 위험요인 (구코드, 구명 + FACTORS 컬럼)
+
+    취약연령/구조출동을 구 합계 ÷ 구 면적(면적 데이터의 '소계' 행)으로 다시 정의한다.
+    취약자밀도, 노후주택밀도는 load_gu_factors()와 같다.
+    """
+    area_df = read_table('dataset/4_select_feature/서울시_행정구역(동별)_면적.csv')
+    gu_area = attach_codes(area_df[area_df['동명'] == '소계'], '구명', label='구별 면적')
+    gu_area = gu_area.set_index(GU_KEY)['면적_km2']
+
+    population_df = read_table('dataset/4_select_feature/서울시_등록인구_2025_1분기_동별_최종.csv')
+    population_df = attach_codes(population_df, '구', label='동별 등록인구')
+    vulnerable_age = (population_df['0~14세'] + population_df['65~']).groupby(population_df[GU_KEY]).sum()
+
+    by_gu = dong.groupby(GU_KEY)
+    gu = pd.DataFrame({
+        '구명': by_gu['구명'].first(),
+        '취약연령밀도': vulnerable_age / gu_area,
+        '취약자밀도': by_gu['취약자밀도'].first(),
+        'housing_density': by_gu['housing_density'].first(),
+        '구조출동밀도': by_gu['구조출동건수'].sum() / gu_area
+    })
+    gu.index.name = GU_KEY
+    return gu.dropna().sort_values('구명').reset_index()
+
+
+def analyze(factors, fire_df, targets, args):
+    """
+    구별 위험요인 × 대상변수 상관분석 결과 데이터프레임 (대상변수별로 위험요인 나열)
+    """
+    target_columns = [column for column, _ in targets]
+    data = pd.merge(factors, fire_df[[GU_KEY] + target_columns], on=GU_KEY, how='inner')
+    data[target_columns] = data[target_columns].fillna(0)
+    print(f"✅ 분석 대상: {len(data)}개 구")
+
+    x = data[[column for column, _, _ in FACTORS]].to_numpy(dtype=float)
+    y = data[target_columns].to_numpy(dtype=float)
+
+    # 1. 상관계수 + 점근 p값
+    observed = correlations(x, y)
+
+    # 2. 순열검정 + 부트스트랩 신뢰구간
+    start = time.time()
+    resampled = resample_tests(x, y, n_permutations=args.permutations, n_bootstrap=args.bootstrap,
+                               seed=args.seed, workers=args.workers)
+    print(f"✅ 순열 {args.permutations:,}회 + 부트스트랩 {args.bootstrap:,}회 완료 "
+          f"({time.time() - start:.2f}초)")
+
+    # 3. 결과 정리 (기존 컬럼 뒤에 재표본 검정 컬럼)
+    rows = []
+    for j, (_, target_name) in enumerate(targets):
+        for i, (_, factor_name, factor_english) in enumerate(FACTORS):
+            rows.append({
+                '위험요인': factor_name,
+                '위험요인_영어': factor_english,
+                '피어슨_상관계수': observed['pearson_r'][i, j],
+                '피어슨_p값': observed['pearson_p'][i, j],
+                '스피어만_상관계수': observed['spearman_r'][i, j],
+                '스피어만_p값': observed['spearman_p'][i, j],
+                '유의성': 'Significant' if observed['pearson_p'][i, j] < 0.05 else 'Non-significant',
+                '강도': strength(observed['pearson_r'][i, j]),
+                '대상변수': target_name,
+                '피어슨_순열_p값': resampled['pearson_perm_p'][i, j],
+                '피어슨_CI_하한': resampled['pearson_ci_low'][i, j],
+                '피어슨_CI_상한': resampled['pearson_ci_high'][i, j],
+                '스피어만_순열_p값': resampled['spearman_perm_p'][i, j],
+                '스피어만_CI_하한': resampled['spearman_ci_low'][i, j],
+                '스피어만_CI_상한': resampled['spearman_ci_high'][i, j]
+            })
+    return pd.DataFrame(rows)
+
+
+def save(result, path):
+    print("\n🔍 상관분석 결과 (피어슨 r [95% CI], 순열 p):")
+    for _, row in result.iterrows():
+        mark = '⭐' if row['유의성'] == 'Significant' else '  '
+        print(f"{mark} {row['대상변수']:<16} {row['위험요인']:<8} r={row['피어슨_상관계수']:+.3f} "
+              f"[{row['피어슨_CI_하한']:+.3f}, {row['피어슨_CI_상한']:+.3f}] "
+              f"p={row['피어슨_순열_p값']:.4f} (점근 {row['피어슨_p값']:.4f})")
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    result.to_csv(path, index=False, encoding='utf-8')
+    print(f"\n📁 저장 위치: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='위험요인 × 화재 피해 상관분석')
+    parser.add_argument('--permutations', type=int, default=20000, help='순열검정 재표본 수')
+    parser.add_argument('--bootstrap', type=int, default=20000, help='부트스트랩 재표본 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--workers', type=int, default=None, help='작업 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='결과 CSV 경로')
+    parser.add_argument('--area-output', default=AREA_OUTPUT_FILE, help='면적 기준 위험요인 결과 CSV 경로')
+    args = parser.parse_args()
+
+    print("📊 위험요인 × 화재 피해 상관분석 시작...")
+    dong = load_dong()
+    fire_df = read_table(FIRE_FILE)
+    fire_df = attach_codes(fire_df, '동별(2)', label='화재발생 현황')
+
+    # 1. 원래 위험요인 정의 (기존 결과 파일)
+    save(analyze(load_gu_factors(dong), fire_df, TARGETS, args), args.output)
+
+    # 2. 면적 기준 위험요인 정의 (별도 파일)
+    print("\n📊 면적 기준 위험요인 상관분석...")
+    save(analyze(load_gu_area_factors(dong), fire_df, AREA_TARGETS, args), args.area_output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
-import geopandas as gpd
 import folium
-import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 import warnings
+from core.boundaries import load_boundaries
+from core.choropleth import add_choropleth, classify_colors, fill_template
+from core.regions import GU_KEY, attach_codes, report_unmatched
+from core.scoring import minmax
+from core.storage import read_table
 warnings.filterwarnings('ignore')
 
+SUBTOTAL_COLUMNS = ['2024_인명피해(명)_소계', '2024_발생(건)_소계', '2024_사망(명)_소계', '2024_부상(명)_소계']
+
 def create_fire_casualty_heatmap():
     """
     구별 화재 인명피해 소계 히트맵 생성
@@ -17,33 +20,15 @@ def create_fire_casualty_heatmap():
         # 1. 데이터 로드
         print("\n📂 데이터 로딩 중...")
         
-        # 구 경계 데이터
-        gu_boundary = gpd.read_file('../dataset/서울시_행정구역_경계/서울시_구경계.shp', encoding='cp949')
-        gu_boundary = gu_boundary.to_crs('EPSG:4326')
-        gu_boundary['구명'] = gu_boundary['SGG_NM'].str.replace('서울특별시 ', '')
+        # 구/동 경계 데이터 (지도 확대 수준 11에 맞게 단순화된 캐시 사용)
+        gu_boundary, dong_boundary = load_boundaries(zoom=11)
         print(f"✅ 구 경계 데이터: {len(gu_boundary)}개 구")
-        
-        # 동 경계 데이터
-        dong_boundary = gpd.read_file('../dataset/서울시_행정구역_경계/서울시_동경계.shp', encoding='cp949')
-        dong_boundary = dong_boundary.to_crs('EPSG:4326')
-        
-        # 구 매핑을 위한 코드
-        gu_code_mapping = {
-            '11010': '종로구', '11020': '중구', '11030': '용산구', '11040': '성동구',
-            '11050': '광진구', '11060': '동대문구', '11070': '중랑구', '11080': '성북구',
-            '11090': '강북구', '11100': '도봉구', '11110': '노원구', '11120': '은평구',
-            '11130': '서대문구', '11140': '마포구', '11150': '양천구', '11160': '강서구',
-            '11170': '구로구', '11180': '금천구', '11190': '영등포구', '11200': '동작구',
-            '11210': '관악구', '11220': '서초구', '11230': '강남구', '11240': '송파구',
-            '11250': '강동구'
-        }
-        dong_boundary['구코드'] = dong_boundary['ADM_CD'].str[:5]
-        dong_boundary['구명'] = dong_boundary['구코드'].map(gu_code_mapping)
-        dong_boundary['동명'] = dong_boundary['ADM_NM']
         print(f"✅ 동 경계 데이터: {len(dong_boundary)}개 동")
         
         # 화재발생 현황 데이터
-        fire_df = pd.read_csv('../dataset/2_filtering/화재발생+현황_20250710140523_구별데이터.csv', encoding='utf-8-sig')
+        # 소계 컬럼은 read_table()이 숫자('-', 빈 값은 0)로 보장 (해석할 수 없는 값이면 오류)
+        fire_df = read_table('../dataset/2_filtering/화재발생+현황_20250710140523_구별데이터.csv',
+                             numeric=SUBTOTAL_COLUMNS)
         print(f"✅ 화재발생 현황 데이터: {len(fire_df)}개 구")
         print("화재발생 현황 데이터 컬럼:")
         print(fire_df.columns.tolist())
@@ -53,26 +38,20 @@ def create_fire_casualty_heatmap():
         # 2. 데이터 전처리
         print("\n🔧 데이터 전처리 중...")
         
-        # 구명 정리 (동별(2) 컬럼을 구명으로 사용)
+        # 구명 정리 (동별(2) 컬럼을 구명으로 사용) 및 구코드 부여
         fire_df['구명'] = fire_df['동별(2)'].str.strip()
+        fire_df = attach_codes(fire_df, '구명', label='화재발생 현황')
         fire_df['인명피해_소계'] = fire_df['2024_인명피해(명)_소계']
         fire_df['화재발생_소계'] = fire_df['2024_발생(건)_소계']
         fire_df['사망자_소계'] = fire_df['2024_사망(명)_소계']
         fire_df['부상자_소계'] = fire_df['2024_부상(명)_소계']
         
-        # 숫자형 변환 (빈 문자열이나 '-' 처리)
-        fire_df['인명피해_소계'] = pd.to_numeric(fire_df['인명피해_소계'].replace(['-', ''], 0), errors='coerce').fillna(0)
-        fire_df['화재발생_소계'] = pd.to_numeric(fire_df['화재발생_소계'].replace(['-', ''], 0), errors='coerce').fillna(0)
-        fire_df['사망자_소계'] = pd.to_numeric(fire_df['사망자_소계'].replace(['-', ''], 0), errors='coerce').fillna(0)
-        fire_df['부상자_소계'] = pd.to_numeric(fire_df['부상자_소계'].replace(['-', ''], 0), errors='coerce').fillna(0)
-        
         print("인명피해 상위 10개 구:")
         print(fire_df.nlargest(10, '인명피해_소계')[['구명', '인명피해_소계', '사망자_소계', '부상자_소계', '화재발생_소계']])
         
         # 3. Min-Max Scaling
         print("\n⚖️ Min-Max Scaling 적용 중...")
-        scaler = MinMaxScaler()
-        fire_df['casualty_normalized'] = scaler.fit_transform(fire_df[['인명피해_소계']]).flatten()
+        fire_df['casualty_normalized'] = minmax(fire_df[['인명피해_소계']])[:, 0]
         
         print(f"정규화 결과:")
         print(f"원본 인명피해 범위: {fire_df['인명피해_소계'].min():.0f} ~ {fire_df['인명피해_소계'].max():.0f}명")
@@ -81,9 +60,9 @@ def create_fire_casualty_heatmap():
         # 4. 경계 데이터와 병합
         print("\n🗺️ 지도 데이터 병합 중...")
         
-        # 구명이 이미 "종로구", "중구" 형태이므로 직접 매핑
-        gu_merged = gu_boundary.merge(fire_df, left_on='구명', right_on='구명', how='left')
+        gu_merged = gu_boundary.merge(fire_df.drop(columns='구명'), on=GU_KEY, how='left')
         print(f"지도 데이터 병합 결과: {len(gu_merged)}개 구")
+        report_unmatched(gu_merged, '인명피해_소계', '화재 인명피해')
         
         # 5. 서울시 중심 좌표 계산
         bounds = gu_boundary.total_bounds
@@ -91,23 +70,15 @@ def create_fire_casualty_heatmap():
         center_lon = (bounds[0] + bounds[2]) / 2
         print(f"📍 서울시 중심좌표: 위도 {center_lat:.4f}, 경도 {center_lon:.4f}")
         
-        # 6. 색상 함수 정의
-        def get_color(value):
-            """정규화된 값에 따른 색상 반환"""
-            if pd.isna(value):
-                return '#CCCCCC'  # 회색 (데이터 없음)
-            
-            # 0-1 범위의 값을 색상으로 변환 (빨간색 계열)
-            if value <= 0.2:
-                return '#FFF0F0'  # 매우 연한 분홍
-            elif value <= 0.4:
-                return '#FFB3B3'  # 연한 분홍
-            elif value <= 0.6:
-                return '#FF6666'  # 분홍
-            elif value <= 0.8:
-                return '#FF3333'  # 빨간색
-            else:
-                return '#CC0000'  # 진한 빨간색
+        # 6. 색상 팔레트 정의 (빨간색 계열, 0.2 간격 구간)
+        palette = [
+            '#FFF0F0',  # 매우 연한 분홍
+            '#FFB3B3',  # 연한 분홍
+            '#FF6666',  # 분홍
+            '#FF3333',  # 빨간색
+            '#CC0000'   # 진한 빨간색
+        ]
+        nodata_color = '#CCCCCC'  # 회색 (데이터 없음)
         
         # 7. Folium 지도 생성
         print("\n🗺️ 인터랙티브 지도 생성 중...")
@@ -137,33 +108,19 @@ def create_fire_casualty_heatmap():
         # 9. 구별 화재 인명피해 히트맵 추가
         print("구별 화재 인명피해 히트맵 추가...")
         
-        for idx, row in gu_merged.iterrows():
-            casualty_normalized = row.get('casualty_normalized', np.nan)
-            fill_color = get_color(casualty_normalized)
-            
-            # 구 경계에 색상 적용
-            folium.GeoJson(
-                row.geometry,
-                style_function=lambda x, color=fill_color: {
-                    'fillColor': color,
-                    'color': '#2C3E50',
-                    'weight': 2,
-                    'opacity': 0.8,
-                    'fillOpacity': 0.7
-                },
-                popup=folium.Popup(
-                    f"""
+        gu_merged['채우기색'] = classify_colors(gu_merged['casualty_normalized'], palette, nodata_color)
+        gu_merged['팝업'] = fill_template(gu_merged, """
                     <div style="font-family: Arial; padding: 15px; width: 280px; background: linear-gradient(135deg, #fff, #f8f9fa); border-radius: 10px;">
-                        <h4 style="margin: 0 0 10px 0; color: #DC143C; text-align: center;">🔥 {row.get('구명', 'N/A')}</h4>
+                        <h4 style="margin: 0 0 10px 0; color: #DC143C; text-align: center;">🔥 {구명}</h4>
                         <hr style="margin: 10px 0; border: none; height: 1px; background: linear-gradient(90deg, transparent, #DC143C, transparent);">
                         
                         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin: 10px 0;">
                             <div style="background: #FFE5E5; padding: 8px; border-radius: 5px; text-align: center;">
-                                <div style="font-size: 18px; font-weight: bold; color: #DC143C;">{row.get('인명피해_소계', 0):.0f}</div>
+                                <div style="font-size: 18px; font-weight: bold; color: #DC143C;">{인명피해_소계:.0f}</div>
                                 <div style="font-size: 11px; color: #666;">총 인명피해</div>
                             </div>
                             <div style="background: #F0F0F0; padding: 8px; border-radius: 5px; text-align: center;">
-                                <div style="font-size: 18px; font-weight: bold; color: #2C3E50;">{row.get('화재발생_소계', 0):.0f}</div>
+                                <div style="font-size: 18px; font-weight: bold; color: #2C3E50;">{화재발생_소계:.0f}</div>
                                 <div style="font-size: 11px; color: #666;">총 화재발생</div>
                             </div>
                         </div>
@@ -171,11 +128,11 @@ def create_fire_casualty_heatmap():
                         <div style="margin: 10px 0;">
                             <div style="display: flex; justify-content: space-between; margin: 5px 0; padding: 5px; background: #FFF5F5; border-radius: 3px;">
                                 <span style="font-size: 12px; color: #666;">사망자:</span>
-                                <span style="font-weight: bold; color: #DC143C;">{row.get('사망자_소계', 0):.0f}명</span>
+                                <span style="font-weight: bold; color: #DC143C;">{사망자_소계:.0f}명</span>
                             </div>
                             <div style="display: flex; justify-content: space-between; margin: 5px 0; padding: 5px; background: #FFF5F5; border-radius: 3px;">
                                 <span style="font-size: 12px; color: #666;">부상자:</span>
-                                <span style="font-weight: bold; color: #DC143C;">{row.get('부상자_소계', 0):.0f}명</span>
+                                <span style="font-weight: bold; color: #DC143C;">{부상자_소계:.0f}명</span>
                             </div>
                         </div>
                         
@@ -183,7 +140,7 @@ def create_fire_casualty_heatmap():
                         
                         <div style="text-align: center;">
                             <div style="font-size: 11px; color: #666; margin: 3px 0;">정규화 점수</div>
-                            <div style="font-size: 14px; font-weight: bold; color: #DC143C;">{row.get('casualty_normalized', 0):.3f}</div>
+                            <div style="font-size: 14px; font-weight: bold; color: #DC143C;">{casualty_normalized:.3f}</div>
                         </div>
                         
                         <div style="margin-top: 10px; padding: 8px; background: #F8F9FA; border-radius: 5px; text-align: center;">
@@ -193,11 +150,15 @@ def create_fire_casualty_heatmap():
                             </div>
                         </div>
                     </div>
-                    """,
-                    max_width=320
-                ),
-                tooltip=f"{row.get('구명', 'N/A')}: 인명피해 {row.get('인명피해_소계', 0):.0f}명"
-            ).add_to(m)
+                    """)
+        gu_merged['툴팁'] = fill_template(gu_merged, "{구명}: 인명피해 {인명피해_소계:.0f}명")
+        
+        # 모든 구를 하나의 GeoJson 레이어로 추가
+        add_choropleth(
+            m, gu_merged, '채우기색',
+            style={'color': '#2C3E50', 'weight': 2, 'opacity': 0.8, 'fillOpacity': 0.7},
+            popup_column='팝업', tooltip_column='툴팁', max_width=320
+        )
         
         # 10. 범례 추가
         print("범례 추가...")